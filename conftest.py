@@ -1,13 +1,16 @@
 import os
+from typing import AsyncGenerator
 
 from pytest import fixture
+from pytest_asyncio import fixture as async_fixture
 
 from python_notion_api.async_api.api import AsyncNotionAPI
 
 
-@fixture
-def async_api() -> AsyncNotionAPI:
-    return AsyncNotionAPI(access_token=os.environ["NOTION_TOKEN"])
+@async_fixture
+async def async_api() -> AsyncGenerator[AsyncNotionAPI, None]:
+    async with AsyncNotionAPI(access_token=os.environ["NOTION_TOKEN"]) as api:
+        yield api
 
 
 @fixture
@@ -1,18 +1,41 @@
 import asyncio
 import json
-from math import floor
-from typing import Any, Dict, Generator, Literal, Optional, Type
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+)
 
 import aiohttp
-from aiolimiter import AsyncLimiter
 from loguru import logger
 
 from python_notion_api.async_api.notion_block import NotionBlock
 from python_notion_api.async_api.notion_database import NotionDatabase
 from python_notion_api.async_api.notion_page import NotionPage
+from python_notion_api.async_api.rate_limiter import AdaptiveLimiter
 from python_notion_api.async_api.retry_strategy import RetryStrategy
-from python_notion_api.models.objects import NotionObjectBase, User
+from python_notion_api.async_api.utils import gather_limited, prefetch_pages
+from python_notion_api.models.objects import (
+    Block,
+    NotionObjectBase,
+    Pagination,
+    User,
+)
 from python_notion_api.models.properties import NotionObject
+from python_notion_api.utils import (
+    BlockPath,
+    PageSizeController,
+    TTLCache,
+    split_blocks,
+)
 
 NotionObjectGenerator = Generator[NotionObject, None, None]
 
@@ -27,17 +50,45 @@ class AsyncNotionAPI:
     Args:
         access_token: Notion access token
         api_version: Version of the notion API
+        page_limit: Maximum number of results per request.
         rate_limit: (number_of_requests, number of seconds). Default
         is set at the rate limit of Notion (3 per second), with a longer
-        interval to allow bursts.
+        interval to allow bursts. The rate is lowered for all requests
+        whenever Notion responds with 429, and slowly recovers afterwards.
+        pool_size: Maximum number of simultaneous connections.
+        pool_size_per_host: Maximum number of simultaneous connections to
+            the same host, 0 for no limit.
+        keepalive_timeout: Number of seconds an idle connection is kept
+            open for reuse.
+        dns_cache_ttl: Number of seconds resolved host addresses are cached
+            for.
+        coalesce_requests: Whether concurrent identical GET requests should
+            share a single request and its result.
+        database_cache_ttl: Number of seconds databases fetched with
+            `get_database`, including the parent databases of pages, are
+            cached for. `None` caches them until invalidated, `0` disables
+            the cache.
+
+    The client keeps a single HTTP session with a pool of keep-alive
+    connections, which is opened on the first request. Use the client as
+    an async context manager, or call `aclose`, to release the connections:
+
+        async with AsyncNotionAPI(access_token=...) as api:
+            page = await api.get_page(page_id=...)
     """
 
     def __init__(
         self,
         access_token: str,
         api_version: str = "2022-06-28",
-        page_limit: int = 20,
+        page_limit: int = 100,
         rate_limit: tuple[int, int] = (500, 200),
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
+        coalesce_requests: bool = True,
+        database_cache_ttl: Optional[float] = 300,
     ):
         self._access_token = access_token
         self._base_url = "https://api.notion.com/v1/"
@@ -48,7 +99,48 @@ class AsyncNotionAPI:
             status_forcelist=[429, 500, 502, 503, 504, 409],
         )
         self._page_limit = page_limit
-        self.limiter = AsyncLimiter(*rate_limit)
+        self.limiter = AdaptiveLimiter(*rate_limit)
+
+        self._pool_size = pool_size
+        self._pool_size_per_host = pool_size_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self._coalesce_requests = coalesce_requests
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Number of callers waiting for each shared request
+        self._waiters: Dict[asyncio.Future, int] = {}
+
+        self._database_cache = TTLCache(ttl=database_cache_ttl)
+
+    async def __aenter__(self) -> "AsyncNotionAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Closes the HTTP session and all pooled connections.
+
+        A new session will be opened if the client is used again.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Gets the HTTP session, opening it if needed."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_size_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
 
     @property
     def request_headers(self):
@@ -60,22 +152,48 @@ class AsyncNotionAPI:
             "Accept": "application/json",
         }
 
-    async def get_database(self, database_id: str) -> NotionDatabase:
+    async def get_database(
+        self, database_id: str, cache: bool = True
+    ) -> NotionDatabase:
         """Gets Notion database.
 
         Args:
             database_id: Id of the database to fetch.
+            cache: If `True`, returns the cached database if it has been
+                fetched before. Use `False` to force a new API call.
 
         Returns:
             A Notion database with the given id.
         """
+        cache_key = database_id.replace("-", "")
+
+        if cache:
+            database = self._database_cache.get(cache_key)
+            if database is not None:
+                return database
+
         database = NotionDatabase(self, database_id)
         await database.reload()
+        self._database_cache.set(cache_key, database)
 
         return database
 
+    def invalidate_database(self, database_id: Optional[str] = None):
+        """Removes a database from the cache.
+
+        Args:
+            database_id: Id of the database to remove. If `None`, removes
+                all databases.
+        """
+        self._database_cache.invalidate(
+            database_id.replace("-", "") if database_id is not None else None
+        )
+
     async def get_page(
-        self, page_id: str, page_cast: type[NotionPage] = NotionPage
+        self,
+        page_id: str,
+        page_cast: type[NotionPage] = NotionPage,
+        properties: Optional[list[str]] = None,
     ) -> NotionPage:
         """Gets Notion page.
 
@@ -83,11 +201,13 @@ class AsyncNotionAPI:
             page_id: Id of the database to fetch.
             page_cast: A subclass of a NotionPage. Allows custom
                 property retrieval.
+            properties: Ids of the properties to retrieve. If `None`,
+                retrieves all properties.
         Returns:
             A Notion page with the given id.
         """
         page = page_cast(api=self, page_id=page_id)
-        await page.reload()
+        await page.reload(properties=properties)
 
         return page
 
@@ -119,14 +239,20 @@ class AsyncNotionAPI:
             url: URL for the request.
             request_type: Type of the http request to make.
             data: Data to pass to the request.
-            params: Params to pass to the request.
+            params: Params to pass to the request. List values are sent
+                as repeated params.
         """
+        query = [
+            (key, item)
+            for key, value in params.items()
+            for item in (value if isinstance(value, list) else [value])
+        ]
         async with self.limiter:
             return await session.request(
                 method=request_type,
                 url=url,
                 headers=self.request_headers,
-                params=params,
+                params=query,
                 data=data,
             )
 
@@ -136,7 +262,7 @@ class AsyncNotionAPI:
         endpoint: str = "",
         params: Dict[str, Any] = {},
         data: Optional[str] = None,
-        cast_cls: Type[NotionObjectBase] = NotionObject,
+        cast_cls: Optional[Type[NotionObjectBase]] = NotionObject,
         retry_strategy: Optional[RetryStrategy] = None,
     ) -> NotionObject:
         """Main request handler.
@@ -151,7 +277,7 @@ class AsyncNotionAPI:
             data: Data to pass to the request.
             params: Params to pass to the request.
             cast_cls: A NotionObjectBase class to auto-cast the response of the
-                request to.
+                request to. If `None`, the decoded JSON is returned as is.
         """
         retry_strategy = retry_strategy or self._default_retry_strategy
 
@@ -161,47 +287,54 @@ class AsyncNotionAPI:
 
         response = None
 
-        async with aiohttp.ClientSession() as session:
-            for i in range(retry_strategy.total):
-                response = await self._request_attempt(
-                    request_type=request_type,
-                    session=session,
-                    url=url,
-                    params=params,
-                    data=data,
-                )
+        session = self.session
 
-                response_data = await response.read()
-                decoded_data = response_data.decode("utf-8")
+        for i in range(retry_strategy.total):
+            response = await self._request_attempt(
+                request_type=request_type,
+                session=session,
+                url=url,
+                params=params,
+                data=data,
+            )
 
-                if response.status == 200:
-                    return cast_cls.from_obj(json.loads(decoded_data))
+            response_data = await response.read()
+            decoded_data = response_data.decode("utf-8")
 
-                elif response.status not in retry_strategy.status_forcelist:
-                    logger.error(
-                        f"Request to {url} failed:"
-                        f"\n{response.status}\n{decoded_data}"
-                    )
-                    raise Exception("Request failed")
+            if response.status == 200:
+                self.limiter.recover()
+                if cast_cls is None:
+                    return json.loads(decoded_data)
+                return cast_cls.from_obj(json.loads(decoded_data))
 
-                if response.status == 429:
-                    delay = int(response.headers["Retry-After"])
-                    logger.warning(
-                        f"Request to {url} failed:"
-                        f"\n{response.status}"
-                        f"\nRetry-After: {delay}"
-                        f"\n{decoded_data}"
-                    )
-                else:
-                    delay = min(
-                        retry_strategy.backoff_factor * (2 ** (i)),
-                        retry_strategy.max_backoff,
-                    )
+            elif response.status not in retry_strategy.status_forcelist:
+                logger.error(
+                    f"Request to {url} failed:"
+                    f"\n{response.status}\n{decoded_data}"
+                )
+                raise Exception("Request failed")
 
+            if response.status == 429:
+                delay = int(response.headers["Retry-After"])
                 logger.warning(
-                    f"Notion is busy ({response.status})."
-                    f"Retrying ({i+1}) in {delay}s"
+                    f"Request to {url} failed:"
+                    f"\n{response.status}"
+                    f"\nRetry-After: {delay}"
+                    f"\n{decoded_data}"
                 )
+                # Pauses all requests, so the retry waits in the limiter.
+                self.limiter.backoff(delay)
+            else:
+                delay = min(
+                    retry_strategy.backoff_factor * (2 ** (i)),
+                    retry_strategy.max_backoff,
+                )
+
+            logger.warning(
+                f"Notion is busy ({response.status})."
+                f"Retrying ({i+1}) in {delay}s"
+            )
+            if response.status != 429:
                 await asyncio.sleep(delay)
 
         logger.warning(
@@ -213,8 +346,9 @@ class AsyncNotionAPI:
         self,
         endpoint: str,
         data: Optional[str] = None,
-        cast_cls: Type[NotionObjectBase] = NotionObject,
+        cast_cls: Optional[Type[NotionObjectBase]] = NotionObject,
         retry_strategy: Any = None,
+        params: Dict[str, Any] = {},
     ) -> NotionObject:
         """Wrapper for post requests.
 
@@ -225,11 +359,13 @@ class AsyncNotionAPI:
                 notion API base url.
             data: Data to pass to the request.
             cast_cls: A NotionObjectBase class to auto-cast the response of the
-                request to.
+                request to. If `None`, the decoded JSON is returned as is.
+            params: Params to pass to the request.
         """
         return await self._request(
             request_type="post",
             endpoint=endpoint,
+            params=params,
             data=data,
             cast_cls=cast_cls,
             retry_strategy=retry_strategy,
@@ -241,10 +377,14 @@ class AsyncNotionAPI:
         params: Dict[str, str] = {},
         cast_cls: Type[NotionObjectBase] = NotionObject,
     ) -> NotionObject:
-        """Wrapper for post requests.
+        """Wrapper for get requests.
 
         Should not be called directly, for internal use only.
 
+        Concurrent calls with the same arguments share one request, and
+        get the same decoded object. The request is cancelled once every
+        caller waiting for it is cancelled.
+
         Args:
             endpoint: Endpoint of the request. Will be prepened with the
                 notion API base url.
@@ -252,13 +392,53 @@ class AsyncNotionAPI:
             cast_cls: A NotionObjectBase class to auto-cast the response of the
                 request to.
         """
-        return await self._request(
-            request_type="get",
-            endpoint=endpoint,
-            params=params,
-            cast_cls=cast_cls,
+        if not self._coalesce_requests:
+            return await self._request(
+                request_type="get",
+                endpoint=endpoint,
+                params=params,
+                cast_cls=cast_cls,
+            )
+
+        key = json.dumps(
+            [endpoint, params, cast_cls.__module__, cast_cls.__qualname__],
+            sort_keys=True,
         )
 
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._request(
+                    request_type="get",
+                    endpoint=endpoint,
+                    params=dict(params),
+                    cast_cls=cast_cls,
+                )
+            )
+            self._inflight[key] = future
+
+            def forget(future: asyncio.Future):
+                self._inflight.pop(key, None)
+                # Marks the exception as retrieved, in case every caller
+                # was cancelled before the request failed
+                if not future.cancelled():
+                    future.exception()
+
+            future.add_done_callback(forget)
+
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            # Shielded, so that a cancelled caller doesn't cancel the
+            # request for everyone else waiting on it.
+            return await asyncio.shield(future)
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+                if future.cancel():
+                    # Nobody waits for the request anymore
+                    await asyncio.wait([future])
+
     async def _patch(
         self,
         endpoint: str,
@@ -286,103 +466,222 @@ class AsyncNotionAPI:
             cast_cls=cast_cls,
         )
 
-    async def _post_iterate(
+    async def _append_blocks(
+        self, block_id: str, blocks: List[Dict], concurrency: int = 10
+    ) -> List[Block]:
+        """Appends blocks to a page or a block.
+
+        Should not be called directly, for internal use only.
+
+        Blocks are split into requests accepted by Notion with
+        `split_blocks`. Children that can't be sent with their parent are
+        appended once the parent is created, one level of nesting at a
+        time, concurrently for the parents of each level.
+
+        Args:
+            block_id: Id of the page or block to append the blocks to.
+            blocks: Blocks to append, as dictionaries accepted by Notion.
+            concurrency: Maximum number of parents children are appended
+                to at the same time.
+
+        Returns:
+            The appended blocks.
+        """
+        results, deferred = await self._append_children(block_id, blocks)
+        while deferred:
+            appended = await gather_limited(
+                lambda item: self._append_children(*item),
+                deferred,
+                concurrency,
+            )
+            deferred = [item for _, more in appended for item in more]
+        return results
+
+    async def _append_children(
+        self, block_id: str, blocks: List[Dict]
+    ) -> Tuple[List[Block], List[Tuple[str, List[Dict]]]]:
+        """Appends blocks to a page or a block, without the children that
+        can't be sent with them.
+
+        Should not be called directly, for internal use only.
+
+        Args:
+            block_id: Id of the page or block to append the blocks to.
+            blocks: Blocks to append, as dictionaries accepted by Notion.
+
+        Returns:
+            The appended blocks, and the ids of the created parents with
+            the children left to append to them.
+        """
+        results = []
+        deferred = []
+        for children, chunk_deferred in split_blocks(blocks):
+            response = await self._patch(
+                endpoint=f"blocks/{block_id}/children",
+                data=json.dumps({"children": children}),
+            )
+            results.extend(response.results)
+
+            # Nested blocks are not returned, so the parents of removed
+            # children below the first level are found by listing them
+            listed: Dict[BlockPath, List[Block]] = {}
+            for path, more in chunk_deferred:
+                parent = response.results[path[0]]
+                for depth in range(1, len(path)):
+                    if path[:depth] not in listed:
+                        listed[path[:depth]] = [
+                            block
+                            async for block, _ in self._get_iterate(
+                                endpoint=f"blocks/{parent.id}/children"
+                            )
+                        ]
+                    parent = listed[path[:depth]][path[depth]]
+                deferred.append((parent.id, more))
+        return results, deferred
+
+    async def _paginate(
         self,
-        endpoint: str,
-        data: Dict[str, Any] = {},
+        fetch: Callable[[Optional[str], int], Awaitable[Pagination]],
         page_limit: Optional[int] = None,
-    ) -> NotionObjectGenerator:
-        """Wrapper for post requests where expected return type is Pagination.
+        first: Optional[Pagination] = None,
+    ) -> AsyncGenerator[Pagination, None]:
+        """Fetches pages of a paginated response one after another.
 
         Should not be called directly, for internal use only.
 
         Args:
-            endpoint: Endpoint of the request. Will be prefixed with the
-                notion API base url.
-            data: Data to pass to the request.
+            fetch: Coroutine function fetching a page given the start cursor
+                and page size.
+            page_limit: Maximum number of results per page. Requests start
+                at this size, which is reduced after failed requests and
+                increased back after successful ones.
+            first: Already fetched first page. If given, it is yielded
+                first and the following pages are fetched from its cursor.
         """
         has_more = True
         cursor = None
-        page_size = page_limit or self._page_limit
-
-        while has_more:
-            data.update({"start_cursor": cursor, "page_size": page_size})
+        page_sizes = PageSizeController(page_limit or self._page_limit)
 
-            if cursor is None:
-                data.pop("start_cursor")
+        if first is not None:
+            yield first
+            has_more = first.has_more
+            cursor = first.next_cursor
 
-            while page_size > 0:
+        while has_more:
+            while True:
                 try:
-                    response = await self._post(
-                        endpoint=endpoint, data=json.dumps(data)
+                    response = await fetch(cursor, page_sizes.size)
+                    break
+                except (MaxRetryError, asyncio.TimeoutError) as e:
+                    try:
+                        page_sizes.failure()
+                    except ValueError:
+                        raise e
+                    logger.warning(
+                        "Retrying request with smaller page size"
+                        f"({page_sizes.size})"
                     )
 
-                    for item in response.results:
-                        yield item
+            page_sizes.success()
 
-                    has_more = response.has_more
-                    cursor = response.next_cursor
+            yield response
 
-                    break
-                except MaxRetryError as e:
-                    page_size = floor(page_size / 2)
-                    logger.warning(
-                        f"Retrying request with smaller page size({page_size})"
-                    )
-                    if page_size == 0:
-                        raise e
-                    data.update({"page_size": page_size})
+            if isinstance(response, dict):
+                has_more = response["has_more"]
+                cursor = response["next_cursor"]
+            else:
+                has_more = response.has_more
+                cursor = response.next_cursor
 
-    async def _get_iterate(
+        logger.debug("Page sizes used: {}", page_sizes.sizes)
+
+    async def _post_iterate(
         self,
         endpoint: str,
-        params: Dict[str, Any] = {},
+        data: Dict[str, Any] = {},
         page_limit: Optional[int] = None,
+        prefetch: int = 0,
+        params: Dict[str, Any] = {},
+        raw: bool = False,
     ) -> NotionObjectGenerator:
-        """Wrapper for get requests where expected return type is Pagination.
+        """Wrapper for post requests where expected return type is Pagination.
 
         Should not be called directly, for internal use only.
 
         Args:
-            endpoint: Endpoint of the request. Will be prepened with the
+            endpoint: Endpoint of the request. Will be prefixed with the
                 notion API base url.
+            data: Data to pass to the request.
+            page_limit: Number of results per page.
+            prefetch: Number of pages to fetch ahead of the consumer. If
+                greater than 0, the request for the next page is sent as
+                soon as the previous page arrives.
             params: Params to pass to the request.
+            raw: If `True`, yields the decoded JSON of the results instead
+                of NotionObjects.
         """
-        has_more = True
-        cursor = None
-        page_size = page_limit or self._page_limit
 
-        while has_more:
-            params.update({"start_cursor": cursor, "page_size": page_size})
+        async def fetch(cursor, page_size):
+            request_data = {**data, "page_size": page_size}
+            if cursor is not None:
+                request_data["start_cursor"] = cursor
+            return await self._post(
+                endpoint=endpoint,
+                data=json.dumps(request_data),
+                params=params,
+                cast_cls=None if raw else NotionObject,
+            )
 
-            if cursor is None:
-                params.pop("start_cursor")
+        pages = self._paginate(fetch, page_limit=page_limit)
+        if prefetch > 0:
+            pages = prefetch_pages(pages, depth=prefetch)
 
-            while page_size > 0:
-                try:
-                    response = await self._get(
-                        endpoint=endpoint, params=params
-                    )
+        async for response in pages:
+            results = response["results"] if raw else response.results
+            for item in results:
+                yield item
 
-                    if hasattr(response, "property_item"):
-                        # Required for rollups
-                        property_item = response.property_item
-                    else:
-                        # property doesn't exist for Blocks
-                        property_item = None
+    async def _get_iterate(
+        self,
+        endpoint: str,
+        params: Dict[str, Any] = {},
+        page_limit: Optional[int] = None,
+        prefetch: int = 0,
+        first: Optional[Pagination] = None,
+    ) -> NotionObjectGenerator:
+        """Wrapper for get requests where expected return type is Pagination.
 
-                    for item in response.results:
-                        yield item, property_item
+        Should not be called directly, for internal use only.
 
-                    has_more = response.has_more
-                    cursor = response.next_cursor
+        Args:
+            endpoint: Endpoint of the request. Will be prepened with the
+                notion API base url.
+            params: Params to pass to the request.
+            page_limit: Number of results per page.
+            prefetch: Number of pages to fetch ahead of the consumer. If
+                greater than 0, the request for the next page is sent as
+                soon as the previous page arrives.
+            first: Already fetched first page of the results. If given,
+                iteration continues from its cursor.
+        """
 
-                    break
-                except MaxRetryError as e:
-                    page_size = floor(page_size / 2)
-                    logger.warning(
-                        f"Retrying request with smaller page size({page_size})"
-                    )
-                    if page_size == 0:
-                        raise e
-                    params.update({"page_size": page_size})
+        async def fetch(cursor, page_size):
+            request_params = {**params, "page_size": page_size}
+            if cursor is not None:
+                request_params["start_cursor"] = cursor
+            return await self._get(endpoint=endpoint, params=request_params)
+
+        pages = self._paginate(fetch, page_limit=page_limit, first=first)
+        if prefetch > 0:
+            pages = prefetch_pages(pages, depth=prefetch)
+
+        async for response in pages:
+            if hasattr(response, "property_item"):
+                # Required for rollups
+                property_item = response.property_item
+            else:
+                # property doesn't exist for Blocks
+                property_item = None
+
+            for item in response.results:
+                yield item, property_item
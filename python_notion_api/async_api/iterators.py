@@ -1,9 +1,7 @@
 from typing import Generator
 
-from python_notion_api.models.blocks import Block
 from python_notion_api.models.common import DateObject
 from python_notion_api.models.properties import PropertyItem
-from python_notion_api.utils import get_derived_class
 
 PropertyItemGenerator = Generator[PropertyItem, None, None]
 
@@ -28,9 +26,7 @@ class AsyncPropertyItemIterator:
         return self._value
 
     async def _get_value(self):
-        prop_cls = get_derived_class(
-            PropertyItem, PropertyItem._class_map.get(self.property_type)
-        )
+        prop_cls = PropertyItem.get_class(self.property_type)
         return prop_cls(
             id=self.property_id,
             init=[
@@ -56,10 +52,10 @@ class AsyncRollupPropertyItemIterator(AsyncPropertyItemIterator):
             raise ValueError("Got an unsupported rollup. Sorry")
         elif prop_type == "array":
             return [
-                get_derived_class(
-                    PropertyItem,
-                    PropertyItem._class_map.get(item.property_type),
-                )(id=self.property_id, init=getattr(item, item.property_type))
+                PropertyItem.get_class(item.property_type)(
+                    id=self.property_id,
+                    init=getattr(item, item.property_type),
+                )
                 for item in items
             ]
         elif prop_type == "number":
@@ -92,7 +88,14 @@ class AsyncBlockIterator:
         return self
 
     async def __anext__(self):
-        next_block = await anext(self.generator)
+        if hasattr(self.generator, "__anext__"):
+            next_block = await anext(self.generator)
+        else:
+            # Blocks returned by a single request, e.g. added blocks
+            try:
+                next_block = next(self.generator)
+            except StopIteration:
+                raise StopAsyncIteration from None
         if isinstance(next_block, tuple):
             next_block = next_block[0]
-        return Block.from_obj(next_block.dict(by_alias=True))
+        return next_block
@@ -1,3 +1,4 @@
+import json
 from typing import TYPE_CHECKING, List
 
 from pydantic.v1 import BaseModel
@@ -39,24 +40,38 @@ class NotionBlock:
         """Gets the block id."""
         return self._block_id.replace("-", "")
 
-    async def get_child_blocks(self) -> AsyncBlockIterator:
+    async def get_child_blocks(self, prefetch: int = 0) -> AsyncBlockIterator:
         """Gets all children blocks.
 
+        Args:
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
+
         Returns:
             An iterator of all children blocks in the block.
         """
-        generator = await self._api._get_iterate(
-            endpoint=f"blocks/{self._block_id}/children"
+        generator = self._api._get_iterate(
+            endpoint=f"blocks/{self._block_id}/children", prefetch=prefetch
         )
         return AsyncBlockIterator(generator)
 
     async def add_child_block(
-        self, content: List[Block], reload_block: bool = False
+        self,
+        content: List[Block],
+        reload_block: bool = False,
+        concurrency: int = 10,
     ) -> AsyncBlockIterator:
         """Adds new blocks as children.
 
+        Any number of blocks can be added: they are sent in as few requests
+        as Notion accepts, and children nested too deep for a request are
+        added to their parent once it is created.
+
         Args:
             content: Content of the new block.
+            reload_block: If `True`, reloads the block afterwards.
+            concurrency: Maximum number of blocks nested children are added
+                to at the same time.
 
         Returns:
             An iterator of the newly created blocks.
@@ -68,14 +83,14 @@ class NotionBlock:
             by_alias=True, exclude_unset=True, exclude_none=True
         )
 
-        new_blocks = await self._api._patch(
-            endpoint=f"blocks/{self.block_id}/children", data=data
+        new_blocks = await self._api._append_blocks(
+            self.block_id, json.loads(data)["children"], concurrency
         )
 
         if reload_block:
             await self.reload()
 
-        return AsyncBlockIterator(iter(new_blocks.results))
+        return AsyncBlockIterator(iter(new_blocks))
 
     async def set(self, block: Block, reload_block: bool = False) -> Block:
         """Updates the content of a Block.
@@ -1,20 +1,42 @@
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import unquote
 
 from pydantic.v1 import BaseModel
 
 from python_notion_api.async_api.notion_page import NotionPage
-from python_notion_api.async_api.utils import ensure_loaded
+from python_notion_api.async_api.utils import ensure_loaded, gather_limited
+from python_notion_api.models.columns import Columns
 from python_notion_api.models.common import FileObject, ParentObject
 from python_notion_api.models.configurations import (
     NotionPropertyConfiguration,
     RelationPropertyConfiguration,
 )
-from python_notion_api.models.filters import FilterItem
-from python_notion_api.models.objects import Database
+from python_notion_api.models.extractors import (
+    KEY_TYPES,
+    RowDecoder,
+    extract_value,
+)
+from python_notion_api.models.filters import FilterItem, equals_filter
+from python_notion_api.models.objects import Database, Page
+from python_notion_api.models.rows import CompactRow, RowSchema
 from python_notion_api.models.sorts import Sort
 from python_notion_api.models.values import PropertyValue, generate_value
+from python_notion_api.utils import StringInterner
 
 if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
     from python_notion_api.async_api.api import AsyncNotionAPI
 
 
@@ -37,6 +59,8 @@ class NotionDatabase:
         self._object = None
         self._properties = None
         self._title = None
+        self._row_decoder: Optional[RowDecoder] = None
+        self._row_schema: Optional[RowSchema] = None
 
     @ensure_loaded
     def __getattr__(self, attr_key):
@@ -61,6 +85,8 @@ class NotionDatabase:
             for key, val in self._object.properties.items()
         }
         self._title = "".join(rt.plain_text for rt in self._object.title)
+        self._row_decoder = None
+        self._row_schema = None
 
     async def query(
         self,
@@ -68,7 +94,12 @@ class NotionDatabase:
         sorts: Optional[List[Sort]] = None,
         page_limit: Optional[int] = None,
         cast_cls=NotionPage,
-    ) -> AsyncGenerator[NotionPage, None]:
+        prefetch: int = 0,
+        properties: Optional[List[str]] = None,
+        raw: bool = False,
+        compact: bool = False,
+        intern: bool = False,
+    ) -> AsyncGenerator[Union[NotionPage, Dict[str, Any], CompactRow], None]:
         """Queries the database.
 
         Retrieves all pages belonging to the database that satisfy the given filters
@@ -79,11 +110,41 @@ class NotionDatabase:
             sorts: Sorts to apply to the query.
             cast_cls: A subclass of a NotionPage. Allows custom
             property retrieval.
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
+            properties: Names or ids of the properties to retrieve. If
+                `None`, retrieves all properties.
+            raw: If `True`, yields the page objects as decoded from the
+                response JSON, without validating them or wrapping them in
+                `cast_cls`. Use `extract_values` to get plain property
+                values from them.
+            compact: If `True`, yields read-only `CompactRow` objects
+                that only keep the property values, sharing one schema for
+                all rows. Use it to keep large result sets in memory.
+            intern: If `True`, equal names, ids and option values of the
+                results share one string instance, to reduce the memory of
+                large result sets kept in memory.
 
         Returns:
-            Generator of NotionPage objects.
+            Generator of NotionPage objects, of page dictionaries if
+            `raw` is `True`, or of compact rows if `compact` is `True`.
         """
         data: dict[str, Any] = {}
+        params: dict[str, Any] = {}
+
+        if properties is not None:
+            params["filter_properties"] = self._get_property_ids(properties)
+
+        schema = None
+        if compact and properties is not None:
+            schema = RowSchema(
+                self.properties,
+                names=[self._get_property_name(key) for key in properties],
+            )
+        elif compact:
+            schema = self.row_schema
+
+        interner = StringInterner() if intern else None
 
         if filters is not None:
             filters = filters.dict(by_alias=True, exclude_unset=True)
@@ -98,11 +159,62 @@ class NotionDatabase:
             endpoint=f"databases/{self._database_id}/query",
             data=data,
             page_limit=page_limit,
+            prefetch=prefetch,
+            params=params,
+            raw=raw or compact or intern,
         ):
+            if interner is not None:
+                item = interner.intern_page(item)
+
+            if schema is not None:
+                yield CompactRow.from_page(schema, item)
+                continue
+
+            if raw:
+                yield item
+                continue
+
+            if interner is not None:
+                item = Page.from_obj(item)
+
             yield cast_cls(
                 api=self._api, database=self, page_id=item.page_id, obj=item
             )
 
+    def _get_property_name(self, prop_key: str) -> str:
+        """Gets name of a property.
+
+        Args:
+            prop_key: Name or id of the property.
+        """
+        if prop_key in self.properties:
+            return prop_key
+
+        prop_name = next(
+            (
+                name
+                for name, prop in self.properties.items()
+                if prop.config_id == prop_key
+            ),
+            None,
+        )
+        if prop_name is None:
+            raise ValueError(f"Unknown property: {prop_key}")
+        return prop_name
+
+    def _get_property_ids(self, properties: List[str]) -> List[str]:
+        """Gets ids of properties, as they are passed in request params.
+
+        Args:
+            properties: Names or ids of the properties.
+        """
+        property_ids = []
+        for prop_key in properties:
+            prop = self.properties[self._get_property_name(prop_key)]
+            # Ids come url-encoded, and are encoded again in the params.
+            property_ids.append(unquote(prop.config_id))
+        return property_ids
+
     @property
     @ensure_loaded
     def title(self) -> str:
@@ -130,25 +242,105 @@ class NotionDatabase:
             if isinstance(val, RelationPropertyConfiguration)
         }
 
-    async def create_page(
+    @property
+    @ensure_loaded
+    def row_decoder(self) -> RowDecoder:
+        """Gets the decoder of page properties compiled from the property
+        configurations of the database.
+        """
+        assert self._properties is not None
+        if self._row_decoder is None:
+            self._row_decoder = RowDecoder(self._properties)
+        return self._row_decoder
+
+    @property
+    @ensure_loaded
+    def row_schema(self) -> RowSchema:
+        """Gets the schema shared by compact rows of all properties of the
+        database.
+        """
+        assert self._properties is not None
+        if self._row_schema is None:
+            self._row_schema = RowSchema(self._properties)
+        return self._row_schema
+
+    async def query_columns(
         self,
-        properties: Dict[str, Any] = {},
-        cover_url: Optional[str] = None,
-    ) -> NotionPage:
-        """Creates a new page in the Database and updates the new page with
-        the properties.
+        filters: Optional[FilterItem] = None,
+        sorts: Optional[List[Sort]] = None,
+        page_limit: Optional[int] = None,
+        prefetch: int = 0,
+        properties: Optional[List[str]] = None,
+    ) -> Columns:
+        """Queries the database and stores the property values by column.
+
+        Pages are appended to typed columns as they are retrieved, without
+        building a page object or a dictionary for each of them.
 
         Args:
-            properties: Dictionary of property names and values. Value types
-            will depend on the property type. Can be the raw value
-            (e.g. string, float) or an object (e.g. SelectValue,
-            NumberPropertyItem)
-            cover: URL of an image for the page cover.
+            filters: Filters to apply to the query.
+            sorts: Sorts to apply to the query.
+            page_limit: Number of pages per request.
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
+            properties: Names or ids of the properties to retrieve. If
+                `None`, retrieves all properties.
 
         Returns:
-            A new page.
+            Property values of the pages by column.
+        """
+        columns = Columns(
+            self.properties,
+            names=(
+                [self._get_property_name(key) for key in properties]
+                if properties is not None
+                else None
+            ),
+        )
+        async for page in self.query(
+            filters=filters,
+            sorts=sorts,
+            page_limit=page_limit,
+            prefetch=prefetch,
+            properties=properties,
+            raw=True,
+        ):
+            columns.append(page)
+        return columns
+
+    async def to_arrow(self, **kwargs) -> "pyarrow.Table":
+        """Queries the database into an Arrow table.
+
+        Requires `pyarrow`.
+
+        Args:
+            **kwargs: Arguments of `query_columns`.
+        """
+        return (await self.query_columns(**kwargs)).to_arrow()
+
+    async def to_pandas(self, **kwargs) -> "pandas.DataFrame":
+        """Queries the database into a DataFrame indexed by page ids.
+
+        Requires `pandas`.
+
+        Args:
+            **kwargs: Arguments of `query_columns`.
         """
+        return (await self.query_columns(**kwargs)).to_pandas()
+
+    def _create_page_data(
+        self, properties: Dict[str, Any], cover_url: Optional[str] = None
+    ) -> str:
+        """Validates the properties of a new page and serialises the
+        request.
+
+        Args:
+            properties: Dictionary of property names and values.
+            cover_url: URL of an image for the page cover.
 
+        Returns:
+            Data of the create page request.
+        """
         validated_properties = {}
         for prop_name, prop_value in properties.items():
             prop = self.properties.get(prop_name, None)
@@ -169,8 +361,17 @@ class NotionDatabase:
             ),
         )
 
-        data = request.json(by_alias=True, exclude_unset=True)
+        return request.json(by_alias=True, exclude_unset=True)
 
+    async def _post_page(self, data: str) -> NotionPage:
+        """Sends a create page request.
+
+        Args:
+            data: Data of the request, from `_create_page_data`.
+
+        Returns:
+            A new page.
+        """
         new_page = await self._api._post("pages", data=data)
 
         return NotionPage(
@@ -179,3 +380,271 @@ class NotionDatabase:
             obj=new_page,
             database=self,
         )
+
+    async def create_page(
+        self,
+        properties: Dict[str, Any] = {},
+        cover_url: Optional[str] = None,
+    ) -> NotionPage:
+        """Creates a new page in the Database and updates the new page with
+        the properties.
+
+        Args:
+            properties: Dictionary of property names and values. Value types
+            will depend on the property type. Can be the raw value
+            (e.g. string, float) or an object (e.g. SelectValue,
+            NumberPropertyItem)
+            cover: URL of an image for the page cover.
+
+        Returns:
+            A new page.
+        """
+        return await self._post_page(
+            self._create_page_data(properties, cover_url)
+        )
+
+    async def create_pages(
+        self, rows: Iterable[Dict[str, Any]], concurrency: int = 10
+    ) -> List[Union[NotionPage, Exception]]:
+        """Creates a new page in the Database for every row.
+
+        All rows are validated before any page is created. Pages are then
+        created concurrently, sharing the rate limiter of the client.
+
+        Args:
+            rows: Dictionaries of property names and values, as passed to
+                `create_page`.
+            concurrency: Maximum number of pages created at the same time.
+
+        Returns:
+            For every row, in the same order, either the new page or the
+            exception raised while validating the row or creating the
+            page. Rows that fail validation are not sent.
+        """
+        requests: List[Union[str, Exception]] = []
+        for properties in rows:
+            try:
+                requests.append(self._create_page_data(properties))
+            except Exception as e:
+                requests.append(e)
+
+        async def create(data: Union[str, Exception]):
+            if isinstance(data, Exception):
+                return data
+            try:
+                return await self._post_page(data)
+            except Exception as e:
+                return e
+
+        return await gather_limited(create, requests, concurrency)
+
+    async def upsert(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        key: str,
+        concurrency: int = 10,
+    ) -> List[Union[NotionPage, Exception]]:
+        """Updates or creates a page for every row.
+
+        The page of a row is found by querying the page whose `key`
+        property equals the value of `key` in the row. Existing pages are
+        updated with `only_changed=True`, so rows that match their page
+        don't send any update. Pages are created for the other rows, and
+        rows with the same key are applied in order to the same page.
+
+        Args:
+            rows: Dictionaries of property names and values, as passed to
+                `create_page`. All rows must include the key property.
+            key: Name or id of the property identifying the pages, e.g. the
+                title. Must be a title, text, email, phone number, url,
+                number, unique id, checkbox, select or status property.
+            concurrency: Maximum number of rows processed at the same time.
+
+        Returns:
+            For every row, in the same order, either the updated or created
+            page or the exception raised for the row, e.g. if several pages
+            match it.
+
+        Raises:
+            ValueError: If the key property can't identify pages.
+        """
+        rows = list(rows)
+        key_name = self._get_key_name(key)
+        key_type = self.properties[key_name].config_type
+
+        results: List[Union[NotionPage, Exception, None]] = [None] * len(rows)
+        groups = self._group_upsert_rows(rows, key, key_name, results)
+
+        async def upsert_group(group: Tuple[Any, List[int]]):
+            # Rows with the same key are applied in order to the same page
+            key_value, indices = group
+            page = None
+            for i in indices:
+                row = rows[i]
+                try:
+                    if page is None:
+                        pages = []
+                        async for match in self.query(
+                            filters=equals_filter(
+                                key_name, key_type, key_value
+                            ),
+                            page_limit=2,
+                        ):
+                            pages.append(match)
+                            if len(pages) > 1:
+                                raise ValueError(
+                                    f"Several pages with {key_name} = "
+                                    f"{key_value!r}"
+                                )
+                        if not pages:
+                            page = await self.create_page(row)
+                            results[i] = page
+                            continue
+                        page = pages[0]
+                    await page.update(row, only_changed=True)
+                    results[i] = page
+                except Exception as e:
+                    results[i] = e
+
+        await gather_limited(upsert_group, list(groups.items()), concurrency)
+        return results
+
+    def _get_key_name(self, key: str) -> str:
+        """Gets the name of the key property of an upsert.
+
+        Args:
+            key: Name or id of the key property.
+
+        Raises:
+            ValueError: If the property can't identify pages.
+        """
+        key_name = self._get_property_name(key)
+        if self.properties[key_name].config_type not in KEY_TYPES:
+            raise ValueError(
+                f"Property {key_name} can't be used as a key, only "
+                f"{', '.join(sorted(KEY_TYPES))} properties can"
+            )
+        return key_name
+
+    def _group_upsert_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        key: str,
+        key_name: str,
+        results: List[Union[NotionPage, Exception, None]],
+    ) -> Dict[Any, List[int]]:
+        """Groups the indices of the rows by key value.
+
+        Rows without a valid key value get their exception in `results`.
+        """
+        groups: Dict[Any, List[int]] = {}
+        for i, row in enumerate(rows):
+            try:
+                key_value = row[key] if key in row else row[key_name]
+                groups.setdefault(key_value, []).append(i)
+            except Exception as e:
+                results[i] = e
+        return groups
+
+    def _get_upsert_properties(
+        self, key_name: str, rows: List[Dict[str, Any]]
+    ) -> List[str]:
+        """Gets the names of the key property and of the known properties
+        of the rows.
+        """
+        properties = {key_name}
+        for row in rows:
+            for prop_key in row:
+                try:
+                    properties.add(self._get_property_name(prop_key))
+                except ValueError:
+                    # Reported when the row is created or updated
+                    pass
+        return list(properties)
+
+    async def upsert_many(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        key_property: str,
+        concurrency: int = 10,
+    ) -> List[Union[NotionPage, Exception]]:
+        """Updates or creates a page for every row, using a local index.
+
+        Unlike `upsert`, which queries the page of each key, the pages are
+        found in an index built from a single scan of the database. The
+        scan only retrieves the key property and the properties in the
+        rows, whose current values are used to only send the values that
+        changed. Pages are created for rows without a page, and rows
+        with the same key are applied in order to the same page.
+
+        Args:
+            rows: Dictionaries of property names and values, as passed to
+                `create_page`. All rows must include the key property.
+            key_property: Name or id of the property identifying the pages,
+                e.g. a title or unique id. Must be a title, text, email,
+                phone number, url, number, unique id, checkbox, select or
+                status property. Keys are compared to the plain values
+                returned by `extract_value`, e.g. the number of a unique id.
+            concurrency: Maximum number of rows processed at the same time.
+
+        Returns:
+            For every row, in the same order, either the updated or created
+            page or the exception raised for the row, e.g. if several pages
+            match it. Updated pages that didn't change only include the
+            retrieved properties.
+
+        Raises:
+            ValueError: If the key property can't identify pages.
+        """
+        rows = list(rows)
+        key_name = self._get_key_name(key_property)
+
+        pages: Dict[Any, List[Dict]] = {}
+        async for page in self.query(
+            properties=self._get_upsert_properties(key_name, rows), raw=True
+        ):
+            key_prop = page["properties"].get(key_name)
+            if key_prop is not None:
+                pages.setdefault(extract_value(key_prop), []).append(page)
+
+        results: List[Union[NotionPage, Exception, None]] = [None] * len(rows)
+        groups = self._group_upsert_rows(rows, key_property, key_name, results)
+
+        async def upsert_group(group: Tuple[Any, List[int]]):
+            # Rows with the same key are applied in order to the same page
+            key_value, indices = group
+            page = None
+            for i in indices:
+                row = rows[i]
+                try:
+                    if page is None:
+                        matches = pages.get(key_value, [])
+                        if len(matches) > 1:
+                            raise ValueError(
+                                f"Several pages with {key_name} = "
+                                f"{key_value!r}"
+                            )
+                        if not matches:
+                            page = await self.create_page(row)
+                            results[i] = page
+                            continue
+                        page = NotionPage(
+                            api=self._api,
+                            page_id=matches[0]["id"],
+                            obj=Page.from_obj(matches[0]),
+                            database=self,
+                        )
+                    await page.update(
+                        {
+                            prop_key: value
+                            for prop_key, value in row.items()
+                            if prop_key not in (key_property, key_name)
+                        },
+                        only_changed=True,
+                    )
+                    results[i] = page
+                except Exception as e:
+                    results[i] = e
+
+        await gather_limited(upsert_group, list(groups.items()), concurrency)
+        return results
@@ -1,5 +1,6 @@
 import json
-from typing import TYPE_CHECKING, Any, Optional, Union
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Union
 
 from pydantic.v1 import BaseModel
 
@@ -8,10 +9,13 @@ from python_notion_api.async_api.iterators import (
     AsyncPropertyItemIterator,
     create_property_iterator,
 )
-from python_notion_api.async_api.utils import ensure_loaded
+from python_notion_api.async_api.utils import ensure_loaded, gather_limited
+from python_notion_api.models.blocks import BlockTree, SEPARATE_BLOCK_TYPES
+from python_notion_api.models.extractors import is_unchanged
 from python_notion_api.models.objects import Block, Database, Page, Pagination
 from python_notion_api.models.properties import PropertyItem
 from python_notion_api.models.values import PropertyValue, generate_value
+from python_notion_api.utils import index_property_names
 
 if TYPE_CHECKING:
     from python_notion_api.async_api.api import AsyncNotionAPI
@@ -46,10 +50,28 @@ class NotionPage:
         self._page_id = page_id
         self._object = obj
         self.database = database
+        self._prop_names: Optional[dict[str, str]] = None
+        self._pending: Optional[dict[str, PropertyValue]] = None
+        self._reload_after_batch = False
 
-    async def reload(self):
-        """Reloads page from Notion."""
-        self._object = await self._api._get(endpoint=f"pages/{self._page_id}")
+    async def reload(self, properties: Optional[list[str]] = None):
+        """Reloads page from Notion.
+
+        Args:
+            properties: Properties to retrieve. If `None`, retrieves all
+                properties. Names can be used if the database of the page is
+                known, otherwise use property ids.
+        """
+        params = {}
+        if properties is not None:
+            if self.database is not None:
+                properties = self.database._get_property_ids(properties)
+            params["filter_properties"] = properties
+
+        self._object = await self._api._get(
+            endpoint=f"pages/{self._page_id}", params=params
+        )
+        self._prop_names = None
         if self._object is not None:
             parent_id = self.parent.database_id
             if parent_id is not None:
@@ -94,40 +116,119 @@ class NotionPage:
             data=json.dumps({"archived": archive_status}),
         )
 
-    @ensure_loaded
-    async def set(
-        self, prop_key: str, value: Any, reload_page: bool = False
-    ) -> None:
-        """Sets a single page property.
+    def _generate_values(
+        self, properties: dict[str, Any], only_changed: bool = False
+    ) -> dict[str, PropertyValue]:
+        """Validates new values of page properties.
 
         Args:
-            prop_key: Name or id of the property to update.
-            value: A new value of the property.
-            reload_page: Whether to reload the page after updating the property.
+            properties: A dictionary mapping property keys to new
+                values.
+            only_changed: If `True`, leaves out values that are the same
+                as the current ones in the page object.
+
+        Returns:
+            A dictionary mapping property names to property values.
         """
+        assert self._object is not None
 
-        prop_name = self._get_prop_name(prop_key=prop_key)
+        values = {}
+        for prop_key, value in properties.items():
+            prop_name = self._get_prop_name(prop_key=prop_key)
 
-        if prop_name is None:
-            raise ValueError(f"Unknown property '{prop_name}'")
+            if prop_name is None:
+                raise ValueError(f"Unknown property '{prop_key}'")
 
-        assert self._object is not None
+            prop = self._object.properties[prop_name]
 
-        prop_type = self._object.properties[prop_name]["type"]
+            value = generate_value(prop["type"], value)
+            if only_changed and is_unchanged(prop, value):
+                continue
+            values[prop_name] = value
+        return values
 
-        value = generate_value(prop_type, value)
-        request = NotionPage.PatchRequest(properties={prop_name: value})
+    async def _patch_properties(
+        self, values: dict[str, PropertyValue], reload_page: bool = False
+    ) -> None:
+        """Sends new property values, or adds them to the pending batch.
+
+        Args:
+            values: A dictionary mapping property names to property values.
+            reload_page: Whether to reload the page after sending the
+                values.
+        """
+        if self._pending is not None:
+            self._pending.update(values)
+            self._reload_after_batch |= reload_page
+            return
+
+        request = NotionPage.PatchRequest(properties=values)
 
         data = request.json(by_alias=True, exclude_unset=True)
 
-        await self._api._patch(endpoint=f"pages/{self._page_id}", data=data)
+        new_page = await self._api._patch(
+            endpoint=f"pages/{self._page_id}", data=data
+        )
+        if isinstance(new_page, Page):
+            # Keep the page object up to date for later comparisons
+            self._object = new_page
+            self._prop_names = None
 
         if reload_page:
             await self.reload()
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Merges all `set` and `update` calls into one request.
+
+        Values set inside the block are sent in a single update when the
+        block exits, later values of a property replacing earlier ones.
+        The page is reloaded once after the update if any call asked for
+        it. Nothing is sent if the block raises. Nested blocks are part of
+        the outermost one.
+
+            async with page.batch():
+                await page.set("Status", "Done")
+                await page.set("Number", 1)
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = {}
+        self._reload_after_batch = False
+        try:
+            yield
+            pending = self._pending
+            reload_page = self._reload_after_batch
+        finally:
+            self._pending = None
+            self._reload_after_batch = False
+
+        if pending:
+            await self._patch_properties(pending, reload_page=reload_page)
+
+    @ensure_loaded
+    async def set(
+        self, prop_key: str, value: Any, reload_page: bool = False
+    ) -> None:
+        """Sets a single page property.
+
+        Args:
+            prop_key: Name or id of the property to update.
+            value: A new value of the property.
+            reload_page: Whether to reload the page after updating the property.
+        """
+        await self._patch_properties(
+            self._generate_values({prop_key: value}), reload_page=reload_page
+        )
+
     @ensure_loaded
     async def update(
-        self, properties: dict[str, Any], reload_page: bool = False
+        self,
+        properties: dict[str, Any],
+        reload_page: bool = False,
+        only_changed: bool = False,
     ) -> None:
         """Updates the page with a dictionary of new values.
 
@@ -135,40 +236,37 @@ class NotionPage:
             properties: A dictionary mapping property keys to new
                 values.
             reload_page: Whether to reload the page after updating the properties.
+            only_changed: If `True`, only sends the values that differ from
+                the current values in the page object, and doesn't send a
+                request if none do.
         """
-        values = {}
-        for prop_key, value in properties.items():
-            prop_name = self._get_prop_name(prop_key=prop_key)
-
-            if prop_name is None:
-                raise ValueError(f"Unknown property '{prop_name}'")
-
-            assert self._object is not None
-
-            prop_type = self._object.properties[prop_name]["type"]
-
-            value = generate_value(prop_type, value)
-            values[prop_name] = value
-
-        request = NotionPage.PatchRequest(properties=values)
-
-        data = request.json(by_alias=True, exclude_unset=True)
-
-        await self._api._patch(endpoint=f"pages/{self._page_id}", data=data)
-
-        if reload_page:
-            await self.reload()
+        values = self._generate_values(properties, only_changed=only_changed)
+        if values or not only_changed:
+            await self._patch_properties(values, reload_page=reload_page)
 
     @ensure_loaded
     async def get_properties(
-        self, raw: bool = False
+        self, raw: bool = False, concurrency: int = 10
     ) -> dict[str, PropertyValue]:
-        """Gets all properties of the page."""
+        """Gets all properties of the page.
+
+        Properties that need to be retrieved through the API, e.g. formulas
+        and rollups, are retrieved concurrently.
+
+        Args:
+            raw: If `True`, returns the property value objects or
+                iterators instead of the values.
+            concurrency: Maximum number of properties retrieved at the same
+                time.
+        """
         assert self._object is not None
-        return {
-            prop_name: await self.get(prop_name, raw=raw)
-            for prop_name in self._object.properties
-        }
+        prop_names = list(self._object.properties)
+
+        async def get(prop_name: str):
+            return await self.get(prop_name, raw=raw)
+
+        values = await gather_limited(get, prop_names, concurrency)
+        return dict(zip(prop_names, values))
 
     @ensure_loaded
     async def to_dict(
@@ -176,29 +274,63 @@ class NotionPage:
         include_rels: bool = True,
         rels_only=False,
         properties: Optional[dict] = None,
+        concurrency: int = 10,
     ) -> dict[str, Union[str, list]]:
         """ "Returns all properties of the page as a dict of builtin type values.
 
+        Properties that can't be decoded from the page object, e.g.
+        formulas and rollups, are retrieved concurrently.
+
         Args:
             include_rels: Include relations.
             rels_only: Return relations only.
             properties: List of properties to return. If `None`, will
                 get values for all properties.
+            concurrency: Maximum number of properties retrieved at the same
+                time.
         """
+        assert self._object is not None
         if properties is None:
-            assert self._object is not None
             properties = self._object.properties
-        vals = {}
 
-        for prop_name in properties:
-            prop = await self.get(prop_name, raw=True)
+        decoded = {}
+        # Subclasses overriding `get` get all values through it
+        if self.database is not None and type(self).get is NotionPage.get:
+            decoded = self.database.row_decoder.decode(
+                self._object.properties,
+                names=[
+                    prop_name
+                    for prop_name in properties
+                    if prop_name not in self.special_properties
+                ],
+            )
 
+        async def get(prop_name: str):
+            prop = await self.get(prop_name, raw=True)
             if isinstance(prop, AsyncPropertyItemIterator):
-                value = await prop.get_value()
+                return prop.property_type, await prop.get_value()
+            return prop.property_type, prop.value
+
+        retrieved_names = [
+            prop_name for prop_name in properties if prop_name not in decoded
+        ]
+        retrieved = dict(
+            zip(
+                retrieved_names,
+                await gather_limited(get, retrieved_names, concurrency),
+            )
+        )
+
+        vals = {}
+
+        for prop_name in properties:
+            if prop_name in decoded:
+                prop_type = self._object.properties[prop_name]["type"]
+                value = decoded[prop_name]
             else:
-                value = prop.value
+                prop_type, value = retrieved[prop_name]
 
-            if prop.property_type == "relation":
+            if prop_type == "relation":
                 if include_rels:
                     vals[prop_name] = value
             else:
@@ -206,11 +338,19 @@ class NotionPage:
                     vals[prop_name] = value
         return vals
 
-    async def add_blocks(self, blocks: list[Block]) -> AsyncBlockIterator:
+    async def add_blocks(
+        self, blocks: list[Block], concurrency: int = 10
+    ) -> AsyncBlockIterator:
         """Adds new blocks to the page.
 
+        Any number of blocks can be added: they are sent in as few requests
+        as Notion accepts, and children nested too deep for a request are
+        added to their parent once it is created.
+
         Args:
             blocks: List of Blocks to add.
+            concurrency: Maximum number of blocks nested children are added
+                to at the same time.
 
         Returns:
             Iterator of new blocks.
@@ -221,23 +361,79 @@ class NotionPage:
             by_alias=True, exclude_unset=True, exclude_none=True
         )
 
-        new_blocks = await self._api._patch(
-            endpoint=f"blocks/{self.page_id}/children", data=data
+        new_blocks = await self._api._append_blocks(
+            self.page_id, json.loads(data)["children"], concurrency
         )
-        return AsyncBlockIterator(iter(new_blocks.results))
+        return AsyncBlockIterator(iter(new_blocks))
 
-    async def get_blocks(self) -> AsyncBlockIterator:
+    async def get_blocks(self, prefetch: int = 0) -> AsyncBlockIterator:
         """Gets all blocks in the page.
 
+        Args:
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
+
         Returns:
             Iterator of blocks is returned.
         """
 
         generator = self._api._get_iterate(
-            endpoint=f"blocks/{self._page_id}/children"
+            endpoint=f"blocks/{self._page_id}/children", prefetch=prefetch
         )
         return AsyncBlockIterator(generator)
 
+    async def get_block_tree(
+        self, max_depth: Optional[int] = None, concurrency: int = 10
+    ) -> list[BlockTree]:
+        """Gets all blocks in the page with their children.
+
+        Blocks are retrieved level by level: the children of all blocks of
+        a level that have children are retrieved concurrently. Child pages
+        and databases are not expanded.
+
+        Args:
+            max_depth: Number of levels to retrieve, e.g. 1 for the blocks
+                of the page only. If `None`, retrieves all levels.
+            concurrency: Maximum number of blocks whose children are
+                retrieved at the same time.
+
+        Returns:
+            Trees of the page blocks.
+        """
+
+        async def get_children(block_id: str) -> list[BlockTree]:
+            return [
+                BlockTree(block)
+                async for block, _ in self._api._get_iterate(
+                    endpoint=f"blocks/{block_id}/children"
+                )
+            ]
+
+        trees = await get_children(self._page_id)
+        level = trees
+        depth = 1
+        while max_depth is None or depth < max_depth:
+            expandable = [
+                tree
+                for tree in level
+                if tree.block.has_children
+                and tree.block.block_type not in SEPARATE_BLOCK_TYPES
+            ]
+            if not expandable:
+                break
+            children = await gather_limited(
+                lambda tree: get_children(tree.block.id),
+                expandable,
+                concurrency,
+            )
+            level = []
+            for tree, tree_children in zip(expandable, children):
+                tree.children = tree_children
+                level.extend(tree_children)
+            depth += 1
+
+        return trees
+
     @ensure_loaded
     async def get(
         self,
@@ -245,6 +441,8 @@ class NotionPage:
         cache: bool = True,
         safety_off: bool = False,
         raw: bool = False,
+        prefetch: int = 0,
+        page_limit: Optional[int] = None,
     ) -> Union[PropertyValue, AsyncPropertyItemIterator, None]:
         """Gets a single page property.
 
@@ -258,6 +456,12 @@ class NotionPage:
                 Use `False` to force a new API call.
             safety_off: If `True` will use cached values of rollups and
                 formulas.
+            raw: If `True`, returns the property value object or iterator
+                instead of the value.
+            prefetch: Number of result pages to fetch ahead when iterating
+                over a paginated property.
+            page_limit: Number of results per request when iterating over
+                a paginated property.
         """
         if prop_key in self.special_properties:
             # For subclasses of NotionPage
@@ -270,7 +474,11 @@ class NotionPage:
             property_value = attr
         else:
             property_value = await self._direct_get(
-                prop_key=prop_key, cache=cache, safety_off=safety_off
+                prop_key=prop_key,
+                cache=cache,
+                safety_off=safety_off,
+                prefetch=prefetch,
+                page_limit=page_limit,
             )
 
         if raw:
@@ -281,7 +489,12 @@ class NotionPage:
             return property_value.value
 
     async def _direct_get(
-        self, prop_key: str, cache: bool = True, safety_off: bool = False
+        self,
+        prop_key: str,
+        cache: bool = True,
+        safety_off: bool = False,
+        prefetch: int = 0,
+        page_limit: Optional[int] = None,
     ) -> Union[PropertyValue, AsyncPropertyItemIterator, None]:
         """Wrapper for 'Retrieve a page property item' action.
 
@@ -293,6 +506,10 @@ class NotionPage:
                 or query the API again.
             safety_off: If `True` will use cached values of rollups and
                 formulas
+            prefetch: Number of result pages to fetch ahead when iterating
+                over a paginated property.
+            page_limit: Number of results per request when iterating over
+                a paginated property.
         """
         prop_name = self._get_prop_name(prop_key)
 
@@ -318,12 +535,16 @@ class NotionPage:
 
         ret = await self._api._get(
             endpoint=f"pages/{self._page_id}/properties/{prop_id}",
-            params={"page_size": 20},
+            params={"page_size": page_limit or self._api._page_limit},
         )
 
         if isinstance(ret, Pagination):
+            # Continue from the first page instead of fetching it again
             generator = self._api._get_iterate(
-                endpoint=f"pages/{self._page_id}/properties/{prop_id}"
+                endpoint=f"pages/{self._page_id}/properties/{prop_id}",
+                page_limit=page_limit,
+                prefetch=prefetch,
+                first=ret,
             )
             return create_property_iterator(generator, obj)
 
@@ -342,14 +563,7 @@ class NotionPage:
             Property name or `None` if key is invalid.
         """
         assert self._object is not None
-        _properties = self._object.properties
-        prop_name = next(
-            (
-                key
-                for key in _properties
-                if key == prop_key or _properties[key]["id"] == prop_key
-            ),
-            None,
-        )
+        if self._prop_names is None:
+            self._prop_names = index_property_names(self._object.properties)
 
-        return prop_name
+        return self._prop_names.get(prop_key)
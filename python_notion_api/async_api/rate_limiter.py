@@ -0,0 +1,118 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class AdaptiveLimiter:
+    """Token bucket rate limiter that adapts to rate limit responses.
+
+    Allows bursts of up to `max_rate` requests and refills at a rate of
+    `max_rate` requests per `time_period` seconds. When Notion responds with
+    429, `backoff` multiplicatively lowers the refill rate, empties the
+    bucket and pauses every sender until `Retry-After` has passed. Every
+    successful request then additively increases the rate again, up to
+    the initial one.
+
+    Args:
+        max_rate: Maximum number of requests in a burst.
+        time_period: Number of seconds it takes to refill `max_rate`
+            requests.
+        min_rate: Lowest rate in requests per second the limiter backs
+            off to. Defaults to a tenth of the initial rate.
+        decrease_factor: Factor the rate is multiplied by on every backoff.
+        increase_step: Number of requests per second the rate is increased
+            by on every success. Defaults to a hundredth of the initial rate.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        time_period: float = 60,
+        min_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: Optional[float] = None,
+    ):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._max_rate_per_sec = max_rate / time_period
+        self._rate_per_sec = self._max_rate_per_sec
+        self._min_rate_per_sec = min_rate or self._max_rate_per_sec / 10
+        self._decrease_factor = decrease_factor
+        self._increase_step = increase_step or self._max_rate_per_sec / 100
+
+        self._tokens = float(max_rate)
+        self._last_check = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def rate(self) -> float:
+        """Gets the current rate in requests per second."""
+        return self._rate_per_sec
+
+    @property
+    def is_paused(self) -> bool:
+        """Checks if the senders are paused after a rate limit response."""
+        return time.monotonic() < self._paused_until
+
+    def _refill(self):
+        now = time.monotonic()
+        # No tokens are accumulated while paused.
+        start = max(self._last_check, self._paused_until)
+        if now > start:
+            self._tokens = min(
+                self.max_rate,
+                self._tokens + (now - start) * self._rate_per_sec,
+            )
+        self._last_check = now
+
+    async def acquire(self):
+        """Waits until a request can be sent."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Waiters queue on the lock, so they are served in order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate_per_sec)
+
+    def backoff(self, retry_after: float):
+        """Lowers the rate and pauses all senders.
+
+        Responses to requests sent before the pause may also be rate
+        limited, so the rate is only lowered once per pause.
+
+        Args:
+            retry_after: Number of seconds to pause for.
+        """
+        now = time.monotonic()
+        if now >= self._paused_until:
+            self._rate_per_sec = max(
+                self._min_rate_per_sec,
+                self._rate_per_sec * self._decrease_factor,
+            )
+            self._tokens = 0
+        self._paused_until = max(self._paused_until, now + retry_after)
+
+    def recover(self):
+        """Increases the rate after a successful request."""
+        self._rate_per_sec = min(
+            self._max_rate_per_sec, self._rate_per_sec + self._increase_step
+        )
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return None
@@ -0,0 +1,84 @@
+import asyncio
+
+from pytest import fixture, mark
+
+from python_notion_api.async_api import rate_limiter
+from python_notion_api.async_api.rate_limiter import AdaptiveLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self._sleep = asyncio.sleep
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+        # Let the other tasks run
+        await self._sleep(0)
+
+
+@fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def test_backoff_once_per_pause(clock):
+    limiter = AdaptiveLimiter(60, time_period=60, min_rate=0.01)
+    limiter.backoff(retry_after=1)
+    assert limiter.rate == 0.5
+    assert limiter.is_paused
+
+    # Responses to requests sent before the pause
+    limiter.backoff(retry_after=1)
+    limiter.backoff(retry_after=2)
+    assert limiter.rate == 0.5
+
+    clock.now = 2
+    assert not limiter.is_paused
+    limiter.backoff(retry_after=1)
+    assert limiter.rate == 0.25
+
+
+def test_backoff_min_rate(clock):
+    limiter = AdaptiveLimiter(60, time_period=60, min_rate=0.2)
+    for _ in range(10):
+        limiter.backoff(retry_after=1)
+        clock.now += 1
+    assert limiter.rate == 0.2
+
+
+def test_recover_to_max_rate(clock):
+    limiter = AdaptiveLimiter(60, time_period=60, increase_step=0.1)
+    limiter.backoff(retry_after=1)
+    assert limiter.rate == 0.5
+
+    limiter.recover()
+    assert limiter.rate == 0.6
+    for _ in range(10):
+        limiter.recover()
+    assert limiter.rate == 1
+
+
+@mark.asyncio
+async def test_waiters_held_until_retry_after(clock):
+    limiter = AdaptiveLimiter(60, time_period=60)
+    limiter.backoff(retry_after=5)
+
+    sent_at = []
+
+    async def send():
+        await limiter.acquire()
+        sent_at.append(clock.now)
+
+    await asyncio.gather(*(send() for _ in range(3)))
+
+    assert len(sent_at) == 3
+    assert min(sent_at) >= 5
+    # The bucket is emptied and refills at the lowered rate
+    assert sent_at == [7, 9, 11]
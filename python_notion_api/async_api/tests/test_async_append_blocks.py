@@ -0,0 +1,93 @@
+from pytest import mark
+
+from python_notion_api.async_api import api
+from python_notion_api.async_api.utils import gather_limited
+
+PAGE_ID = "page"
+
+
+def block(block_type: str, text: str = "", children=None) -> dict:
+    value = {
+        "rich_text": [
+            {"type": "text", "plain_text": text, "text": {"content": text}}
+        ]
+    }
+    if children is not None:
+        value["children"] = children
+    return {"object": "block", "type": block_type, block_type: value}
+
+
+def paragraphs(count: int, prefix: str = "") -> list[dict]:
+    return [block("paragraph", f"{prefix}{i}") for i in range(count)]
+
+
+def nested(levels: int) -> dict:
+    children = None
+    for i in reversed(range(levels)):
+        children = [block("paragraph", f"level {i + 1}", children)]
+    return block("paragraph", "level 0", children)
+
+
+def tree(blocks: list[dict]) -> list[tuple]:
+    return [
+        (
+            child["type"],
+            child[child["type"]]["rich_text"][0]["text"]["content"],
+            tree(child[child["type"]].get("children") or []),
+        )
+        for child in blocks
+    ]
+
+
+BLOCKS = [
+    *paragraphs(120),
+    nested(6),
+    block("toggle", "big", children=paragraphs(150, "big ")),
+    block(
+        "column_list",
+        children=[
+            block("column", children=[nested(2)]),
+            block("column", children=paragraphs(120, "column ")),
+        ],
+    ),
+    *[
+        block("toggle", f"toggle {i}", children=paragraphs(99))
+        for i in range(12)
+    ],
+]
+
+
+@mark.asyncio
+class TestAsyncAppendBlocks:
+    async def test_append_blocks(self, fake_async_api, fake_notion):
+        results = await fake_async_api._append_blocks(
+            PAGE_ID, BLOCKS, concurrency=4
+        )
+
+        assert len(results) == len(BLOCKS)
+        assert fake_notion.tree(PAGE_ID) == tree(BLOCKS)
+
+    async def test_append_blocks_levels(
+        self, fake_async_api, fake_notion, monkeypatch
+    ):
+        # Children of every level are appended by a single, non-nested
+        # gather
+        running = []
+        calls = []
+
+        async def fake_gather_limited(fn, items, concurrency):
+            assert not running
+            items = list(items)
+            calls.append((len(items), concurrency))
+            running.append(True)
+            try:
+                return await gather_limited(fn, items, concurrency)
+            finally:
+                running.pop()
+
+        monkeypatch.setattr(api, "gather_limited", fake_gather_limited)
+        await fake_async_api._append_blocks(PAGE_ID, BLOCKS, concurrency=4)
+
+        # The deep paragraph is the only parent below the first level
+        assert calls == [(4, 4), (1, 4), (1, 4), (1, 4)]
+        assert fake_notion.tree(PAGE_ID) == tree(BLOCKS)
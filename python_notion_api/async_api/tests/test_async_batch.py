@@ -0,0 +1,111 @@
+from pytest import mark, raises
+
+
+def patches(fake_notion, page_id):
+    return fake_notion.count("patch", f"pages/{page_id}")
+
+
+def stored_values(fake_notion, page_id):
+    properties = fake_notion.pages[page_id]["properties"]
+    return (
+        "".join(
+            item["text"]["content"] for item in properties["Name"]["title"]
+        ),
+        properties["Number"]["number"],
+    )
+
+
+@mark.asyncio
+class TestAsyncBatch:
+    async def test_batch_flushes_once(self, fake_async_api, fake_notion):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        async with page.batch():
+            await page.set("Name", "Page")
+            await page.set("Number", 1)
+            await page.update({"Number": 2})
+            assert patches(fake_notion, page_id) == 0
+
+        assert patches(fake_notion, page_id) == 1
+        assert stored_values(fake_notion, page_id) == ("Page", 2)
+        assert await page.get("Number") == 2
+
+    async def test_batch_reloads_once(self, fake_async_api, fake_notion):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        async with page.batch():
+            await page.set("Name", "Page", reload_page=True)
+            await page.set("Number", 1, reload_page=True)
+            await page.set("Number", 2)
+
+        assert patches(fake_notion, page_id) == 1
+        assert fake_notion.requests[-1][:2] == ("get", f"pages/{page_id}")
+        assert fake_notion.count("get", f"pages/{page_id}") == 2
+
+    async def test_empty_batch_sends_nothing(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        async with page.batch():
+            pass
+
+        assert patches(fake_notion, page_id) == 0
+
+    async def test_batch_discarded_on_error(self, fake_async_api, fake_notion):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        with raises(RuntimeError):
+            async with page.batch():
+                await page.set("Number", 1, reload_page=True)
+                raise RuntimeError("Failed")
+
+        assert patches(fake_notion, page_id) == 0
+        assert stored_values(fake_notion, page_id) == ("", None)
+
+        # Values are sent immediately again after the batch, and the
+        # discarded reload isn't carried over
+        await page.set("Number", 3)
+        assert patches(fake_notion, page_id) == 1
+        assert stored_values(fake_notion, page_id) == ("", 3)
+        assert fake_notion.count("get", f"pages/{page_id}") == 1
+
+    async def test_nested_batches(self, fake_async_api, fake_notion):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        async with page.batch():
+            await page.set("Name", "Page")
+            async with page.batch():
+                await page.set("Number", 1)
+            assert patches(fake_notion, page_id) == 0
+
+            # An error in a nested block handled by the outer one keeps its
+            # values, as they are part of the outer block
+            with raises(RuntimeError):
+                async with page.batch():
+                    await page.set("Number", 2)
+                    raise RuntimeError("Failed")
+
+        assert patches(fake_notion, page_id) == 1
+        assert stored_values(fake_notion, page_id) == ("Page", 2)
+
+    async def test_nested_batch_error_discards_outer(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        with raises(RuntimeError):
+            async with page.batch():
+                await page.set("Name", "Page")
+                async with page.batch():
+                    await page.set("Number", 1)
+                    raise RuntimeError("Failed")
+
+        assert patches(fake_notion, page_id) == 0
+        assert page._pending is None
@@ -0,0 +1,158 @@
+from pytest import mark
+
+from python_notion_api.async_api import notion_page
+from python_notion_api.models.blocks import (
+    ChildDatabaseBlock,
+    ChildPageBlock,
+    ParagraphBlock,
+    ToggleBlock,
+)
+
+# Blocks of the page as (type, text, children)
+BLOCKS = [
+    (
+        "paragraph",
+        "a",
+        [
+            (
+                "toggle",
+                "a.1",
+                [("paragraph", "a.1.1", [("paragraph", "a.1.1.1", [])])],
+            ),
+            ("paragraph", "a.2", []),
+        ],
+    ),
+    ("child_page", "Page", [("paragraph", "in page", [])]),
+    ("child_database", "Database", [("paragraph", "in database", [])]),
+    ("toggle", "b", [("paragraph", "b.1", [])]),
+]
+
+
+def add_blocks(fake_notion, parent_id: str, blocks: list[tuple]):
+    for block_type, text, children in blocks:
+        if block_type in ("child_page", "child_database"):
+            value = {"title": text}
+        else:
+            value = {
+                "rich_text": [
+                    {
+                        "type": "text",
+                        "plain_text": text,
+                        "text": {"content": text},
+                    }
+                ]
+            }
+        stored = fake_notion._store(
+            parent_id, {"type": block_type, block_type: value}, depth=0
+        )
+        stored["has_children"] = bool(children)
+        add_blocks(fake_notion, stored["id"], children)
+
+
+def text(block) -> str:
+    value = getattr(block, block.block_type)
+    if hasattr(value, "title"):
+        return value.title
+    return "".join(element.plain_text for element in value.rich_text)
+
+
+def as_tuples(trees) -> list[tuple]:
+    return [
+        (tree.block.block_type, text(tree.block), as_tuples(tree.children))
+        for tree in trees
+    ]
+
+
+def block_requests(fake_notion) -> int:
+    return sum(
+        1
+        for request_type, endpoint, _ in fake_notion.requests
+        if request_type == "get" and endpoint.startswith("blocks/")
+    )
+
+
+def record_levels(monkeypatch) -> list[list[str]]:
+    levels = []
+    gather_limited = notion_page.gather_limited
+
+    async def record(fn, items, concurrency):
+        levels.append([text(tree.block) for tree in items])
+        return await gather_limited(fn, items, concurrency)
+
+    monkeypatch.setattr(notion_page, "gather_limited", record)
+    return levels
+
+
+@mark.asyncio
+class TestAsyncBlockTree:
+    async def test_get_block_tree(
+        self, fake_async_api, fake_notion, monkeypatch
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        add_blocks(fake_notion, page_id, BLOCKS)
+        levels = record_levels(monkeypatch)
+        page = await fake_async_api.get_page(page_id)
+
+        trees = await page.get_block_tree()
+
+        # Child pages and databases are not expanded
+        expected = [
+            (
+                block_type,
+                title,
+                [] if block_type.startswith("child_") else kids,
+            )
+            for block_type, title, kids in BLOCKS
+        ]
+        assert as_tuples(trees) == expected
+        assert [type(tree.block) for tree in trees] == [
+            ParagraphBlock,
+            ChildPageBlock,
+            ChildDatabaseBlock,
+            ToggleBlock,
+        ]
+
+        # The children of each level are retrieved together
+        assert levels == [["a", "b"], ["a.1"], ["a.1.1"]]
+        assert block_requests(fake_notion) == 5
+
+    async def test_get_block_tree_max_depth(
+        self, fake_async_api, fake_notion, monkeypatch
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        add_blocks(fake_notion, page_id, BLOCKS)
+        levels = record_levels(monkeypatch)
+        page = await fake_async_api.get_page(page_id)
+
+        trees = await page.get_block_tree(max_depth=1)
+
+        assert [tree.children for tree in trees] == [[], [], [], []]
+        assert levels == []
+        assert block_requests(fake_notion) == 1
+
+        trees = await page.get_block_tree(max_depth=2)
+
+        assert as_tuples(trees[0].children) == [
+            ("toggle", "a.1", []),
+            ("paragraph", "a.2", []),
+        ]
+        assert as_tuples(trees[3].children) == [("paragraph", "b.1", [])]
+        assert levels == [["a", "b"]]
+        assert block_requests(fake_notion) == 1 + 3
+
+    async def test_get_block_tree_concurrency(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        add_blocks(
+            fake_notion,
+            page_id,
+            [("toggle", str(i), [("paragraph", "", [])]) for i in range(6)],
+        )
+        fake_notion.delay = 0.01
+        page = await fake_async_api.get_page(page_id)
+
+        trees = await page.get_block_tree(concurrency=2)
+
+        assert [len(tree.children) for tree in trees] == [1] * 6
+        assert fake_notion.max_active == 2
@@ -0,0 +1,111 @@
+import asyncio
+import gc
+
+from pytest import mark, raises
+
+from python_notion_api.conftest import FAKE_DATABASE_ID
+from python_notion_api.models.objects import Database
+
+ENDPOINT = f"databases/{FAKE_DATABASE_ID}"
+
+
+@mark.asyncio
+class TestAsyncCoalescing:
+    async def test_identical_gets_share_request(
+        self, fake_async_api, fake_notion
+    ):
+        fake_notion.delay = 0.01
+        databases = await asyncio.gather(
+            *(
+                fake_async_api._get(ENDPOINT, cast_cls=Database)
+                for _ in range(5)
+            )
+        )
+
+        assert fake_notion.count("get", ENDPOINT) == 1
+        assert all(database is databases[0] for database in databases)
+        assert not fake_async_api._inflight
+
+    async def test_different_gets_not_shared(
+        self, fake_async_api, fake_notion
+    ):
+        fake_notion.delay = 0.01
+        await asyncio.gather(
+            fake_async_api._get(ENDPOINT, cast_cls=Database),
+            fake_async_api._get(ENDPOINT, params={"a": "1"}),
+            fake_async_api._get(ENDPOINT),
+        )
+
+        assert fake_notion.count("get", ENDPOINT) == 3
+
+    async def test_coalescing_disabled(self, fake_async_api, fake_notion):
+        fake_async_api._coalesce_requests = False
+        fake_notion.delay = 0.01
+        await asyncio.gather(
+            *(fake_async_api._get(ENDPOINT) for _ in range(5))
+        )
+
+        assert fake_notion.count("get", ENDPOINT) == 5
+
+    async def test_error_reaches_every_caller(
+        self, fake_async_api, fake_notion
+    ):
+        error = ValueError("Request failed")
+        fake_notion.errors[ENDPOINT] = error
+        fake_notion.delay = 0.01
+
+        results = await asyncio.gather(
+            *(fake_async_api._get(ENDPOINT) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert results == [error] * 3
+        assert fake_notion.count("get", ENDPOINT) == 1
+
+    async def test_cancelled_caller_doesnt_cancel_others(
+        self, fake_async_api, fake_notion
+    ):
+        fake_notion.delay = 0.01
+        first = asyncio.ensure_future(fake_async_api._get(ENDPOINT))
+        second = asyncio.ensure_future(fake_async_api._get(ENDPOINT))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).db_id == FAKE_DATABASE_ID
+        assert first.cancelled()
+        assert fake_notion.count("get", ENDPOINT) == 1
+
+    async def test_request_cancelled_without_callers(
+        self, fake_async_api, fake_notion
+    ):
+        contexts = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: contexts.append(context))
+        fake_notion.errors[ENDPOINT] = ValueError("Request failed")
+        fake_notion.delay = 0.1
+
+        callers = [
+            asyncio.ensure_future(fake_async_api._get(ENDPOINT))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        assert fake_notion.active == 1
+
+        callers[0].cancel()
+        await asyncio.sleep(0.01)
+        assert fake_notion.active == 1
+
+        # The request is cancelled with its last caller
+        callers[1].cancel()
+        for caller in callers:
+            with raises(asyncio.CancelledError):
+                await caller
+        assert fake_notion.active == 0
+        assert fake_notion.count("get", ENDPOINT) == 0
+        assert not fake_async_api._inflight
+        assert not fake_async_api._waiters
+
+        del callers, caller
+        gc.collect()
+        loop.set_exception_handler(None)
+        assert contexts == []
@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+from pytest import mark, raises
+
+from python_notion_api.async_api.notion_page import NotionPage
+from python_notion_api.async_api.utils import gather_limited
+
+PROPERTY_NAMES = ["Name", "Number", "Formula", "Rel"]
+
+
+class UncachedPage(NotionPage):
+    """Retrieves every property through the API, also in `to_dict`."""
+
+    async def get(self, prop_key, raw=False):
+        return await super().get(prop_key, cache=False, raw=raw)
+
+
+def property_endpoint(page_id, prop_id):
+    return f"pages/{page_id}/properties/{prop_id}"
+
+
+@mark.asyncio
+class TestGatherLimited:
+    async def test_results_in_order(self):
+        async def double(item):
+            await asyncio.sleep(0.01 * (5 - item))
+            return item * 2
+
+        assert await gather_limited(double, range(5), 2) == [0, 2, 4, 6, 8]
+
+    async def test_concurrency_bound(self):
+        active = []
+        max_active = 0
+
+        async def run(item):
+            nonlocal max_active
+            active.append(item)
+            max_active = max(max_active, len(active))
+            await asyncio.sleep(0.01)
+            active.remove(item)
+
+        await gather_limited(run, range(10), 3)
+        assert max_active == 3
+
+    async def test_failure_cancels_other_calls(self):
+        started = []
+        cancelled = []
+
+        async def run(item):
+            started.append(item)
+            if item == 0:
+                raise RuntimeError("Failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+
+        start = time.monotonic()
+        with raises(RuntimeError, match="Failed"):
+            await gather_limited(run, range(10), 3)
+
+        assert time.monotonic() - start < 1
+        # Calls still waiting for the semaphore never start
+        assert len(started) < 10
+        assert cancelled == started[1:]
+
+
+@mark.asyncio
+class TestAsyncPageConcurrency:
+    @mark.parametrize("concurrency,max_active", [(1, 1), (2, 2), (10, 4)])
+    async def test_get_properties_bound(
+        self, fake_async_api, fake_notion, concurrency, max_active
+    ):
+        page_id = fake_notion.add_page({"Number": {"number": 2}})["id"]
+        page = await fake_async_api.get_page(page_id, page_cast=UncachedPage)
+        fake_notion.delay = 0.01
+
+        properties = await page.get_properties(concurrency=concurrency)
+
+        assert list(properties) == PROPERTY_NAMES
+        assert properties["Formula"] == 4
+        assert fake_notion.max_active == max_active
+
+    @mark.parametrize("concurrency,max_active", [(1, 1), (2, 2), (10, 4)])
+    async def test_to_dict_bound(
+        self, fake_async_api, fake_notion, concurrency, max_active
+    ):
+        page_id = fake_notion.add_page({"Number": {"number": 2}})["id"]
+        page = await fake_async_api.get_page(page_id, page_cast=UncachedPage)
+        fake_notion.delay = 0.01
+
+        values = await page.to_dict(concurrency=concurrency)
+
+        assert values == {"Name": "", "Number": 2, "Formula": 4, "Rel": []}
+        assert fake_notion.max_active == max_active
+
+    async def test_get_properties_failure_cancels_requests(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id, page_cast=UncachedPage)
+        fake_notion.errors[property_endpoint(page_id, "f1")] = RuntimeError(
+            "Request failed"
+        )
+        for prop_id in ["title", "n1", "r1"]:
+            fake_notion.delays[property_endpoint(page_id, prop_id)] = 10
+
+        start = time.monotonic()
+        with raises(RuntimeError, match="Request failed"):
+            await page.get_properties()
+
+        assert time.monotonic() - start < 1
+        assert fake_notion.active == 0
+        # The slow requests were cancelled before they were handled
+        assert fake_notion.requests[-1][1] == property_endpoint(page_id, "f1")
+
+    async def test_to_dict_failure_cancels_requests(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id, page_cast=UncachedPage)
+        fake_notion.errors[property_endpoint(page_id, "f1")] = RuntimeError(
+            "Request failed"
+        )
+        for prop_id in ["title", "n1", "r1"]:
+            fake_notion.delays[property_endpoint(page_id, prop_id)] = 10
+
+        start = time.monotonic()
+        with raises(RuntimeError, match="Request failed"):
+            await page.to_dict()
+
+        assert time.monotonic() - start < 1
+        assert fake_notion.active == 0
+        assert fake_notion.requests[-1][1] == property_endpoint(page_id, "f1")
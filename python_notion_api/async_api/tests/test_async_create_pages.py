@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+from pydantic.v1 import ValidationError
+from pytest import fixture, mark
+
+from python_notion_api.async_api.notion_page import NotionPage
+from python_notion_api.conftest import FAKE_DATABASE_ID
+
+
+@fixture
+def slow_first_rows(fake_async_api, monkeypatch):
+    """Creates the pages of the first rows last, and fails for `Fail`.
+
+    Returns the numbers of the rows sent.
+    """
+    request = fake_async_api._request
+    sent = []
+
+    async def slow_request(request_type, endpoint="", data=None, **kwargs):
+        if request_type == "post" and endpoint == "pages":
+            properties = json.loads(data)["properties"]
+            number = properties.get("Number", {}).get("number") or 0
+            sent.append(number)
+            await asyncio.sleep(0.01 * max(5 - number, 0))
+            if "Fail" in data:
+                raise RuntimeError("Request failed")
+        return await request(request_type, endpoint, data=data, **kwargs)
+
+    monkeypatch.setattr(fake_async_api, "_request", slow_request)
+    return sent
+
+
+@mark.asyncio
+class TestAsyncCreatePages:
+    async def test_results_in_order(
+        self, fake_async_api, fake_notion, slow_first_rows
+    ):
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+        rows = [{"Name": f"Page {i}", "Number": i} for i in range(6)]
+
+        pages = await database.create_pages(rows, concurrency=6)
+
+        assert all(isinstance(page, NotionPage) for page in pages)
+        assert [await page.get("Number") for page in pages] == list(range(6))
+        assert len(fake_notion.pages) == 6
+
+    async def test_errors_returned_per_row(
+        self, fake_async_api, fake_notion, slow_first_rows
+    ):
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+        rows = [
+            {"Name": "Page 0", "Number": 0},
+            {"Nope": 1},
+            {"Name": "Fail", "Number": 2},
+            {"Number": "not a number"},
+            {"Name": "Page 4", "Number": 4},
+        ]
+
+        results = await database.create_pages(rows)
+
+        assert await results[0].get("Number") == 0
+        assert isinstance(results[1], ValueError)
+        assert "Unknown property: Nope" in str(results[1])
+        assert isinstance(results[2], RuntimeError)
+        assert isinstance(results[3], ValidationError)
+        assert await results[4].get("Number") == 4
+        # Rows failing validation are not sent
+        assert sorted(slow_first_rows) == [0, 2, 4]
+        assert len(fake_notion.pages) == 2
+
+    async def test_concurrency_bound(self, fake_async_api, fake_notion):
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+        fake_notion.delay = 0.01
+
+        pages = await database.create_pages(
+            [{"Number": i} for i in range(8)], concurrency=3
+        )
+
+        assert len(pages) == 8
+        assert fake_notion.max_active == 3
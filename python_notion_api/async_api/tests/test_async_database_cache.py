@@ -0,0 +1,81 @@
+from pytest import fixture, mark
+
+from python_notion_api import utils
+from python_notion_api.conftest import FAKE_DATABASE_ID
+
+ENDPOINT = f"databases/{FAKE_DATABASE_ID}"
+DASHED_ID = "401076f6-c7c0-4ae7-96bf-3e4c847361e1"
+
+
+@fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    return now
+
+
+@mark.asyncio
+class TestAsyncDatabaseCache:
+    async def test_cache_hit(self, fake_async_api, fake_notion):
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+        assert await fake_async_api.get_database(FAKE_DATABASE_ID) is database
+        assert await fake_async_api.get_database(DASHED_ID) is database
+        assert fake_notion.count("get", ENDPOINT) == 1
+
+    async def test_cache_disabled_per_call(self, fake_async_api, fake_notion):
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+        reloaded = await fake_async_api.get_database(
+            FAKE_DATABASE_ID, cache=False
+        )
+
+        assert reloaded is not database
+        assert fake_notion.count("get", ENDPOINT) == 2
+        assert await fake_async_api.get_database(FAKE_DATABASE_ID) is reloaded
+
+    async def test_ttl_expiry(self, fake_async_api, fake_notion, clock):
+        fake_async_api._database_cache.ttl = 10
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+
+        clock[0] = 9.9
+        assert await fake_async_api.get_database(FAKE_DATABASE_ID) is database
+        clock[0] = 10
+        assert (
+            await fake_async_api.get_database(FAKE_DATABASE_ID) is not database
+        )
+        assert fake_notion.count("get", ENDPOINT) == 2
+
+    async def test_ttl_zero(self, fake_async_api, fake_notion):
+        fake_async_api._database_cache.ttl = 0
+        await fake_async_api.get_database(FAKE_DATABASE_ID)
+        await fake_async_api.get_database(FAKE_DATABASE_ID)
+        assert fake_notion.count("get", ENDPOINT) == 2
+
+    async def test_invalidate(self, fake_async_api, fake_notion):
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+
+        fake_async_api.invalidate_database(DASHED_ID)
+        reloaded = await fake_async_api.get_database(FAKE_DATABASE_ID)
+        assert reloaded is not database
+
+        fake_async_api.invalidate_database()
+        assert (
+            await fake_async_api.get_database(FAKE_DATABASE_ID) is not reloaded
+        )
+        assert fake_notion.count("get", ENDPOINT) == 3
+
+    async def test_page_load_single_request(self, fake_async_api, fake_notion):
+        page_ids = [fake_notion.add_page({})["id"] for _ in range(2)]
+
+        pages = [
+            await fake_async_api.get_page(page_id) for page_id in page_ids
+        ]
+        await fake_async_api.get_page(page_ids[0])
+
+        # The parent database is only fetched for the first page
+        assert pages[0].database is pages[1].database
+        assert [request[:2] for request in fake_notion.requests] == [
+            ("get", f"pages/{page_ids[0]}"),
+            ("get", ENDPOINT),
+            ("get", f"pages/{page_ids[1]}"),
+            ("get", f"pages/{page_ids[0]}"),
+        ]
@@ -0,0 +1,56 @@
+from pytest import mark
+
+RELATION = [{"id": f"{i:032x}"} for i in range(60)]
+
+
+def property_requests(fake_notion, page_id, prop_id):
+    endpoint = f"pages/{page_id}/properties/{prop_id}"
+    return [
+        params
+        for _, sent_endpoint, params in fake_notion.requests
+        if sent_endpoint == endpoint
+    ]
+
+
+@mark.asyncio
+class TestAsyncDirectGet:
+    @mark.parametrize(
+        "page_limit,cursors",
+        [(25, [None, "25", "50"]), (30, [None, "30"]), (None, [None])],
+    )
+    async def test_first_page_reused(
+        self, fake_async_api, fake_notion, page_limit, cursors
+    ):
+        page_id = fake_notion.add_page({"Rel": {"relation": RELATION}})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        value = await page.get("Rel", page_limit=page_limit)
+
+        assert value == [relation["id"] for relation in RELATION]
+        requests = property_requests(fake_notion, page_id, "r1")
+        assert [params.get("start_cursor") for params in requests] == cursors
+        assert all(
+            params["page_size"] == (page_limit or 100) for params in requests
+        )
+
+    async def test_property_item_single_request(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({"Number": {"number": 2}})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        assert await page.get("Formula") == 4
+        assert len(property_requests(fake_notion, page_id, "f1")) == 1
+
+    async def test_cached_value_without_request(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({"Rel": {"relation": RELATION[:3]}})[
+            "id"
+        ]
+        page = await fake_async_api.get_page(page_id)
+
+        assert await page.get("Rel") == [
+            relation["id"] for relation in RELATION[:3]
+        ]
+        assert property_requests(fake_notion, page_id, "r1") == []
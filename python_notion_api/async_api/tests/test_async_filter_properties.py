@@ -0,0 +1,91 @@
+from pytest import mark
+
+from python_notion_api.async_api.api import AsyncNotionAPI
+from python_notion_api.conftest import FAKE_DATABASE_ID, FAKE_SCHEMA
+
+QUERY_ENDPOINT = f"databases/{FAKE_DATABASE_ID}/query"
+
+
+class FakeSession:
+    def __init__(self):
+        self.params = []
+
+    async def request(self, method, url, headers, params, data):
+        self.params.append(params)
+
+
+@mark.asyncio
+class TestAsyncFilterProperties:
+    async def test_query_sends_property_ids(self, fake_async_api, fake_notion):
+        fake_notion.add_page({"Number": {"number": 1}})
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+
+        pages = [
+            page async for page in database.query(properties=["Name", "n1"])
+        ]
+
+        ((_, _, params),) = [
+            request
+            for request in fake_notion.requests
+            if request[1] == QUERY_ENDPOINT
+        ]
+        assert params == {"filter_properties": ["title", "n1"]}
+        assert list(pages[0]._object.properties) == ["Name", "Number"]
+
+    async def test_query_sends_decoded_property_ids(
+        self, fake_async_api, fake_notion, monkeypatch
+    ):
+        monkeypatch.setitem(FAKE_SCHEMA["Number"], "id", "n%3B1")
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+
+        [page async for page in database.query(properties=["Number"])]
+
+        assert fake_notion.requests[-1][2] == {"filter_properties": ["n;1"]}
+
+    async def test_get_page_sends_property_ids(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({})["id"]
+
+        page = await fake_async_api.get_page(page_id, properties=["n1"])
+
+        assert fake_notion.requests[0] == (
+            "get",
+            f"pages/{page_id}",
+            {"filter_properties": ["n1"]},
+        )
+        assert list(page._object.properties) == ["Number"]
+
+    async def test_reload_sends_ids_of_names(
+        self, fake_async_api, fake_notion
+    ):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        await page.reload(properties=["Number", "Formula"])
+
+        assert fake_notion.requests[-1] == (
+            "get",
+            f"pages/{page_id}",
+            {"filter_properties": ["n1", "f1"]},
+        )
+        assert list(page._object.properties) == ["Number", "Formula"]
+
+    async def test_request_sends_repeated_params(self):
+        api = AsyncNotionAPI(access_token="")
+        session = FakeSession()
+
+        await api._request_attempt(
+            session,
+            "get",
+            "pages/page",
+            params={"filter_properties": ["title", "n;1"], "page_size": 10},
+        )
+
+        assert session.params == [
+            [
+                ("filter_properties", "title"),
+                ("filter_properties", "n;1"),
+                ("page_size", 10),
+            ]
+        ]
@@ -0,0 +1,79 @@
+import asyncio
+
+from pytest import mark, raises
+
+from python_notion_api.async_api.utils import prefetch_pages
+from python_notion_api.conftest import FAKE_DATABASE_ID
+
+
+async def counting_pages(produced, limit=None):
+    page = 0
+    while limit is None or page < limit:
+        produced.append(page)
+        yield page
+        page += 1
+
+
+@mark.asyncio
+class TestAsyncPrefetch:
+    async def test_prefetch_keeps_order(self):
+        produced = []
+        pages = prefetch_pages(counting_pages(produced, 20), depth=3)
+        assert [page async for page in pages] == list(range(20))
+
+    async def test_prefetch_runs_ahead_up_to_depth(self):
+        produced = []
+        pages = prefetch_pages(counting_pages(produced), depth=2)
+        assert await pages.__anext__() == 0
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # One page taken by the consumer, two in the queue and one waiting
+        assert len(produced) == 4
+        await pages.aclose()
+
+    async def test_prefetch_early_break_cancels_task(self):
+        before = asyncio.all_tasks()
+        produced = []
+        pages = prefetch_pages(counting_pages(produced), depth=1)
+
+        async for page in pages:
+            if page == 2:
+                break
+        tasks = asyncio.all_tasks() - before
+        assert len(tasks) == 1
+
+        await pages.aclose()
+        await asyncio.sleep(0)
+        assert all(task.cancelled() for task in tasks)
+        assert asyncio.all_tasks() == before
+
+        count = len(produced)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(produced) == count
+
+    async def test_prefetch_reraises_producer_error(self):
+        async def failing_pages():
+            yield 0
+            yield 1
+            raise RuntimeError("Request failed")
+
+        consumed = []
+        with raises(RuntimeError, match="Request failed"):
+            async for page in prefetch_pages(failing_pages(), depth=2):
+                consumed.append(page)
+        assert consumed == [0, 1]
+
+    async def test_query_prefetch_order(self, fake_async_api, fake_notion):
+        page_ids = [
+            fake_notion.add_page({})["id"].replace("-", "") for _ in range(7)
+        ]
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+
+        pages = database.query(page_limit=2, prefetch=2)
+        assert [page.page_id async for page in pages] == page_ids
+        assert (
+            fake_notion.count("post", f"databases/{FAKE_DATABASE_ID}/query")
+            == 4
+        )
@@ -0,0 +1,44 @@
+from pytest import mark
+
+
+def rename_property(page, old_name, new_name):
+    page["properties"] = {
+        new_name if name == old_name else name: prop
+        for name, prop in page["properties"].items()
+    }
+
+
+@mark.asyncio
+class TestAsyncPropertyIndex:
+    async def test_index_lookup(self, fake_async_api, fake_notion):
+        page_id = fake_notion.add_page({})["id"]
+        page = await fake_async_api.get_page(page_id)
+
+        assert page._get_prop_name("Number") == "Number"
+        assert page._get_prop_name("n1") == "Number"
+        assert page._get_prop_name("Count") is None
+
+    async def test_index_reset_on_reload(self, fake_async_api, fake_notion):
+        stored = fake_notion.add_page({})
+        page = await fake_async_api.get_page(stored["id"], properties=["n1"])
+        assert page._get_prop_name("Name") is None
+
+        await page.reload()
+        assert page._get_prop_name("Name") == "Name"
+        assert page._get_prop_name("title") == "Name"
+
+        rename_property(stored, "Number", "Count")
+        await page.reload()
+        assert page._get_prop_name("n1") == "Count"
+        assert page._get_prop_name("Number") is None
+
+    async def test_index_reset_on_update(self, fake_async_api, fake_notion):
+        stored = fake_notion.add_page({})
+        page = await fake_async_api.get_page(stored["id"])
+        assert page._get_prop_name("Rel") == "Rel"
+
+        rename_property(stored, "Rel", "Links")
+        await page.set("Number", 1)
+
+        assert page._get_prop_name("r1") == "Links"
+        assert page._get_prop_name("Rel") is None
@@ -0,0 +1,75 @@
+from pytest import mark
+
+from python_notion_api.conftest import FAKE_DATABASE_ID
+from python_notion_api.models import NotionObject
+from python_notion_api.models.extractors import extract_values
+from python_notion_api.models.filters import equals_filter
+
+
+def fail_from_obj(cls, obj):
+    raise AssertionError("Results were validated")
+
+
+@mark.asyncio
+class TestAsyncRawQuery:
+    async def test_raw_yields_page_dicts(
+        self, fake_async_api, fake_notion, monkeypatch
+    ):
+        pages = [
+            fake_notion.add_page(
+                {
+                    "Name": {"title": [{"text": {"content": f"Page {i}"}}]},
+                    "Number": {"number": i},
+                }
+            )
+            for i in range(5)
+        ]
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+        monkeypatch.setattr(
+            NotionObject, "from_obj", classmethod(fail_from_obj)
+        )
+
+        results = [
+            result async for result in database.query(raw=True, page_limit=2)
+        ]
+
+        assert results == [fake_notion._view_page(page) for page in pages]
+        assert (
+            fake_notion.count("post", f"databases/{FAKE_DATABASE_ID}/query")
+            == 3
+        )
+
+    async def test_raw_extract_values(self, fake_async_api, fake_notion):
+        fake_notion.add_page(
+            {
+                "Name": {"title": [{"plain_text": "Page"}]},
+                "Number": {"number": 2},
+            }
+        )
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+
+        results = [result async for result in database.query(raw=True)]
+
+        assert [extract_values(result) for result in results] == [
+            {"Name": "Page", "Number": 2, "Formula": 4, "Rel": []}
+        ]
+
+    async def test_raw_with_properties_and_filters(
+        self, fake_async_api, fake_notion
+    ):
+        for i in range(3):
+            fake_notion.add_page({"Number": {"number": i}})
+        database = await fake_async_api.get_database(FAKE_DATABASE_ID)
+
+        results = [
+            result
+            async for result in database.query(
+                filters=equals_filter("Number", "number", 1),
+                properties=["Number"],
+                raw=True,
+            )
+        ]
+
+        assert [extract_values(result) for result in results] == [
+            {"Number": 1}
+        ]
@@ -0,0 +1,70 @@
+import json
+
+from pytest import mark
+
+from python_notion_api.async_api.api import AsyncNotionAPI
+
+
+class FakeResponse:
+    status = 200
+
+    def __init__(self, obj):
+        self._data = json.dumps(obj).encode("utf-8")
+
+    async def read(self):
+        return self._data
+
+
+def record_sessions(api, monkeypatch):
+    sessions = []
+
+    async def request_attempt(session, request_type, url, params, data):
+        sessions.append(session)
+        return FakeResponse({"object": "user", "id": "u1"})
+
+    monkeypatch.setattr(api, "_request_attempt", request_attempt)
+    return sessions
+
+
+@mark.asyncio
+class TestAsyncSession:
+    async def test_session_reused(self, monkeypatch):
+        api = AsyncNotionAPI(access_token="", pool_size=7)
+        sessions = record_sessions(api, monkeypatch)
+
+        await api.me()
+        await api.me()
+
+        assert sessions[0] is sessions[1]
+        assert sessions[0] is api.session
+        assert api.session.connector.limit == 7
+        await api.aclose()
+
+    async def test_aclose(self, monkeypatch):
+        api = AsyncNotionAPI(access_token="")
+        sessions = record_sessions(api, monkeypatch)
+
+        await api.me()
+        await api.aclose()
+        assert sessions[0].closed
+        assert api._session is None
+
+        # A new session is opened if the client is used again
+        await api.me()
+        assert sessions[1] is not sessions[0]
+        assert not sessions[1].closed
+        await api.aclose()
+        assert sessions[1].closed
+
+    async def test_aclose_without_session(self):
+        api = AsyncNotionAPI(access_token="")
+        await api.aclose()
+        assert api._session is None
+
+    async def test_context_manager(self, monkeypatch):
+        async with AsyncNotionAPI(access_token="") as api:
+            sessions = record_sessions(api, monkeypatch)
+            await api.me()
+
+        assert sessions[0].closed
+        assert api._session is None
@@ -0,0 +1,94 @@
+from pytest import mark, raises
+from pytest_asyncio import fixture as async_fixture
+
+from python_notion_api.async_api.notion_database import NotionDatabase
+from python_notion_api.conftest import FAKE_DATABASE_ID
+
+
+@mark.asyncio
+class TestAsyncUpsert:
+    @async_fixture
+    async def database(self, fake_async_api):
+        database = NotionDatabase(
+            database_id=FAKE_DATABASE_ID, api=fake_async_api
+        )
+        await database.reload()
+        return database
+
+    async def test_upsert_many_repeated_new_key(self, database, fake_notion):
+        await database.create_page({"Name": "x", "Number": 1})
+
+        results = await database.upsert_many(
+            [
+                {"Name": "y", "Number": 8},
+                {"Name": "x", "Number": 2},
+                {"Name": "y", "Number": 7},
+            ],
+            key_property="Name",
+        )
+
+        assert results[0].page_id == results[2].page_id
+        assert results[0].page_id != results[1].page_id
+        values = sorted(
+            (
+                page["properties"]["Name"]["title"][0]["plain_text"],
+                page["properties"]["Number"]["number"],
+            )
+            for page in fake_notion.pages.values()
+        )
+        assert values == [("x", 2), ("y", 7)]
+
+    async def test_upsert_many_several_pages(self, database, fake_notion):
+        await database.create_page({"Name": "x"})
+        await database.create_page({"Name": "x"})
+
+        results = await database.upsert_many(
+            [{"Name": "x", "Number": 1}, {"Name": "x", "Number": 2}],
+            key_property="Name",
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(fake_notion.pages) == 2
+
+    async def test_upsert_repeated_new_key(self, database, fake_notion):
+        await database.create_page({"Name": "x", "Number": 1})
+        fake_notion.delay = 0.01
+
+        results = await database.upsert(
+            [
+                {"Name": "y", "Number": 8},
+                {"Name": "x", "Number": 2},
+                {"Name": "y", "Number": 7},
+            ],
+            key="Name",
+        )
+
+        assert results[0].page_id == results[2].page_id
+        assert results[0].page_id != results[1].page_id
+        values = sorted(
+            (
+                page["properties"]["Name"]["title"][0]["plain_text"],
+                page["properties"]["Number"]["number"],
+            )
+            for page in fake_notion.pages.values()
+        )
+        assert values == [("x", 2), ("y", 7)]
+        # The page of a key is only queried once
+        query = f"databases/{FAKE_DATABASE_ID}/query"
+        assert fake_notion.count("post", query) == 2
+
+    async def test_upsert_missing_key(self, database, fake_notion):
+        results = await database.upsert(
+            [{"Number": 1}, {"Name": "x"}], key="Name"
+        )
+
+        assert isinstance(results[0], KeyError)
+        assert results[1].page_id in {
+            page_id.replace("-", "") for page_id in fake_notion.pages
+        }
+
+    @mark.parametrize("method", ["upsert", "upsert_many"])
+    async def test_unsupported_key_type(self, database, fake_notion, method):
+        with raises(ValueError, match="only checkbox, email, number"):
+            await getattr(database, method)([{"Rel": []}], "Rel")
+        assert fake_notion.requests[-1][1] == f"databases/{FAKE_DATABASE_ID}"
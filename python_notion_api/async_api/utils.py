@@ -1,4 +1,9 @@
+import asyncio
 import inspect
+from typing import AsyncGenerator, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def ensure_loaded(fn):
@@ -30,3 +35,74 @@ def ensure_loaded(fn):
         return async_wrapper
     else:
         return sync_wrapper
+
+
+async def prefetch_pages(
+    pages: AsyncGenerator[T, None], depth: int = 1
+) -> AsyncGenerator[T, None]:
+    """Consumes a generator of pages in a background task.
+
+    The task runs up to `depth` pages ahead of the consumer, so the next
+    request is in flight while the current page is being processed.
+
+    Args:
+        pages: Generator of pages.
+        depth: Maximum number of fetched pages waiting to be consumed.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+    done = object()
+
+    async def produce():
+        try:
+            async for page in pages:
+                await queue.put((page, None))
+            await queue.put((done, None))
+        except Exception as e:
+            await queue.put((done, e))
+
+    task = asyncio.ensure_future(produce())
+
+    try:
+        while True:
+            page, error = await queue.get()
+            if error is not None:
+                raise error
+            if page is done:
+                return
+            yield page
+    finally:
+        task.cancel()
+
+
+async def gather_limited(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> list[R]:
+    """Awaits a coroutine function for every item, a few at a time.
+
+    At most `concurrency` calls run at the same time. Requests made by the
+    calls still go through the rate limiter of the client.
+
+    Args:
+        fn: Coroutine function to call for every item.
+        items: Items to pass to the function.
+        concurrency: Maximum number of calls running at the same time.
+
+    Returns:
+        Results of the function, in the same order as `items`. If any
+        call raises, the other calls are cancelled and the exception is
+        re-raised.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,350 @@
+import asyncio
+import copy
+import json
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from pytest import fixture
+from pytest_asyncio import fixture as async_fixture
+
+from python_notion_api.async_api.api import AsyncNotionAPI
+from python_notion_api.models.extractors import extract_value
+from python_notion_api.models.properties import NotionObject
+from python_notion_api.sync_api.api import NotionAPI
+
+FAKE_DATABASE_ID = "401076f6c7c04ae796bf3e4c847361e1"
+FAKE_USER = {"object": "user", "id": "fa9e1df9-7c24-427c-9c20-eac629565fe4"}
+FAKE_SCHEMA = {
+    "Name": {"id": "title", "name": "Name", "type": "title", "title": {}},
+    "Number": {"id": "n1", "name": "Number", "type": "number", "number": {}},
+    "Formula": {
+        "id": "f1",
+        "name": "Formula",
+        "type": "formula",
+        "formula": {"expression": 'prop("Number") * 2'},
+    },
+    "Rel": {
+        "id": "r1",
+        "name": "Rel",
+        "type": "relation",
+        "relation": {
+            "database_id": FAKE_DATABASE_ID,
+            "type": "single_property",
+            "single_property": {},
+        },
+    },
+}
+# Number of references in the relations of page objects
+RELATION_LIMIT = 25
+# Property types retrieved as a paginated list of property items
+PAGINATED_TYPES = frozenset({"title", "rich_text", "relation", "people"})
+
+
+class FakeNotion:
+    """In-memory Notion workspace with one database and block children.
+
+    Requests appending blocks fail if they break the limits of Notion.
+    Requests can be delayed, with `delay` or `delays` per endpoint, and
+    made to fail with `errors` per endpoint. The number of requests in
+    progress at the same time is recorded in `max_active`.
+    """
+
+    def __init__(self):
+        self.pages: Dict[str, Dict] = {}
+        self.blocks: Dict[str, List[Dict]] = {}
+        self.requests: List[tuple] = []
+        self.delay = 0.0
+        self.delays: Dict[str, float] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def add_page(self, properties: Dict[str, Any]) -> Dict:
+        page_id = str(uuid.uuid4())
+        self.pages[page_id] = {
+            "object": "page",
+            "id": page_id,
+            "created_time": "2024-01-01T00:00:00.000Z",
+            "last_edited_time": "2024-01-01T00:00:00.000Z",
+            "created_by": FAKE_USER,
+            "last_edited_by": FAKE_USER,
+            "parent": {
+                "type": "database_id",
+                "database_id": FAKE_DATABASE_ID,
+            },
+            "archived": False,
+            "url": f"https://www.notion.so/{page_id}",
+            "properties": {
+                "Name": {"id": "title", "type": "title", "title": []},
+                "Number": {"id": "n1", "type": "number", "number": None},
+                "Formula": {"id": "f1", "type": "formula"},
+                "Rel": {"id": "r1", "type": "relation", "relation": []},
+            },
+        }
+        self._set_properties(page_id, properties)
+        return self.pages[page_id]
+
+    def _set_properties(self, page_id: str, properties: Dict[str, Dict]):
+        page_properties = self.pages[page_id]["properties"]
+        for name, value in properties.items():
+            prop_type = FAKE_SCHEMA[name]["type"]
+            page_properties[name][prop_type] = value[prop_type]
+
+        number = page_properties["Number"]["number"]
+        page_properties["Formula"]["formula"] = {
+            "type": "number",
+            "number": None if number is None else number * 2,
+        }
+
+    def _view_page(
+        self, page: Dict, property_ids: Optional[List[str]] = None
+    ) -> Dict:
+        """Gets a page as returned by Notion, with relations truncated and
+        only the given properties.
+        """
+        page = copy.deepcopy(page)
+        properties = {}
+        for name, prop in page["properties"].items():
+            if property_ids is not None and prop["id"] not in property_ids:
+                continue
+            if prop["type"] == "relation":
+                prop["has_more"] = len(prop["relation"]) > RELATION_LIMIT
+                prop["relation"] = prop["relation"][:RELATION_LIMIT]
+            properties[name] = prop
+        page["properties"] = properties
+        return page
+
+    def _matches(self, page: Dict, filters: Optional[Dict]) -> bool:
+        if filters is None:
+            return True
+        prop = page["properties"][filters["property"]]
+        return extract_value(prop) == filters[prop["type"]]["equals"]
+
+    def _get_property(
+        self, page_id: str, prop_id: str, params: Dict[str, Any]
+    ) -> Dict:
+        prop = next(
+            prop
+            for prop in self.pages[page_id]["properties"].values()
+            if prop["id"] == prop_id
+        )
+        prop_type = prop["type"]
+        if prop_type not in PAGINATED_TYPES:
+            return {"object": "property_item", **prop}
+
+        items = [
+            {
+                "object": "property_item",
+                "id": prop_id,
+                "type": prop_type,
+                prop_type: value,
+            }
+            for value in prop[prop_type]
+        ]
+        return self._list(
+            "property_item",
+            items,
+            params,
+            {"id": prop_id, "type": prop_type, prop_type: {}},
+        )
+
+    def _append_blocks(self, parent_id: str, children: List[Dict]):
+        assert len(children) <= 100, "Too many children"
+        assert self._count(children) <= 1000, "Too many blocks"
+
+        results = []
+        for child in children:
+            block = self._store(parent_id, child, depth=0)
+            results.append(block)
+        return results
+
+    def _count(self, blocks: List[Dict]) -> int:
+        return sum(
+            1 + self._count(block[block["type"]].get("children") or [])
+            for block in blocks
+        )
+
+    def _store(self, parent_id: str, block: Dict, depth: int) -> Dict:
+        value = dict(block[block["type"]])
+        children = value.pop("children", None) or []
+        assert len(children) <= 100, "Too many children"
+        assert not children or depth < 2, "Too many levels of nesting"
+
+        block_id = uuid.uuid4().hex
+        stored = {
+            **block,
+            "object": "block",
+            "id": block_id,
+            "has_children": bool(children),
+            block["type"]: value,
+        }
+        self.blocks.setdefault(parent_id, []).append(stored)
+        self.blocks.setdefault(block_id, [])
+        for child in children:
+            self._store(block_id, child, depth + 1)
+        return stored
+
+    def tree(self, parent_id: str) -> List[tuple]:
+        """Gets the types and texts of the stored blocks, nested."""
+        return [
+            (
+                block["type"],
+                "".join(
+                    element["text"]["content"]
+                    for element in block[block["type"]].get("rich_text", [])
+                ),
+                self.tree(block["id"]),
+            )
+            for block in self.blocks.get(parent_id, [])
+        ]
+
+    def count(self, request_type: str, endpoint: str) -> int:
+        """Gets the number of requests sent to an endpoint."""
+        return sum(
+            1
+            for sent_type, sent_endpoint, _ in self.requests
+            if (sent_type, sent_endpoint) == (request_type, endpoint)
+        )
+
+    def start(self, endpoint: str) -> float:
+        """Records the start of a request and gets its delay."""
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        return self.delays.get(endpoint, self.delay)
+
+    def finish(self):
+        """Records the end of a request."""
+        with self._lock:
+            self.active -= 1
+
+    def handle(
+        self,
+        request_type: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        data: Optional[str],
+    ) -> Dict:
+        self.requests.append((request_type, endpoint, params))
+        if endpoint in self.errors:
+            raise self.errors[endpoint]
+
+        body = json.loads(data) if data else {}
+        parts = endpoint.strip("/").split("/")
+        property_ids = params.get("filter_properties")
+
+        if parts[0] == "databases" and request_type == "get":
+            return {
+                "object": "database",
+                "id": FAKE_DATABASE_ID,
+                "created_time": "2024-01-01T00:00:00.000Z",
+                "created_by": FAKE_USER,
+                "last_edited_time": "2024-01-01T00:00:00.000Z",
+                "last_edited_by": FAKE_USER,
+                "title": [],
+                "description": [],
+                "properties": FAKE_SCHEMA,
+                "parent": {"type": "workspace", "workspace": True},
+                "url": "https://www.notion.so/db",
+                "archived": False,
+                "is_inline": False,
+            }
+        if parts[0] == "databases":
+            pages = [
+                self._view_page(page, property_ids)
+                for page in self.pages.values()
+                if self._matches(page, body.get("filter"))
+            ]
+            return self._list("page", pages, body)
+        if parts[0] == "pages" and request_type == "post":
+            return self._view_page(self.add_page(body["properties"]))
+        if parts[0] == "pages" and request_type == "patch":
+            self._set_properties(parts[1], body.get("properties", {}))
+            return self._view_page(self.pages[parts[1]])
+        if parts[0] == "pages" and len(parts) == 4:
+            return self._get_property(parts[1], parts[3], params)
+        if parts[0] == "pages":
+            return self._view_page(self.pages[parts[1]], property_ids)
+        if parts[0] == "blocks" and request_type == "patch":
+            # Only the appended blocks are returned, without children
+            return self._list(
+                "block", self._append_blocks(parts[1], body["children"])
+            )
+        if parts[0] == "blocks":
+            return self._list("block", self.blocks.get(parts[1], []), params)
+        raise ValueError(f"Unexpected request {request_type} {endpoint}")
+
+    def _list(
+        self,
+        result_type: str,
+        results: List[Dict],
+        pagination: Optional[Dict[str, Any]] = None,
+        type_object: Optional[Dict] = None,
+    ) -> Dict:
+        pagination = pagination or {}
+        start = int(pagination.get("start_cursor") or 0)
+        end = start + int(pagination.get("page_size") or len(results))
+        has_more = end < len(results)
+        return {
+            "object": "list",
+            "type": result_type,
+            result_type: type_object or {},
+            "results": results[start:end],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+
+@fixture
+def fake_notion() -> FakeNotion:
+    return FakeNotion()
+
+
+@fixture
+def fake_api(fake_notion: FakeNotion) -> NotionAPI:
+    api = NotionAPI(access_token="")
+
+    def request(
+        request_type,
+        endpoint="",
+        params={},
+        data=None,
+        cast_cls=NotionObject,
+        retry_strategy=None,
+    ):
+        time.sleep(fake_notion.start(endpoint))
+        try:
+            obj = fake_notion.handle(request_type, endpoint, params, data)
+        finally:
+            fake_notion.finish()
+        return obj if cast_cls is None else cast_cls.from_obj(obj)
+
+    api._request = request
+    return api
+
+
+@async_fixture
+async def fake_async_api(fake_notion: FakeNotion) -> AsyncNotionAPI:
+    api = AsyncNotionAPI(access_token="")
+
+    async def request(
+        request_type,
+        endpoint="",
+        params={},
+        data=None,
+        cast_cls=NotionObject,
+        retry_strategy=None,
+    ):
+        delay = fake_notion.start(endpoint)
+        try:
+            await asyncio.sleep(delay)
+            obj = fake_notion.handle(request_type, endpoint, params, data)
+        finally:
+            fake_notion.finish()
+        return obj if cast_cls is None else cast_cls.from_obj(obj)
+
+    api._request = request
+    return api
@@ -1,4 +1,5 @@
 from python_notion_api.models.blocks import (
+    BlockTree,
     BookmarkBlock,
     BreadcrumbBlock,
     BulletedListItemBlock,
@@ -71,6 +72,7 @@ from python_notion_api.models.configurations import (
     TitlePropertyConfiguration,
     URLPropertyConfiguration,
 )
+from python_notion_api.models.extractors import extract_value, extract_values
 from python_notion_api.models.fields import (
     andField,
     filterField,
@@ -86,6 +88,7 @@ from python_notion_api.models.filters import (
     CheckboxFilter,
     CreatedTimeFilter,
     DateFilter,
+    EmailFilter,
     FilesFilter,
     FilterItem,
     FormulaFilter,
@@ -99,7 +102,11 @@ from python_notion_api.models.filters import (
     RichTextFilter,
     SelectFilter,
     StatusFilter,
+    TitleFilter,
+    UniqueIdFilter,
+    UrlFilter,
     and_filter,
+    equals_filter,
     or_filter,
 )
 from python_notion_api.models.iterators import PropertyItemIterator
@@ -140,6 +147,7 @@ from python_notion_api.models.properties import (
     UniqueIDPropertyItem,
     URLPropertyItem,
 )
+from python_notion_api.models.rows import CompactRow, RowSchema
 from python_notion_api.models.sorts import Sort
 from python_notion_api.models.values import (
     FormulaPropertyValue,
@@ -227,9 +235,17 @@ __all__ = [
     "LastEditedTimePropertyConfiguration",
     "LastEditedByPropertyConfiguration",
     "PropertyItemIterator",
+    "CompactRow",
+    "RowSchema",
+    "extract_value",
+    "extract_values",
+    "TitleFilter",
     "RichTextFilter",
+    "EmailFilter",
     "PhoneNumberFilter",
+    "UrlFilter",
     "NumberFilter",
+    "UniqueIdFilter",
     "SelectFilter",
     "MultiSelectFilter",
     "DateFilter",
@@ -246,6 +262,7 @@ __all__ = [
     "OrFilter",
     "or_filter",
     "and_filter",
+    "equals_filter",
     "Sort",
     "ParagraphBlock",
     "Heading1Block",
@@ -278,4 +295,5 @@ __all__ = [
     "TableBlock",
     "TableRowBlock",
     "UnsupportedBlock",
+    "BlockTree",
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from pydantic.v1 import AnyUrl, BaseModel
 
@@ -123,11 +123,11 @@ class TableOfContentsBlockValue(BaseModel):
 
 
 class ColumnListBlockValue(BaseModel):
-    children: List[ColumnBlock]
+    children: Optional[List[ColumnBlock]]
 
 
 class ColumnBlockValue(BaseModel):
-    children: List[Block]
+    children: Optional[List[Block]]
 
 
 class LinkPreviewBlockValue(BaseModel):
@@ -136,7 +136,7 @@ class LinkPreviewBlockValue(BaseModel):
 
 class TemplateBlockValue(BaseModel):
     rich_text: List[RichTextObject]
-    children: List[Block]
+    children: Optional[List[Block]]
 
 
 class LinkToPageBlockValue(BaseModel):
@@ -151,14 +151,14 @@ class BlockID(BaseModel):
 
 class SyncedBlockValue(BaseModel):
     synced_from: Optional[BlockID]
-    children: List[Block]
+    children: Optional[List[Block]]
 
 
 class TableBlockValue(BaseModel):
     table_width: int
     has_column_header: bool
     has_row_header: bool
-    children: List[TableRowBlock]
+    children: Optional[List[TableRowBlock]]
 
 
 class TableRowBlockValue(BaseModel):
@@ -166,7 +166,7 @@ class TableRowBlockValue(BaseModel):
 
 
 class ParagraphBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     paragraph: ParagraphBlockValue
 
@@ -177,19 +177,19 @@ class ParagraphBlock(Block):
 
 
 class Heading1Block(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     heading_1: HeadingBlockValue
 
 
 class Heading2Block(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     heading_2: HeadingBlockValue
 
 
 class Heading3Block(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     heading_3: HeadingBlockValue
 
@@ -199,178 +199,214 @@ class CalloutBlock(Block):
 
     _class_map = {"emoji": "EmojiCalloutBlock", "file": "FileCalloutBlock"}
 
-    @property
-    def _class_key_field(self):
-        return self.callout.icon["type"]
+    _class_key_path = ("callout", "icon", "type")
 
 
 class EmojiCalloutBlock(CalloutBlock):
-    _class_key_field = None
+    _class_key_path = None
 
     callout: CalloutEmojiBlockValue
 
 
 class FileCalloutBlock(CalloutBlock):
-    _class_key_field = None
+    _class_key_path = None
 
     callout: CalloutFileBlockValue
 
 
 class QuoteBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     quote: QuoteBlockValue
 
 
 class BulletedListItemBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     bulleted_list_item: BulletedListItemBlockValue
 
 
 class NumberedListItemBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     numbered_list_item: NumberedListItemBlockValue
 
 
 class ToDoBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     to_do: ToDoBlockValue
 
 
 class CodeBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     code: CodeBlockValue
 
 
 class ChildPageBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     child_page: ChildPageBlockValue
 
 
 class ChildDatabaseBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     child_database: ChildDatabaseBlockValue
 
 
 class EmbedBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     embed: EmbedBlockValue
 
 
 class ImageBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     image: ImageBlockValue
 
 
 class VideoBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     video: VideoBlockValue
 
 
 class FileBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     file: FileBlockValue
 
 
 class PDFBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     pdf: PDFBlockValue
 
 
 class BookmarkBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     bookmark: BookmarkBlockValue
 
 
 class EquationBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     equation: EquationBlockValue
 
 
 class DividerBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
     # There is no information in a DividerBlock
 
 
 class TableOfContentsBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     table_of_contents: TableOfContentsBlockValue
 
 
 class BreadcrumbBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
     # There is no information in a BreadcrumbBlock
 
 
 class ColumnListBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     column_list: ColumnListBlockValue
 
 
 class ColumnBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     column: ColumnBlockValue
 
 
 class LinkPreviewBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     link_preview: LinkPreviewBlockValue
 
 
 class TemplateBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     template: TemplateBlockValue
 
 
 class LinkToPageBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     link_to_page: LinkToPageBlockValue
 
 
 class SyncedBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     synced: SyncedBlockValue
 
 
 class TableBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     table: TableBlockValue
 
 
 class TableRowBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     table_row: TableRowBlockValue
 
 
 class ToggleBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     toggle: ToggleBlockValue
 
 
 class UnsupportedBlock(Block):
-    _class_key_field = None
+    _class_key_path = None
 
     unsupported: dict
+
+
+# Blocks whose children are separate pages or databases
+SEPARATE_BLOCK_TYPES = frozenset({"child_page", "child_database"})
+
+
+class BlockTree:
+    """Block with its child blocks, as returned by `get_block_tree`.
+
+    Args:
+        block: The block.
+        children: Trees of the child blocks. Empty if the block has no
+            children or they were not retrieved.
+    """
+
+    __slots__ = ("block", "children")
+
+    def __init__(
+        self, block: Block, children: Optional[List[BlockTree]] = None
+    ):
+        self.block = block
+        self.children = children if children is not None else []
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({type(self.block).__name__}, "
+            f"{len(self.children)} children)"
+        )
+
+    def walk(self) -> Iterator[BlockTree]:
+        """Iterates over the tree and all its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+ColumnListBlockValue.update_forward_refs()
+TableBlockValue.update_forward_refs()
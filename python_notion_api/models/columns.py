@@ -0,0 +1,280 @@
+import importlib
+from array import array
+from datetime import datetime, timedelta, timezone
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+)
+
+from python_notion_api.models.configurations import (
+    NotionPropertyConfiguration,
+)
+from python_notion_api.models.extractors import extract_value
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# Same as numpy's NaT, so that the values can be viewed as datetime64
+_NAT = -(2**63)
+
+
+def _import_optional(module: str, extra: str) -> ModuleType:
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{module} is required for this export, install it with "
+            f"`pip install python-notion-api[{extra}]`"
+        ) from e
+
+
+class Column:
+    """Column of plain property values.
+
+    Values are the same as returned by `extract_value`.
+    """
+
+    def __init__(self):
+        self._values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, prop: Optional[Dict]):
+        """Appends a value from a raw property value.
+
+        Args:
+            prop: Property value as returned by Notion, or `None` if the
+                page doesn't have the property.
+        """
+        self._values.append(None if prop is None else extract_value(prop))
+
+    def to_list(self) -> List[Any]:
+        """Gets the values as a list."""
+        return list(self._values)
+
+    def to_arrow(self) -> "pyarrow.Array":
+        """Gets the values as an Arrow array."""
+        pa = _import_optional("pyarrow", "arrow")
+        return pa.array(self._values)
+
+    def to_pandas(self) -> Any:
+        """Gets the values as an array that can be put in a DataFrame."""
+        return self._values
+
+
+class NumberColumn(Column):
+    """Column of numbers, stored as 64-bit floats."""
+
+    def __init__(self):
+        self._values = array("d")
+
+    def append(self, prop: Optional[Dict]):
+        number = None if prop is None else prop["number"]
+        self._values.append(float("nan") if number is None else number)
+
+    def to_list(self) -> List[Optional[float]]:
+        return [None if value != value else value for value in self._values]
+
+    def to_arrow(self) -> "pyarrow.Array":
+        pa = _import_optional("pyarrow", "arrow")
+        # Notion numbers can't be NaN, so all NaNs are missing values
+        return pa.array(self._values, type=pa.float64(), from_pandas=True)
+
+    def to_pandas(self) -> Any:
+        np = _import_optional("numpy", "pandas")
+        return np.array(self._values, dtype=np.float64)
+
+
+class BooleanColumn(Column):
+    """Column of checkboxes."""
+
+    def to_arrow(self) -> "pyarrow.Array":
+        pa = _import_optional("pyarrow", "arrow")
+        return pa.array(self._values, type=pa.bool_())
+
+
+class DatetimeColumn(Column):
+    """Column of dates, stored as microseconds since the epoch in UTC.
+
+    Only the start of date ranges is kept. Dates without a time zone are
+    taken as UTC.
+    """
+
+    def __init__(self):
+        self._values = array("q")
+
+    def append(self, prop: Optional[Dict]):
+        value = None if prop is None else prop[prop["type"]]
+        if isinstance(value, dict):
+            value = value["start"]
+
+        if value is None:
+            self._values.append(_NAT)
+            return
+
+        date = datetime.fromisoformat(value)
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        self._values.append((date - _EPOCH) // _MICROSECOND)
+
+    def to_list(self) -> List[Optional[datetime]]:
+        return [
+            None if value == _NAT else _EPOCH + value * _MICROSECOND
+            for value in self._values
+        ]
+
+    def to_arrow(self) -> "pyarrow.Array":
+        pa = _import_optional("pyarrow", "arrow")
+        mask = pa.array([value == _NAT for value in self._values])
+        return pa.array(
+            self._values, type=pa.timestamp("us", tz="UTC"), mask=mask
+        )
+
+    def to_pandas(self) -> Any:
+        np = _import_optional("numpy", "pandas")
+        pd = _import_optional("pandas", "pandas")
+        values = np.array(self._values, dtype=np.int64)
+        return pd.DatetimeIndex(values.view("datetime64[us]")).tz_localize(
+            "UTC"
+        )
+
+
+class CategoryColumn(Column):
+    """Column of select or status options, stored as dictionary codes."""
+
+    def __init__(self):
+        self._values = array("i")
+        self._categories: Dict[str, int] = {}
+
+    def append(self, prop: Optional[Dict]):
+        option = None if prop is None else prop[prop["type"]]
+        if option is None:
+            self._values.append(-1)
+            return
+
+        code = self._categories.setdefault(
+            option["name"], len(self._categories)
+        )
+        self._values.append(code)
+
+    def to_list(self) -> List[Optional[str]]:
+        categories = list(self._categories)
+        return [
+            None if code == -1 else categories[code] for code in self._values
+        ]
+
+    def to_arrow(self) -> "pyarrow.Array":
+        pa = _import_optional("pyarrow", "arrow")
+        mask = pa.array([code == -1 for code in self._values])
+        return pa.DictionaryArray.from_arrays(
+            pa.array(self._values, type=pa.int32(), mask=mask),
+            pa.array(list(self._categories), type=pa.string()),
+        )
+
+    def to_pandas(self) -> Any:
+        pd = _import_optional("pandas", "pandas")
+        return pd.Categorical.from_codes(
+            list(self._values), categories=list(self._categories)
+        )
+
+
+_column_classes: Dict[str, Type[Column]] = {
+    "number": NumberColumn,
+    "checkbox": BooleanColumn,
+    "date": DatetimeColumn,
+    "created_time": DatetimeColumn,
+    "last_edited_time": DatetimeColumn,
+    "select": CategoryColumn,
+    "status": CategoryColumn,
+}
+
+
+class Columns:
+    """Property values of database pages, stored by column.
+
+    A typed column is picked for each property from the property
+    configurations of the database: numbers are stored as floats, dates
+    as timestamps and selects and statuses as dictionary encoded
+    categories. Other properties are stored as the values returned by
+    `extract_value`.
+
+    Args:
+        properties: Property configurations of the database.
+        names: Names of the properties to store. If `None`, stores all
+            properties.
+    """
+
+    def __init__(
+        self,
+        properties: Dict[str, NotionPropertyConfiguration],
+        names: Optional[List[str]] = None,
+    ):
+        if names is None:
+            names = list(properties)
+
+        self.page_ids: List[str] = []
+        self.columns: Dict[str, Column] = {
+            name: _column_classes.get(properties[name].config_type, Column)()
+            for name in names
+        }
+
+    def __len__(self) -> int:
+        return len(self.page_ids)
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def append(self, page: Dict):
+        """Appends the properties of a page.
+
+        Args:
+            page: Page object as returned by Notion, e.g. by
+                `query(raw=True)`.
+        """
+        self.page_ids.append(page["id"])
+        properties = page["properties"]
+        for name, column in self.columns.items():
+            column.append(properties.get(name))
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Gets the values as a dictionary of lists."""
+        return {
+            name: column.to_list() for name, column in self.columns.items()
+        }
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Gets the values as an Arrow table.
+
+        Requires `pyarrow`.
+        """
+        pa = _import_optional("pyarrow", "arrow")
+        return pa.table(
+            {name: column.to_arrow() for name, column in self.columns.items()}
+        )
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Gets the values as a DataFrame indexed by page ids.
+
+        Requires `pandas`.
+        """
+        pd = _import_optional("pandas", "pandas")
+        return pd.DataFrame(
+            {
+                name: column.to_pandas()
+                for name, column in self.columns.items()
+            },
+            index=pd.Index(self.page_ids, name="page_id"),
+        )
@@ -38,85 +38,83 @@ class NotionPropertyConfiguration(NotionObjectBase):
         "unique_id": "UniqueIDPropertyConfiguration",
     }
 
-    @property
-    def _class_key_field(self):
-        return self.config_type
+    _class_key_path = ("type",)
 
 
 class TitlePropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     title: EmptyField
 
 
 class TextPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     rich_text: EmptyField
 
 
 class NumberPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     number_format: Optional[str] = Field(alias="format", default="")
 
 
 class SelectPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     options: Optional[List[SelectObject]] = []
 
 
 class StatusPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     status: EmptyField
 
 
 class MultiSelectPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     options: Optional[List[SelectObject]] = []
 
 
 class DatePropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     date: EmptyField
 
 
 class PeoplePropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     people: EmptyField
 
 
 class FilesPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     files: EmptyField
 
 
 class CheckBoxPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     checkbox: EmptyField
 
 
 class URLPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     url: EmptyField
 
 
 class EmailPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     email: EmptyField
 
 
 class PhoneNumberPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     phone_number: EmptyField
 
@@ -126,15 +124,13 @@ class FormulaConfigurationObject(BaseModel):
 
 
 class FormulaPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     formula: FormulaConfigurationObject
 
 
 class RelationPropertyConfiguration(NotionPropertyConfiguration):
-    @property
-    def _class_key_field(self):
-        return self.relation["type"]
+    _class_key_path = ("relation", "type")
 
     _class_map = {
         "single_property": "SinglePropertyConfiguration",
@@ -151,7 +147,7 @@ class SinglePropertyConfigurationObject(BaseModel):
 
 
 class SinglePropertyConfiguration(RelationPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     relation: SinglePropertyConfigurationObject
 
@@ -167,7 +163,7 @@ class DualPropertyConfigurationObject(BaseModel):
 
 
 class DualPropertyConfiguration(RelationPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     relation: DualPropertyConfigurationObject
 
@@ -181,36 +177,36 @@ class RollupConfigurationObject(BaseModel):
 
 
 class RollupPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     rollup: RollupConfigurationObject
 
 
 class CreatedTimePropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     created_time: EmptyField
 
 
 class CreatedByPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     created_by: EmptyField
 
 
 class LastEditedTimePropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     last_edited_time: EmptyField
 
 
 class LastEditedByPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     last_edited_by: EmptyField
 
 
 class UniqueIDPropertyConfiguration(NotionPropertyConfiguration):
-    _class_key_field = None
+    _class_key_path = None
 
     unique_id: EmptyField
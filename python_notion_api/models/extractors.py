@@ -0,0 +1,305 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from python_notion_api.models.common import DateObject, File
+from python_notion_api.models.configurations import (
+    NotionPropertyConfiguration,
+)
+from python_notion_api.models.filters import EQUALS_FILTERS
+from python_notion_api.models.values import PropertyValue
+
+
+def _plain_text(rich_text: List[Dict]) -> str:
+    return "".join(element["plain_text"] for element in rich_text)
+
+
+def _name(obj: Optional[Dict]) -> Optional[str]:
+    return obj and obj.get("name")
+
+
+def _extract_raw(prop: Dict) -> Any:
+    return prop.get(prop["type"])
+
+
+def _extract_title(prop: Dict) -> str:
+    return _plain_text(prop["title"])
+
+
+def _extract_rich_text(prop: Dict) -> str:
+    return _plain_text(prop["rich_text"])
+
+
+def _extract_select(prop: Dict) -> Optional[str]:
+    return _name(prop["select"])
+
+
+def _extract_status(prop: Dict) -> Optional[str]:
+    return _name(prop["status"])
+
+
+def _extract_multi_select(prop: Dict) -> List[str]:
+    return [option["name"] for option in prop["multi_select"]]
+
+
+def _extract_people(prop: Dict) -> List[Optional[str]]:
+    return [_name(user) for user in prop["people"]]
+
+
+def _extract_files(prop: Dict) -> List[Dict[str, Optional[str]]]:
+    files = []
+    for file_object in prop["files"]:
+        reference = file_object.get("external") or file_object.get("file")
+        files.append(
+            {"name": file_object.get("name"), "url": reference["url"]}
+        )
+    return files
+
+
+def _extract_relation(prop: Dict) -> List[str]:
+    return [relation["id"] for relation in prop["relation"]]
+
+
+def _extract_formula(prop: Dict) -> Any:
+    formula = prop["formula"]
+    return formula.get(formula["type"])
+
+
+def _extract_rollup(prop: Dict) -> Any:
+    rollup = prop["rollup"]
+    if rollup["type"] == "array":
+        return [extract_value(item) for item in rollup["array"]]
+    return rollup.get(rollup["type"])
+
+
+def _extract_created_by(prop: Dict) -> Optional[str]:
+    return _name(prop["created_by"])
+
+
+def _extract_last_edited_by(prop: Dict) -> Optional[str]:
+    return _name(prop["last_edited_by"])
+
+
+def _extract_unique_id(prop: Dict) -> int:
+    return prop["unique_id"]["number"]
+
+
+_extractors: Dict[str, Callable[[Dict], Any]] = {
+    "title": _extract_title,
+    "rich_text": _extract_rich_text,
+    "select": _extract_select,
+    "status": _extract_status,
+    "multi_select": _extract_multi_select,
+    "people": _extract_people,
+    "files": _extract_files,
+    "relation": _extract_relation,
+    "formula": _extract_formula,
+    "rollup": _extract_rollup,
+    "created_by": _extract_created_by,
+    "last_edited_by": _extract_last_edited_by,
+    "unique_id": _extract_unique_id,
+}
+
+
+# Property types whose plain values can identify pages, the same as the
+# types that `equals_filter` can match
+KEY_TYPES = frozenset(EQUALS_FILTERS)
+
+
+def extract_value(prop: Dict) -> Any:
+    """Extracts a plain value from a raw property value.
+
+    Values are the same as the `value` of the corresponding property value
+    class, but only use JSON types, e.g. dates are returned as the raw date
+    dictionary and files as dictionaries with a name and url. Properties
+    without a specific extractor, e.g. numbers and checkboxes, are returned
+    as is.
+
+    Args:
+        prop: Property value as returned by Notion.
+
+    Returns:
+        Plain value of the property.
+    """
+    extractor = _extractors.get(prop["type"], _extract_raw)
+    return extractor(prop)
+
+
+def extract_values(page: Dict) -> Dict[str, Any]:
+    """Extracts plain values of all properties of a raw page.
+
+    Page properties in query results are truncated to 25 references, so
+    long relations, people and rollups may be incomplete.
+
+    Args:
+        page: Page object as returned by Notion, e.g. by
+            `query(raw=True)`.
+
+    Returns:
+        Dictionary of property names and plain values.
+    """
+    return {
+        name: extract_value(prop) for name, prop in page["properties"].items()
+    }
+
+
+def _decode_number(prop: Dict) -> Optional[float]:
+    number = prop["number"]
+    return float(number) if number is not None else None
+
+
+def _decode_date(prop: Dict) -> Optional[DateObject]:
+    date = prop["date"]
+    return DateObject(**date) if date is not None else None
+
+
+def _decode_files(prop: Dict) -> List[File]:
+    return [File(**file) for file in _extract_files(prop)]
+
+
+# Decoders returning the same values as the `value` of the property value
+# classes. Formulas and rollups are missing as their values in the page
+# object might be incorrect.
+VALUE_DECODERS: Dict[str, Callable[[Dict], Any]] = {
+    "title": _extract_title,
+    "rich_text": _extract_rich_text,
+    "number": _decode_number,
+    "select": _extract_select,
+    "status": _extract_status,
+    "multi_select": _extract_multi_select,
+    "date": _decode_date,
+    "people": _extract_people,
+    "files": _decode_files,
+    "checkbox": _extract_raw,
+    "url": _extract_raw,
+    "email": _extract_raw,
+    "phone_number": _extract_raw,
+    "relation": _extract_relation,
+    "created_time": _extract_raw,
+    "created_by": _extract_created_by,
+    "last_edited_time": _extract_raw,
+    "last_edited_by": _extract_last_edited_by,
+    "unique_id": _extract_unique_id,
+}
+
+
+class RowDecoder:
+    """Decodes raw page properties into values in one pass.
+
+    The decoder of each property is picked once from the property
+    configurations of a database. Values are the same as the `value` of the
+    property value classes, without validating any models. Properties whose
+    value in the page object might be incorrect or incomplete, i.e.
+    formulas, rollups and relations with more than 25 items, are not
+    decoded and need to be retrieved through the API.
+
+    Args:
+        properties: Property configurations of the database.
+    """
+
+    def __init__(self, properties: Dict[str, NotionPropertyConfiguration]):
+        self._decoders = {}
+        for prop_name, config in properties.items():
+            decoder = VALUE_DECODERS.get(config.config_type)
+            if decoder is not None:
+                self._decoders[prop_name] = (config.config_type, decoder)
+
+    def decode(
+        self,
+        properties: Dict[str, Dict],
+        names: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """Decodes the values of page properties.
+
+        Args:
+            properties: Properties of a page object as returned by Notion.
+            names: Names of the properties to decode. If `None`, decodes all
+                properties.
+
+        Returns:
+            Dictionary of property names and values, only including the
+            properties that could be decoded.
+        """
+        values = {}
+        for prop_name in properties if names is None else names:
+            compiled = self._decoders.get(prop_name)
+            prop = properties.get(prop_name)
+            if compiled is None or prop is None:
+                continue
+
+            prop_type, decoder = compiled
+            # The page might not match a cached schema
+            if prop["type"] != prop_type or prop.get("has_more"):
+                continue
+
+            values[prop_name] = decoder(prop)
+        return values
+
+
+def _normalize_id(object_id: Optional[str]) -> Optional[str]:
+    return object_id and object_id.replace("-", "")
+
+
+# Annotations of rich text elements without formatting
+_default_annotations = {
+    "bold": False,
+    "italic": False,
+    "strikethrough": False,
+    "underline": False,
+    "code": False,
+    "color": "default",
+}
+
+
+def _rich_text_content(element: Dict) -> Tuple[Any, ...]:
+    """Gets the parts of a rich text element that are sent to Notion."""
+    element_type = element.get("type") or "text"
+    annotations = {
+        key: annotation
+        for key, annotation in (element.get("annotations") or {}).items()
+        if annotation != _default_annotations.get(key)
+    }
+    if element_type == "text":
+        text = element.get("text") or {}
+        link = text.get("link") or {}
+        content = (text.get("content"), link.get("url"))
+    else:
+        content = element.get(element_type)
+    return element_type, content, annotations
+
+
+def is_unchanged(prop: Dict, value: PropertyValue) -> bool:
+    """Checks if a new property value is the same as the current one.
+
+    Decoded values are compared, e.g. the ids of relations and people,
+    except for rich texts whose content, links and formatting are all
+    compared. Returns `False` when the current value can't be decoded
+    from the page object.
+
+    Args:
+        prop: Current property value as returned by Notion.
+        value: New value of the property, generated for the type of
+            `prop`.
+    """
+    prop_type = prop["type"]
+    decoder = VALUE_DECODERS.get(prop_type)
+    if decoder is None or prop.get("has_more"):
+        return False
+
+    if prop_type == "relation":
+        return [
+            _normalize_id(relation["id"]) for relation in prop["relation"]
+        ] == [_normalize_id(relation_id) for relation_id in value.value]
+
+    if prop_type in ("title", "rich_text"):
+        return [
+            _rich_text_content(element) for element in prop[prop_type]
+        ] == [
+            _rich_text_content(element.dict(by_alias=True))
+            for element in getattr(value, prop_type)
+        ]
+
+    if prop_type == "people":
+        return [_normalize_id(user["id"]) for user in prop["people"]] == [
+            _normalize_id(user.user_id) for user in value.people
+        ]
+
+    return decoder(prop) == value.value
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 from pydantic.v1 import (
     BaseModel,
@@ -125,14 +125,26 @@ class PropertyFilter(BaseFilter):
     filter_property: Optional[str] = propertyField
 
 
+class TitleFilter(PropertyFilter):
+    title: TextFilterCondition
+
+
 class RichTextFilter(PropertyFilter):
     rich_text: TextFilterCondition
 
 
+class EmailFilter(PropertyFilter):
+    email: TextFilterCondition
+
+
 class PhoneNumberFilter(PropertyFilter):
     phone_number: TextFilterCondition
 
 
+class UrlFilter(PropertyFilter):
+    url: TextFilterCondition
+
+
 class NumberFilter(PropertyFilter):
     number: NumberFilterCondition
 
@@ -177,6 +189,10 @@ class RollupFilter(PropertyFilter):
     rollup: RollupFilterCondition
 
 
+class UniqueIdFilter(PropertyFilter):
+    unique_id: NumberFilterCondition
+
+
 class TimestampFilter(BaseFilter):
     timestamp: str
 
@@ -200,6 +216,46 @@ class OrFilter(BaseModel):
     filter_or: List[FilterItem] = orField
 
 
+# Filters of the property types that can be matched with `equals`. These
+# are also the types of the key properties of `upsert` and `upsert_many`.
+EQUALS_FILTERS: Dict[str, Type[PropertyFilter]] = {
+    "title": TitleFilter,
+    "rich_text": RichTextFilter,
+    "email": EmailFilter,
+    "phone_number": PhoneNumberFilter,
+    "url": UrlFilter,
+    "number": NumberFilter,
+    "unique_id": UniqueIdFilter,
+    "checkbox": CheckboxFilter,
+    "select": SelectFilter,
+    "status": StatusFilter,
+}
+
+
+def equals_filter(
+    filter_property: str, property_type: str, value: Any
+) -> PropertyFilter:
+    """Creates a filter matching pages where a property equals a value.
+
+    Args:
+        filter_property: Name or id of the property.
+        property_type: Type of the property. Must be title, rich_text,
+            email, phone_number, url, number, unique_id, checkbox, select
+            or status.
+        value: Value to match. Unique ids are matched by their number.
+
+    Raises:
+        ValueError: If properties of the given type can't be matched.
+    """
+    filter_cls = EQUALS_FILTERS.get(property_type)
+    if filter_cls is None:
+        raise ValueError(
+            f"Can't filter {property_type} properties by equality, only "
+            f"{', '.join(EQUALS_FILTERS)} properties"
+        )
+    return filter_cls(property=filter_property, equals=value)
+
+
 def or_filter(filters: List[FilterItem]):
     """
     Combine filters with an OR condition.
@@ -1,7 +1,5 @@
-from python_notion_api.models.blocks import Block
 from python_notion_api.models.common import DateObject
 from python_notion_api.models.properties import PropertyItem
-from python_notion_api.utils import get_derived_class
 
 
 class PropertyItemIterator:
@@ -25,9 +23,7 @@ class PropertyItemIterator:
         return self._value
 
     def _get_value(self):
-        prop_cls = get_derived_class(
-            PropertyItem, PropertyItem._class_map.get(self.property_type)
-        )
+        prop_cls = PropertyItem.get_class(self.property_type)
         return prop_cls(
             id=self.property_id,
             init=[
@@ -52,10 +48,10 @@ class RollupPropertyItemIterator(PropertyItemIterator):
             raise ValueError("Got an unsupported rollup. Sorry")
         elif prop_type == "array":
             return [
-                get_derived_class(
-                    PropertyItem,
-                    PropertyItem._class_map.get(item.property_type),
-                )(id=self.property_id, init=getattr(item, item.property_type))
+                PropertyItem.get_class(item.property_type)(
+                    id=self.property_id,
+                    init=getattr(item, item.property_type),
+                )
                 for item in items
             ]
         elif prop_type == "number":
@@ -89,4 +85,4 @@ class BlockIterator:
         next_block = next(self.generator)
         if isinstance(next_block, tuple):
             next_block = next_block[0]
-        return Block.from_obj(next_block.dict(by_alias=True))
+        return next_block
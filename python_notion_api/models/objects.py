@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import ClassVar, Dict, List, Literal, Optional, Union
+from typing import ClassVar, Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic.v1 import (
     BaseModel,
@@ -19,38 +19,88 @@ from python_notion_api.models.common import (
 from python_notion_api.models.fields import idField, objectField, typeField
 from python_notion_api.utils import get_derived_class
 
+# Derived classes keyed by the base class and the value of its
+# discriminator key.
+_class_registry: Dict[Tuple[type, str], type] = {}
+
 
 class NotionObjectBase(BaseModel):
     _class_map: ClassVar[Dict[str, str]]
+    # Path in the raw object to the key of `_class_map`. `None` if the class
+    # has no derived classes to dispatch to.
+    _class_key_path: ClassVar[Optional[Tuple[str, ...]]] = None
 
     @classmethod
     def from_obj(cls, obj):
+        derived_cls = cls._resolve_class(obj)
+
         try:
-            temp_obj = cls(**obj)
+            return derived_cls(**obj)
         except Exception as e:
-            raise Exception(f"Failed to create {cls} object from {obj}") from e
+            raise Exception(
+                f"Failed to create {derived_cls} object from {obj}"
+            ) from e
 
-        class_key_value = temp_obj._class_key_field
-        if class_key_value is None:
-            return temp_obj
+    @classmethod
+    def _resolve_class(cls, obj):
+        """Finds the most derived class for a raw object.
+
+        The class is picked by looking up the discriminator keys in the
+        raw object, so the object only needs to be validated once.
+
+        Args:
+            obj: Raw object as returned by Notion.
+        """
+        resolved_cls = cls
+        while resolved_cls._class_key_path is not None:
+            class_key_value = obj
+            for key in resolved_cls._class_key_path:
+                if not isinstance(class_key_value, dict):
+                    class_key_value = None
+                    break
+                class_key_value = class_key_value.get(key)
+
+            if class_key_value is None:
+                break
+
+            derived_cls = resolved_cls.get_class(class_key_value)
+            if derived_cls is None:
+                raise ValueError(
+                    f"Unknown object\n"
+                    f"{'.'.join(resolved_cls._class_key_path)}: "
+                    f"'{class_key_value}'"
+                )
+
+            resolved_cls = derived_cls
+
+        return resolved_cls
+
+    @classmethod
+    def get_class(cls, class_key_value: str):
+        """Gets the derived class for a value of the discriminator key.
+
+        Args:
+            class_key_value: Value of the discriminator key, e.g. the
+                property type for property items.
+
+        Returns:
+            The derived class or `None` if the value is unknown.
+        """
+        key = (cls, class_key_value)
+        derived_cls = _class_registry.get(key)
+        if derived_cls is not None:
+            return derived_cls
 
         class_name = cls._class_map.get(class_key_value, None)
         if class_name is None:
-            raise ValueError(
-                f"Unknown object\n"
-                f"{temp_obj._class_key_field}: '{class_key_value}'"
-            )
+            return None
 
         derived_cls = get_derived_class(cls, class_name)
-
         if derived_cls is None:
             raise ValueError(f"Cannot find {class_name}({cls.__name__})")
 
-        return derived_cls.from_obj(obj)
-
-    @property
-    def _class_key_field(self):
-        return None
+        _class_registry[key] = derived_cls
+        return derived_cls
 
 
 class NotionObject(NotionObjectBase, extra=Extra.allow):
@@ -65,13 +115,11 @@ class NotionObject(NotionObjectBase, extra=Extra.allow):
         "block": "Block",
     }
 
-    @property
-    def _class_key_field(self):
-        return self.notion_object
+    _class_key_path = ("object",)
 
 
 class User(NotionObject):
-    _class_key_field = None
+    _class_key_path = None
 
     user_id: Optional[str] = idField
     user_type: Optional[Literal["person", "bot"]] = typeField
@@ -113,13 +161,11 @@ class Pagination(NotionObject):
         "page_or_database": "PageOrDatabasePagination",
     }
 
-    @property
-    def _class_key_field(self):
-        return self.pagination_type
+    _class_key_path = ("type",)
 
 
 class Database(NotionObject):
-    _class_key_field = None
+    _class_key_path = None
 
     db_object: str = objectField
     db_id: str = idField
@@ -139,7 +185,7 @@ class Database(NotionObject):
 
 
 class Page(NotionObject):
-    _class_key_field = None
+    _class_key_path = None
 
     page_object: str = objectField
     page_id: str = idField
@@ -234,9 +280,7 @@ class Block(NotionObject):
     has_children: Optional[bool]
     archived: Optional[bool]
 
-    @property
-    def _class_key_field(self):
-        return self.block_type
+    _class_key_path = ("type",)
 
     @root_validator(pre=True)
     def validate_block(cls, values):
@@ -1,32 +1,42 @@
 from typing import Dict, List, Union
 
+from pydantic.v1 import validator
+
 from python_notion_api.models.objects import Block, Database, Page, Pagination
 from python_notion_api.models.properties import PropertyItem
 
 
 class PagePagination(Pagination):
-    _class_key_field = None
+    _class_key_path = None
 
     page: Dict
     results: List[Page]
 
 
 class PageOrDatabasePagination(Pagination):
-    _class_key_field = None
+    _class_key_path = None
 
     page_or_database: Dict
     results: List[Union[Page, Database]]
 
 
 class PropertyItemPagination(Pagination):
-    _class_key_field = None
+    _class_key_path = None
 
     property_item: Dict
     results: List[PropertyItem]
 
 
 class BlockPagination(Pagination):
-    _class_key_field = None
+    _class_key_path = None
 
     block: Dict
     results: List[Block]
+
+    @validator("results", pre=True)
+    def validate_results(cls, value):
+        # Parse each block as its derived class, e.g. `ParagraphBlock`
+        return [
+            Block.from_obj(obj) if isinstance(obj, dict) else obj
+            for obj in value
+        ]
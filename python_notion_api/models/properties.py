@@ -58,111 +58,109 @@ class PropertyItem(NotionObject, PropertyValue):
         "unique_id": "UniqueIDPropertyItem",
     }
 
-    @property
-    def _class_key_field(self):
-        return self.property_type
+    _class_key_path = ("type",)
 
 
 class TitlePropertyItem(PropertyItem, TitlePropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="title")
 
 
 class RichTextPropertyItem(PropertyItem, RichTextPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="rich_text")
 
 
 class NumberPropertyItem(PropertyItem, NumberPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="number")
 
 
 class SelectPropertyItem(PropertyItem, SelectPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="select")
 
 
 class StatusPropertyItem(PropertyItem, StatusPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="status")
 
 
 class MultiSelectPropertyItem(PropertyItem, MultiSelectPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="multi_select")
 
 
 class DatePropertyItem(PropertyItem, DatePropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="date")
 
 
 class RelationPropertyItem(PropertyItem, RelationPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="relation")
 
 
 class PeoplePropertyItem(PropertyItem, PeoplePropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="people")
 
 
 class FilesPropertyItem(PropertyItem, FilesPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="files")
 
 
 class CheckBoxPropertyItem(PropertyItem, CheckBoxPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="checkbox")
 
 
 class URLPropertyItem(PropertyItem, URLPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="url")
 
 
 class EmailPropertyItem(PropertyItem, EmailPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="email")
 
 
 class PhoneNumberPropertyItem(PropertyItem, PhoneNumberPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="phone_number")
 
 
 class FormulaPropertyItem(PropertyItem, FormulaPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="formula")
 
 
 class CreatedTimePropertyItem(PropertyItem, CreatedTimePropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="created_time")
 
 
 class CreatedByPropertyItem(PropertyItem, CreatedByPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="created_by")
 
 
 class LastEditedTimePropertyItem(PropertyItem, LastEditedTimePropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="last_edited_time")
 
 
 class LastEditedByPropertyItem(PropertyItem, LastEditedByPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="last_edited_by")
 
 
 class RollupPropertyItem(PropertyItem, RollupPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="rollup")
 
 
 class UniqueIDPropertyItem(PropertyItem, UniqueIDPropertyValue):
-    _class_key_field = None
+    _class_key_path = None
     property_type: str = Field(alias="type", default="unique_id")
@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from python_notion_api.models.configurations import (
+    NotionPropertyConfiguration,
+)
+from python_notion_api.models.extractors import VALUE_DECODERS, extract_value
+
+
+class RowSchema:
+    """Property layout shared by the compact rows of a database.
+
+    Holds the property names, their position in the rows and the decoder
+    of each property, so that rows only need to store their values.
+
+    Args:
+        properties: Property configurations of the database.
+        names: Names of the properties to store. If `None`, stores all
+            properties.
+    """
+
+    __slots__ = ("names", "_index", "_decoders")
+
+    def __init__(
+        self,
+        properties: Dict[str, NotionPropertyConfiguration],
+        names: Optional[List[str]] = None,
+    ):
+        if names is None:
+            names = list(properties)
+
+        self.names: Tuple[str, ...] = tuple(names)
+        self._index: Dict[str, int] = {}
+        self._decoders: List[Tuple[str, Callable[[Dict], Any]]] = []
+
+        for i, prop_name in enumerate(self.names):
+            config = properties[prop_name]
+            self._index.setdefault(config.config_id, i)
+            self._decoders.append(
+                (
+                    config.config_type,
+                    VALUE_DECODERS.get(config.config_type, extract_value),
+                )
+            )
+        # Names take precedence over ids that happen to look the same
+        self._index.update((name, i) for i, name in enumerate(self.names))
+
+    def index(self, prop_key: str) -> int:
+        """Gets the position of a property in the rows.
+
+        Args:
+            prop_key: Name or id of the property.
+        """
+        try:
+            return self._index[prop_key]
+        except KeyError:
+            raise KeyError(prop_key) from None
+
+    def decode(self, properties: Dict[str, Dict]) -> Tuple[Any, ...]:
+        """Decodes the values of page properties in schema order.
+
+        Args:
+            properties: Properties of a page object as returned by Notion.
+        """
+        values = []
+        for prop_name, (prop_type, decoder) in zip(self.names, self._decoders):
+            prop = properties.get(prop_name)
+            if prop is None:
+                values.append(None)
+            elif prop["type"] != prop_type:
+                # The page might not match a cached schema
+                values.append(extract_value(prop))
+            else:
+                values.append(decoder(prop))
+        return tuple(values)
+
+
+class CompactRow:
+    """Read-only row of a database query.
+
+    Only stores the page id and a tuple of property values, the property
+    names are kept in a `RowSchema` shared by all rows of a query. Values
+    are the same as the ones returned by `NotionPage.to_dict`, except for
+    formulas and rollups, which are taken from the page object as plain
+    values, and relations, people and rollups which are truncated to 25
+    items in query results.
+
+    Args:
+        schema: Schema of the row.
+        page_id: Id of the page.
+        values: Property values in schema order.
+    """
+
+    __slots__ = ("_schema", "_page_id", "_values")
+
+    def __init__(
+        self, schema: RowSchema, page_id: str, values: Tuple[Any, ...]
+    ):
+        object.__setattr__(self, "_schema", schema)
+        object.__setattr__(self, "_page_id", page_id)
+        object.__setattr__(self, "_values", values)
+
+    @classmethod
+    def from_page(cls, schema: RowSchema, page: Dict) -> "CompactRow":
+        """Creates a row from a raw page.
+
+        Args:
+            schema: Schema of the row.
+            page: Page object as returned by Notion, e.g. by
+                `query(raw=True)`.
+        """
+        return cls(schema, page["id"], schema.decode(page["properties"]))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, prop_key: str) -> Any:
+        return self._values[self._schema.index(prop_key)]
+
+    def __contains__(self, prop_key: str) -> bool:
+        return prop_key in self._schema._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.names)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._page_id!r}, {self.to_dict()!r})"
+
+    @property
+    def page_id(self) -> str:
+        """Gets the page id."""
+        return self._page_id.replace("-", "")
+
+    def get(self, prop_key: str, default: Any = None) -> Any:
+        """Gets the value of a property.
+
+        Args:
+            prop_key: Name or id of the property.
+            default: Value to return if the row doesn't have the property.
+        """
+        index = self._schema._index.get(prop_key)
+        return default if index is None else self._values[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns all properties of the row as a dict."""
+        return dict(zip(self._schema.names, self._values))
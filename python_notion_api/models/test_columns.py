@@ -0,0 +1,176 @@
+import math
+from datetime import datetime, timezone
+
+from pytest import fixture, importorskip
+
+from python_notion_api.models.columns import (
+    _NAT,
+    BooleanColumn,
+    CategoryColumn,
+    Column,
+    Columns,
+    DatetimeColumn,
+    NumberColumn,
+)
+from python_notion_api.models.configurations import (
+    NotionPropertyConfiguration,
+)
+
+
+def config(name, prop_type):
+    return NotionPropertyConfiguration.from_obj(
+        {"id": name, "name": name, "type": prop_type, prop_type: {}}
+    )
+
+
+def number(value):
+    return {"id": "n", "type": "number", "number": value}
+
+
+def date(start):
+    value = None if start is None else {"start": start, "end": None}
+    return {"id": "d", "type": "date", "date": value}
+
+
+def select(name):
+    value = None if name is None else {"id": "o", "name": name}
+    return {"id": "s", "type": "select", "select": value}
+
+
+@fixture
+def columns():
+    columns = Columns(
+        {
+            "Number": config("Number", "number"),
+            "Check": config("Check", "checkbox"),
+            "Date": config("Date", "date"),
+            "Select": config("Select", "select"),
+            "Email": config("Email", "email"),
+        }
+    )
+    for i, (value, day, option) in enumerate(
+        [(1.5, "2024-01-02", "a"), (None, None, None), (3, "2024-01-03", "b")]
+    ):
+        columns.append(
+            {
+                "id": f"page{i}",
+                "properties": {
+                    "Number": number(value),
+                    "Check": {"id": "c", "type": "checkbox", "checkbox": True},
+                    "Date": date(day),
+                    "Select": select(option),
+                    "Email": {"id": "e", "type": "email", "email": "a@b.c"},
+                },
+            }
+        )
+    # Page without the properties, e.g. from a projected query
+    columns.append({"id": "page3", "properties": {}})
+    return columns
+
+
+def test_column_classes(columns):
+    assert type(columns["Number"]) is NumberColumn
+    assert type(columns["Check"]) is BooleanColumn
+    assert type(columns["Date"]) is DatetimeColumn
+    assert type(columns["Select"]) is CategoryColumn
+    assert type(columns["Email"]) is Column
+
+
+def test_number_nan_is_missing():
+    column = NumberColumn()
+    for value in (1, None, 2.5):
+        column.append(number(value))
+    column.append(None)
+
+    assert math.isnan(column._values[1])
+    assert column.to_list() == [1.0, None, 2.5, None]
+
+
+def test_datetime_nat_is_missing():
+    column = DatetimeColumn()
+    column.append(date(None))
+    column.append(None)
+
+    assert list(column._values) == [_NAT, _NAT]
+    assert column.to_list() == [None, None]
+
+
+def test_naive_datetime_is_utc():
+    column = DatetimeColumn()
+    column.append(date("2024-01-02T10:00:00"))
+    column.append(date("2024-01-02T11:00:00.000+01:00"))
+    column.append(date("2024-01-02"))
+
+    assert column.to_list() == [
+        datetime(2024, 1, 2, 10, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, 10, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, tzinfo=timezone.utc),
+    ]
+
+
+def test_datetime_raw_value():
+    column = DatetimeColumn()
+    column.append(
+        {
+            "id": "ct",
+            "type": "created_time",
+            "created_time": "2024-01-01T00:00:00.000Z",
+        }
+    )
+    assert column.to_list() == [datetime(2024, 1, 1, tzinfo=timezone.utc)]
+
+
+def test_category_codes():
+    column = CategoryColumn()
+    for name in ("b", "a", None, "b"):
+        column.append(select(name))
+
+    assert list(column._values) == [0, 1, -1, 0]
+    assert column.to_list() == ["b", "a", None, "b"]
+
+
+def test_to_dict(columns):
+    assert columns.page_ids == ["page0", "page1", "page2", "page3"]
+    assert columns.to_dict() == {
+        "Number": [1.5, None, 3.0, None],
+        "Check": [True, True, True, None],
+        "Date": [
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+            None,
+            datetime(2024, 1, 3, tzinfo=timezone.utc),
+            None,
+        ],
+        "Select": ["a", None, "b", None],
+        "Email": ["a@b.c", "a@b.c", "a@b.c", None],
+    }
+
+
+def test_to_arrow(columns):
+    pa = importorskip("pyarrow")
+    table = columns.to_arrow()
+
+    assert table.schema.field("Number").type == pa.float64()
+    assert table.schema.field("Check").type == pa.bool_()
+    assert table.schema.field("Date").type == pa.timestamp("us", tz="UTC")
+    assert table.schema.field("Select").type == pa.dictionary(
+        pa.int32(), pa.string()
+    )
+    assert table.column("Number").null_count == 2
+    assert table.column("Date").null_count == 2
+    assert table.column("Select").null_count == 2
+    assert table.column("Select").to_pylist() == ["a", None, "b", None]
+
+
+def test_to_pandas(columns):
+    pd = importorskip("pandas")
+    frame = columns.to_pandas()
+
+    assert frame.index.name == "page_id"
+    assert list(frame.index) == columns.page_ids
+    assert frame["Number"].dtype == "float64"
+    assert str(frame["Date"].dtype) == "datetime64[us, UTC]"
+    assert isinstance(frame["Select"].dtype, pd.CategoricalDtype)
+    assert list(frame["Select"].cat.categories) == ["a", "b"]
+    assert frame["Number"].isna().tolist() == [False, True, False, True]
+    assert frame["Date"].isna().tolist() == [False, True, False, True]
+    assert frame["Select"].isna().tolist() == [False, True, False, True]
@@ -0,0 +1,256 @@
+from datetime import date
+
+from pytest import mark
+
+from python_notion_api.models.common import (
+    LinkObject,
+    RichTextObject,
+    TextObject,
+)
+from python_notion_api.models.configurations import (
+    NotionPropertyConfiguration,
+)
+from python_notion_api.models.extractors import (
+    VALUE_DECODERS,
+    RowDecoder,
+    is_unchanged,
+)
+from python_notion_api.models.properties import PropertyItem
+from python_notion_api.models.values import PropertyValue, generate_value
+
+USER = {"object": "user", "id": "fa9e1df9-7c24-427c-9c20-eac629565fe4"}
+NAMED_USER = {**USER, "name": "Ada", "type": "person", "person": {}}
+
+
+def rich_text(text):
+    return {
+        "type": "text",
+        "plain_text": text,
+        "href": None,
+        "annotations": {},
+        "text": {"content": text, "link": None},
+    }
+
+
+def option(name):
+    return {"id": "opt", "name": name, "color": "red"}
+
+
+# Raw property values for every decoded type, filled and empty
+RAW_PROPERTIES = {
+    "title": [[rich_text("Foo"), rich_text(" bar")], []],
+    "rich_text": [[rich_text("Some text")], []],
+    "number": [12.5, 3, None],
+    "select": [option("foo"), None],
+    "status": [option("Done"), None],
+    "multi_select": [[option("foo"), option("bar")], []],
+    "date": [
+        {"start": "2024-01-02", "end": None, "time_zone": None},
+        {
+            "start": "2024-01-02T10:00:00.000+01:00",
+            "end": "2024-01-03T10:00:00.000+01:00",
+            "time_zone": None,
+        },
+        None,
+    ],
+    "people": [[NAMED_USER], []],
+    "files": [
+        [
+            {
+                "name": "foo.pdf",
+                "type": "external",
+                "external": {"url": "http://example.com/file"},
+            },
+            {
+                "name": "bar.png",
+                "type": "file",
+                "file": {
+                    "url": "http://example.com/bar",
+                    "expiry_time": "2024-01-01T00:00:00.000Z",
+                },
+            },
+        ],
+        [],
+    ],
+    "checkbox": [True, False],
+    "url": ["http://colorifix.com", None],
+    "email": ["admin@colorifix.com", None],
+    "phone_number": ["079847364088", None],
+    "relation": [[{"id": "d5bce0a0-fe62-48d0-a120-c6c693d9b597"}], []],
+    "created_time": ["2024-01-01T00:00:00.000Z"],
+    "created_by": [NAMED_USER],
+    "last_edited_time": ["2024-01-01T00:00:00.000Z"],
+    "last_edited_by": [NAMED_USER],
+    "unique_id": [{"prefix": "X", "number": 3}],
+}
+
+CASES = [
+    (prop_type, {"id": "abc", "type": prop_type, prop_type: value})
+    for prop_type, values in RAW_PROPERTIES.items()
+    for value in values
+]
+
+
+def test_all_decoders_covered():
+    assert set(RAW_PROPERTIES) == set(VALUE_DECODERS)
+
+
+@mark.parametrize("prop_type,prop", CASES)
+def test_decoder_matches_property_value(prop_type, prop):
+    expected = PropertyValue.from_property_item(
+        PropertyItem.from_obj(prop)
+    ).value
+    assert VALUE_DECODERS[prop_type](prop) == expected
+
+
+def test_row_decoder():
+    configurations = {
+        "Name": NotionPropertyConfiguration.from_obj(
+            {"id": "title", "name": "Name", "type": "title", "title": {}}
+        ),
+        "Number": NotionPropertyConfiguration.from_obj(
+            {"id": "n1", "name": "Number", "type": "number", "number": {}}
+        ),
+        "Formula": NotionPropertyConfiguration.from_obj(
+            {
+                "id": "f1",
+                "name": "Formula",
+                "type": "formula",
+                "formula": {"expression": "1"},
+            }
+        ),
+        "Rel": NotionPropertyConfiguration.from_obj(
+            {
+                "id": "r1",
+                "name": "Rel",
+                "type": "relation",
+                "relation": {"database_id": "abc"},
+            }
+        ),
+    }
+    properties = {
+        "Name": {"id": "title", "type": "title", "title": [rich_text("A")]},
+        # Doesn't match the schema
+        "Number": {"id": "n1", "type": "rich_text", "rich_text": []},
+        "Formula": {
+            "id": "f1",
+            "type": "formula",
+            "formula": {"type": "number", "number": 1},
+        },
+        "Rel": {
+            "id": "r1",
+            "type": "relation",
+            "relation": [{"id": "a"}],
+            "has_more": True,
+        },
+    }
+
+    decoder = RowDecoder(configurations)
+    assert decoder.decode(properties) == {"Name": "A"}
+    assert decoder.decode(properties, names=["Formula"]) == {}
+
+
+def prop(prop_type, value):
+    return {"id": "abc", "type": prop_type, prop_type: value}
+
+
+def formatted(text, **annotations):
+    element = RichTextObject.from_str(text)
+    element.annotations = annotations
+    return element
+
+
+def linked(text, url):
+    return RichTextObject(
+        plain_text=text,
+        type="text",
+        text=TextObject(content=text, link=LinkObject(url=url)),
+    )
+
+
+DEFAULT_ANNOTATIONS = {
+    "bold": False,
+    "italic": False,
+    "strikethrough": False,
+    "underline": False,
+    "code": False,
+    "color": "default",
+}
+
+
+@mark.parametrize(
+    "current,new,unchanged",
+    [
+        (prop("number", 3), 3, True),
+        (prop("number", 3), 3.5, False),
+        (prop("number", None), None, True),
+        (prop("select", option("foo")), "foo", True),
+        (prop("select", option("foo")), "bar", False),
+        (prop("select", None), "foo", False),
+        (
+            prop("date", {"start": "2024-01-02", "end": None}),
+            date(2024, 1, 2),
+            True,
+        ),
+        (
+            prop("date", {"start": "2024-01-02", "end": None}),
+            date(2024, 1, 3),
+            False,
+        ),
+        (
+            prop(
+                "relation",
+                [{"id": "d5bce0a0-fe62-48d0-a120-c6c693d9b597"}],
+            ),
+            ["d5bce0a0fe6248d0a120c6c693d9b597"],
+            True,
+        ),
+        (
+            prop("relation", [{"id": "d5bce0a0fe6248d0a120c6c693d9b597"}]),
+            ["d5bce0a0-fe62-48d0-a120-c6c693d9b597", "abc"],
+            False,
+        ),
+        (prop("people", [NAMED_USER]), [USER["id"].replace("-", "")], True),
+        (prop("people", [NAMED_USER]), [], False),
+        (
+            prop(
+                "rich_text",
+                [{**rich_text("Foo"), "annotations": DEFAULT_ANNOTATIONS}],
+            ),
+            "Foo",
+            True,
+        ),
+        (prop("rich_text", [rich_text("Foo")]), "Bar", False),
+        (
+            prop("rich_text", [rich_text("Foo")]),
+            [formatted("Foo", bold=True)],
+            False,
+        ),
+        (
+            prop(
+                "title",
+                [
+                    {
+                        **rich_text("Foo"),
+                        "annotations": {**DEFAULT_ANNOTATIONS, "bold": True},
+                    }
+                ],
+            ),
+            [formatted("Foo", bold=True)],
+            True,
+        ),
+        (
+            prop("title", [rich_text("Foo")]),
+            [linked("Foo", "http://example.com")],
+            False,
+        ),
+    ],
+)
+def test_is_unchanged(current, new, unchanged):
+    value = generate_value(current["type"], new)
+    assert is_unchanged(current, value) is unchanged
+
+
+def test_is_unchanged_incomplete():
+    current = {**prop("relation", [{"id": "abc"}]), "has_more": True}
+    assert not is_unchanged(current, generate_value("relation", ["abc"]))
@@ -0,0 +1,36 @@
+from pytest import mark, raises
+
+from python_notion_api.models.extractors import KEY_TYPES
+from python_notion_api.models.filters import equals_filter
+
+
+@mark.parametrize(
+    "property_type,value",
+    [
+        ("title", "Page"),
+        ("rich_text", "Text"),
+        ("email", "ada@example.com"),
+        ("phone_number", "+44 1234"),
+        ("url", "https://example.com"),
+        ("number", 1.5),
+        ("unique_id", 3),
+        ("checkbox", True),
+        ("select", "Option"),
+        ("status", "Done"),
+    ],
+)
+def test_equals_filter(property_type, value):
+    assert property_type in KEY_TYPES
+    assert equals_filter("Key", property_type, value).dict(
+        by_alias=True, exclude_unset=True
+    ) == {"property": "Key", property_type: {"equals": value}}
+
+
+def test_equals_filter_key_types():
+    for property_type in KEY_TYPES:
+        equals_filter("Key", property_type, None)
+
+
+def test_equals_filter_unsupported_type():
+    with raises(ValueError, match="Can't filter date properties"):
+        equals_filter("Key", "date", "2024-01-01")
@@ -0,0 +1,148 @@
+from typing import ClassVar, Dict
+
+from pytest import mark, raises
+
+from python_notion_api.models import objects
+from python_notion_api.models.blocks import (
+    CalloutBlock,
+    EmojiCalloutBlock,
+    FileCalloutBlock,
+    ParagraphBlock,
+)
+from python_notion_api.models.configurations import (
+    NotionPropertyConfiguration,
+    RelationPropertyConfiguration,
+    SinglePropertyConfiguration,
+)
+from python_notion_api.models.objects import (
+    Block,
+    Database,
+    NotionObject,
+    NotionObjectBase,
+)
+
+
+class Shape(NotionObjectBase):
+    _class_map: ClassVar[Dict[str, str]] = {
+        "circle": "Circle",
+        "missing": "Missing",
+    }
+    _class_key_path = ("shape",)
+
+
+class Circle(Shape):
+    _class_key_path = None
+
+
+def test_get_class():
+    assert NotionObject.get_class("database") is Database
+    assert NotionObject.get_class("block") is Block
+    assert Block.get_class("paragraph") is ParagraphBlock
+
+
+def test_get_class_memoized(monkeypatch):
+    assert Shape.get_class("circle") is Circle
+    assert objects._class_registry[(Shape, "circle")] is Circle
+
+    def fail(base_class, derived_class_name):
+        raise AssertionError("Not memoized")
+
+    monkeypatch.setattr(objects, "get_derived_class", fail)
+    assert Shape.get_class("circle") is Circle
+
+
+def test_get_class_unknown_value():
+    assert Shape.get_class("square") is None
+    assert (Shape, "square") not in objects._class_registry
+
+
+def test_get_class_missing_class():
+    with raises(ValueError, match="Cannot find Missing"):
+        Shape.get_class("missing")
+
+
+@mark.parametrize(
+    "obj,cls",
+    [
+        ({"object": "database"}, Database),
+        ({"object": "block", "type": "paragraph"}, ParagraphBlock),
+        (
+            {
+                "object": "block",
+                "type": "callout",
+                "callout": {"icon": {"type": "emoji"}},
+            },
+            EmojiCalloutBlock,
+        ),
+        (
+            {
+                "object": "block",
+                "type": "callout",
+                "callout": {"icon": {"type": "file"}},
+            },
+            FileCalloutBlock,
+        ),
+        # Missing or null keys on the path stop at the current class
+        ({"object": "block", "type": "callout", "callout": {}}, CalloutBlock),
+        (
+            {"object": "block", "type": "callout", "callout": {"icon": None}},
+            CalloutBlock,
+        ),
+        ({"object": "block"}, Block),
+        ({}, NotionObject),
+    ],
+)
+def test_resolve_class(obj, cls):
+    assert NotionObject._resolve_class(obj) is cls
+
+
+def test_resolve_class_nested_path():
+    config = {
+        "id": "r1",
+        "name": "Rel",
+        "type": "relation",
+        "relation": {"type": "single_property"},
+    }
+    assert (
+        NotionPropertyConfiguration._resolve_class(config)
+        is SinglePropertyConfiguration
+    )
+    assert (
+        RelationPropertyConfiguration._resolve_class(config)
+        is SinglePropertyConfiguration
+    )
+
+
+def test_resolve_class_path_through_non_dict():
+    obj = {"type": "relation", "relation": "single_property"}
+    assert (
+        NotionPropertyConfiguration._resolve_class(obj)
+        is RelationPropertyConfiguration
+    )
+
+
+def test_resolve_class_unknown_value():
+    obj = {
+        "object": "block",
+        "type": "callout",
+        "callout": {"icon": {"type": "video"}},
+    }
+    with raises(ValueError, match="callout.icon.type: 'video'"):
+        NotionObject._resolve_class(obj)
+
+
+def test_from_obj_nested_path():
+    config = NotionPropertyConfiguration.from_obj(
+        {
+            "id": "r1",
+            "name": "Rel",
+            "type": "relation",
+            "relation": {
+                "database_id": "db",
+                "type": "single_property",
+                "single_property": {},
+            },
+        }
+    )
+    assert type(config) is SinglePropertyConfiguration
+    assert config.relation.database_id == "db"
@@ -0,0 +1,128 @@
+from pytest import fixture, raises
+
+from python_notion_api.models.configurations import (
+    NotionPropertyConfiguration,
+)
+from python_notion_api.models.rows import CompactRow, RowSchema
+
+
+def config(prop_id, name, prop_type, value=None):
+    return NotionPropertyConfiguration.from_obj(
+        {
+            "id": prop_id,
+            "name": name,
+            "type": prop_type,
+            prop_type: value or {},
+        }
+    )
+
+
+def rich_text(text):
+    return {"type": "text", "plain_text": text, "text": {"content": text}}
+
+
+PROPERTIES = {
+    "Name": config("title", "Name", "title"),
+    "Number": config("n1", "Number", "number"),
+    "Formula": config("f1", "Formula", "formula", {"expression": "1"}),
+    "Rollup": config(
+        "r1",
+        "Rollup",
+        "rollup",
+        {
+            "relation_property_name": "Rel",
+            "relation_property_id": "rel",
+            "rollup_property_name": "Number",
+            "rollup_property_id": "n1",
+            "function": "show_original",
+        },
+    ),
+}
+
+PAGE = {
+    "id": "d5bce0a0-fe62-48d0-a120-c6c693d9b597",
+    "properties": {
+        "Name": {"id": "title", "type": "title", "title": [rich_text("A")]},
+        "Number": {"id": "n1", "type": "number", "number": 3},
+        "Formula": {
+            "id": "f1",
+            "type": "formula",
+            "formula": {"type": "string", "string": "foo"},
+        },
+        "Rollup": {
+            "id": "r1",
+            "type": "rollup",
+            "rollup": {
+                "type": "array",
+                "array": [{"type": "number", "number": 1}],
+            },
+        },
+    },
+}
+
+
+@fixture
+def schema():
+    return RowSchema(PROPERTIES)
+
+
+@fixture
+def row(schema):
+    return CompactRow.from_page(schema, PAGE)
+
+
+def test_values(row):
+    assert row.to_dict() == {
+        "Name": "A",
+        "Number": 3.0,
+        "Formula": "foo",
+        "Rollup": [1],
+    }
+    assert row.page_id == "d5bce0a0fe6248d0a120c6c693d9b597"
+    assert len(row) == 4
+    assert list(row) == ["Name", "Number", "Formula", "Rollup"]
+
+
+def test_get_by_name_or_id(row):
+    assert row["Number"] == 3.0
+    assert row["n1"] == 3.0
+    assert row["title"] == "A"
+    assert "f1" in row
+    assert "Missing" not in row
+    assert row.get("Missing", 1) == 1
+    with raises(KeyError):
+        row["Missing"]
+
+
+def test_read_only(row):
+    with raises(AttributeError):
+        row.page_id = "abc"
+    with raises(AttributeError):
+        row._values = ()
+    with raises(TypeError):
+        row["Number"] = 1
+
+
+def test_projected_schema():
+    schema = RowSchema(PROPERTIES, names=["Number"])
+    row = CompactRow.from_page(schema, PAGE)
+    assert row.to_dict() == {"Number": 3.0}
+    assert "Name" not in row
+
+
+def test_schema_mismatch(schema):
+    page = {
+        "id": "abc",
+        "properties": {
+            "Number": {"id": "n1", "type": "rich_text", "rich_text": []},
+        },
+    }
+    row = CompactRow.from_page(schema, page)
+    assert row["Number"] == ""
+    assert row["Name"] is None
+
+
+def test_shared_schema(schema):
+    rows = [CompactRow.from_page(schema, PAGE) for _ in range(2)]
+    assert rows[0]._schema is rows[1]._schema
+    assert not hasattr(rows[0], "__dict__")
@@ -0,0 +1,118 @@
+from datetime import date, datetime, timezone
+
+from pytest import mark
+
+from python_notion_api.models.common import (
+    DateObject,
+    File,
+    FormulaObject,
+    RelationObject,
+    RichTextObject,
+    SelectObject,
+    StatusObject,
+    UniqueIDObject,
+)
+from python_notion_api.models.objects import User
+from python_notion_api.models.values import generate_value, get_value_class
+
+USER_ID = "fa9e1df9-7c24-427c-9c20-eac629565fe4"
+
+INITS = [
+    ("title", "Name"),
+    ("title", None),
+    ("title", RichTextObject.from_str("Name")),
+    ("title", [RichTextObject.from_str("Na"), RichTextObject.from_str("me")]),
+    ("rich_text", "Text"),
+    ("rich_text", None),
+    ("rich_text", RichTextObject.from_str("Text")),
+    ("rich_text", [RichTextObject.from_str("Text")]),
+    ("number", 1),
+    ("number", 1.5),
+    ("number", None),
+    ("number", True),
+    ("select", "Option"),
+    ("select", None),
+    ("select", SelectObject(name="Option")),
+    ("status", "Done"),
+    ("status", StatusObject(name="Done")),
+    ("multi_select", ["A", "B"]),
+    ("multi_select", []),
+    ("multi_select", None),
+    ("multi_select", [SelectObject(name="A")]),
+    ("date", datetime(2024, 1, 2, 3, 4, 5)),
+    ("date", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+    ("date", date(2024, 1, 2)),
+    ("date", "2024-01-02"),
+    ("date", "2024-01-02T03:04:05"),
+    ("date", "2024-01-02 03:04"),
+    ("date", "2024-01-02T03:04:05.123+01:00"),
+    ("date", "2024-01-02T03:04:05Z"),
+    ("date", "1704164645"),
+    ("date", None),
+    ("date", DateObject(start=date(2024, 1, 2))),
+    ("date", (datetime(2024, 1, 2), datetime(2024, 1, 3))),
+    ("date", ("2024-01-02T03:04:05", "2024-01-03T03:04:05")),
+    ("people", [USER_ID]),
+    ("people", [User.from_id(USER_ID)]),
+    ("people", None),
+    ("files", [File(name="file", url="https://example.com/file")]),
+    ("files", None),
+    ("checkbox", True),
+    ("checkbox", False),
+    ("url", "https://example.com"),
+    ("url", File(name="file", url="https://example.com/file")),
+    ("url", None),
+    ("email", "ada@example.com"),
+    ("email", None),
+    ("phone_number", "+44 1234"),
+    ("phone_number", None),
+    ("relation", USER_ID),
+    ("relation", [USER_ID, USER_ID]),
+    ("relation", RelationObject(id=USER_ID)),
+    ("relation", [RelationObject(id=USER_ID)]),
+    ("relation", None),
+    ("formula", FormulaObject(type="number", number=2)),
+    ("rollup", []),
+    ("created_by", User.from_id(USER_ID)),
+    ("last_edited_by", User.from_id(USER_ID)),
+    ("unique_id", 3),
+    ("unique_id", "PRE-3"),
+    ("unique_id", UniqueIDObject(prefix="PRE", number=3)),
+]
+
+
+@mark.parametrize("property_type,init", INITS)
+def test_type_dispatch_matches_type_map(property_type, init, monkeypatch):
+    value = generate_value(property_type, init)
+
+    # Without the dispatch, every entry of `_type_map` is tried in turn
+    monkeypatch.setattr(get_value_class(property_type), "_type_dispatch", {})
+    expected = generate_value(property_type, init)
+
+    assert value.dict(by_alias=True) == expected.dict(by_alias=True)
+
+
+@mark.parametrize(
+    "init,start",
+    [
+        ("2024-01-02", date(2024, 1, 2)),
+        ("2024-01-02T03:04:05", datetime(2024, 1, 2, 3, 4, 5)),
+        (
+            "2024-01-02T03:04:05Z",
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_date_strings(init, start):
+    value = generate_value("date", init)
+    assert value.date.start == start
+    assert type(value.date.start) is type(start)
+
+
+def test_dispatch_on_exact_type():
+    class Name(str):
+        pass
+
+    # Subclasses are not in the dispatch table and go through `_type_map`
+    assert generate_value("title", Name("Name")).value == "Name"
+    assert generate_value("checkbox", True).value is True
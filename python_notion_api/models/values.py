@@ -12,6 +12,7 @@ from pydantic.v1 import (
     parse_obj_as,
     root_validator,
 )
+from pydantic.v1.datetime_parse import parse_date, parse_datetime
 from typing_extensions import Annotated
 
 from python_notion_api.models.common import (
@@ -38,12 +39,21 @@ class PropertyValue(BaseModel):
     property_type: Optional[str] = Field(alias="type", exclude=True)
 
     _type_map: ClassVar
+    # Methods for types of `init` that always resolve to the same entry of
+    # `_type_map`, so that they can be called without trying to parse
+    # `init` as each type in turn.
+    _type_dispatch: ClassVar[Dict[type, str]] = {}
     _set_field: ClassVar[str]
 
     @root_validator(pre=True)
     def validate_init(cls, values):
         if hasattr(cls, "_type_map") and "init" in values:
             init = values.get("init")
+            method_name = cls._type_dispatch.get(type(init))
+            if method_name is not None:
+                values[cls._set_field] = getattr(cls, method_name)(init)
+                return values
+
             for check_type, method_name in cls._type_map.items():
                 try:
                     obj = parse_obj_as(check_type, init)
@@ -90,6 +100,11 @@ class TitlePropertyValue(PropertyValue):
         RichTextObject: "validate_rich_text",
         type(None): "validate_none_list",
     }
+    _type_dispatch = {
+        str: "validate_str",
+        RichTextObject: "validate_rich_text",
+        type(None): "validate_none_list",
+    }
     _set_field = "title"
 
     init: excluded(Optional[Union[RichTextObject, str, List[RichTextObject]]])
@@ -115,6 +130,11 @@ class RichTextPropertyValue(PropertyValue):
         RichTextObject: "validate_rich_text",
         type(None): "validate_none_list",
     }
+    _type_dispatch = {
+        str: "validate_str",
+        RichTextObject: "validate_rich_text",
+        type(None): "validate_none_list",
+    }
     _set_field = "rich_text"
 
     init: excluded(Optional[Union[RichTextObject, str, List[RichTextObject]]])
@@ -139,6 +159,11 @@ class NumberPropertyValue(PropertyValue):
         int: "leave_unchanged",
         type(None): "validate_none",
     }
+    _type_dispatch = {
+        float: "leave_unchanged",
+        int: "leave_unchanged",
+        type(None): "validate_none",
+    }
     _set_field = "number"
 
     init: excluded(Optional[Union[float, int]])
@@ -155,6 +180,11 @@ class SelectPropertyValue(PropertyValue):
         str: "validate_str",
         type(None): "validate_none",
     }
+    _type_dispatch = {
+        SelectObject: "leave_unchanged",
+        str: "validate_str",
+        type(None): "validate_none",
+    }
     _set_field = "select"
 
     init: excluded(Optional[Union[SelectObject, str]])
@@ -172,6 +202,7 @@ class SelectPropertyValue(PropertyValue):
 
 class StatusPropertyValue(PropertyValue):
     _type_map = {StatusObject: "leave_unchanged", str: "validate_str"}
+    _type_dispatch = {StatusObject: "leave_unchanged", str: "validate_str"}
     _set_field = "status"
 
     init: excluded(Optional[Union[StatusObject, str]])
@@ -193,6 +224,7 @@ class MultiSelectPropertyValue(PropertyValue):
         List: "validate_str",
         type(None): "validate_none_list",
     }
+    _type_dispatch = {type(None): "validate_none_list"}
     _set_field = "multi_select"
 
     init: excluded(Optional[Union[List[SelectObject], List[str]]])
@@ -217,6 +249,13 @@ class DatePropertyValue(PropertyValue):
         Tuple[str, str]: "validate_str_tuple",
         type(None): "validate_none",
     }
+    _type_dispatch = {
+        datetime: "validate_date",
+        date: "validate_date",
+        str: "validate_any_str",
+        DateObject: "leave_unchanged",
+        type(None): "validate_none",
+    }
 
     _set_field = "date"
 
@@ -238,6 +277,16 @@ class DatePropertyValue(PropertyValue):
     def validate_date(cls, init: datetime):
         return DateObject(start=init)
 
+    @classmethod
+    def validate_any_str(cls, init: str):
+        # Strings are parsed as a datetime, then as a date, as in `_type_map`
+        for parse in (parse_datetime, parse_date):
+            try:
+                return cls.validate_date(parse(init))
+            except (ValueError, TypeError):
+                pass
+        return cls.validate_str(init)
+
     @classmethod
     def validate_str(cls, init: str):
         try:
@@ -275,6 +324,7 @@ class PeoplePropertyValue(PropertyValue):
         List[User]: "leave_unchanged",
         type(None): "validate_none_list",
     }
+    _type_dispatch = {type(None): "validate_none_list"}
     _set_field = "people"
 
     init: excluded(Optional[Union[List[str], List[User]]])
@@ -299,6 +349,7 @@ class FilesPropertyValue(PropertyValue):
         List[File]: "validate_file",
         type(None): "validate_none_list",
     }
+    _type_dispatch = {type(None): "validate_none_list"}
     _set_field = "files"
 
     init: excluded(Optional[List[File]])
@@ -325,6 +376,7 @@ class FilesPropertyValue(PropertyValue):
 
 class CheckBoxPropertyValue(PropertyValue):
     _type_map = {bool: "leave_unchanged"}
+    _type_dispatch = {bool: "leave_unchanged"}
 
     _set_field = "checkbox"
 
@@ -343,6 +395,7 @@ class URLPropertyValue(PropertyValue):
         File: "validate_file",
         type(None): "validate_none",
     }
+    _type_dispatch = {File: "validate_file", type(None): "validate_none"}
     _set_field = "url"
 
     init: excluded(Optional[Union[AnyUrl, FilePath, File]])
@@ -363,6 +416,7 @@ class URLPropertyValue(PropertyValue):
 
 class EmailPropertyValue(PropertyValue):
     _type_map = {str: "leave_unchanged", type(None): "validate_none"}
+    _type_dispatch = _type_map
     _set_field = "email"
 
     init: excluded(Optional[str])
@@ -375,6 +429,7 @@ class EmailPropertyValue(PropertyValue):
 
 class PhoneNumberPropertyValue(PropertyValue):
     _type_map = {str: "leave_unchanged", type(None): "validate_none"}
+    _type_dispatch = _type_map
     _set_field = "phone_number"
 
     init: excluded(Optional[str])
@@ -393,6 +448,11 @@ class RelationPropertyValue(PropertyValue):
         RelationObject: "validate_relation",
         type(None): "validate_none_list",
     }
+    _type_dispatch = {
+        str: "validate_str",
+        RelationObject: "validate_relation",
+        type(None): "validate_none_list",
+    }
     _set_field = "relation"
 
     init: excluded(
@@ -421,6 +481,7 @@ class FormulaPropertyValue(PropertyValue):
     _type_map = {
         FormulaObject: "leave_unchanged",
     }
+    _type_dispatch = {FormulaObject: "leave_unchanged"}
     _set_field = "formula"
 
     init: excluded(Optional[FormulaObject])
@@ -437,6 +498,7 @@ class FormulaPropertyValue(PropertyValue):
 
 class RollupPropertyValue(PropertyValue):
     _type_map = {RollupObject: "leave_unchanged", List: "validate_array"}
+    _type_dispatch = {RollupObject: "leave_unchanged", list: "validate_array"}
     _set_field = "rollup"
 
     init: excluded(Optional[Union[List, RollupObject]])
@@ -509,6 +571,7 @@ class CreatedByPropertyValue(PropertyValue):
     _type_map = {
         User: "leave_unchanged",
     }
+    _type_dispatch = {User: "leave_unchanged"}
     _set_field = "created_by"
 
     init: excluded(Optional[User])
@@ -523,6 +586,7 @@ class LastEditedByPropertyValue(PropertyValue):
     _type_map = {
         User: "leave_unchanged",
     }
+    _type_dispatch = {User: "leave_unchanged"}
     _set_field = "last_edited_by"
 
     init: excluded(Optional[User])
@@ -539,6 +603,7 @@ class UniqueIDPropertyValue(PropertyValue):
         int: "validate_int",
         str: "validate_str",
     }
+    _type_dispatch = {UniqueIDObject: "leave_unchanged", int: "validate_int"}
 
     _set_field = "unique_id"
 
@@ -559,31 +624,33 @@ class UniqueIDPropertyValue(PropertyValue):
         return self.unique_id.number
 
 
+_value_class_map = {
+    "title": TitlePropertyValue,
+    "rich_text": RichTextPropertyValue,
+    "number": NumberPropertyValue,
+    "select": SelectPropertyValue,
+    "status": StatusPropertyValue,
+    "multi_select": MultiSelectPropertyValue,
+    "date": DatePropertyValue,
+    "people": PeoplePropertyValue,
+    "files": FilesPropertyValue,
+    "checkbox": CheckBoxPropertyValue,
+    "url": URLPropertyValue,
+    "email": EmailPropertyValue,
+    "phone_number": PhoneNumberPropertyValue,
+    "relation": RelationPropertyValue,
+    "last_edited_by": LastEditedByPropertyValue,
+    "created_by": CreatedByPropertyValue,
+    "last_edited_time": LastEditedTimePropertyValue,
+    "created_time": CreatedTimePropertyValue,
+    "rollup": RollupPropertyValue,
+    "formula": FormulaPropertyValue,
+    "unique_id": UniqueIDPropertyValue,
+}
+
+
 def get_value_class(property_type):
-    _class_map = {
-        "title": TitlePropertyValue,
-        "rich_text": RichTextPropertyValue,
-        "number": NumberPropertyValue,
-        "select": SelectPropertyValue,
-        "status": StatusPropertyValue,
-        "multi_select": MultiSelectPropertyValue,
-        "date": DatePropertyValue,
-        "people": PeoplePropertyValue,
-        "files": FilesPropertyValue,
-        "checkbox": CheckBoxPropertyValue,
-        "url": URLPropertyValue,
-        "email": EmailPropertyValue,
-        "phone_number": PhoneNumberPropertyValue,
-        "relation": RelationPropertyValue,
-        "last_edited_by": LastEditedByPropertyValue,
-        "created_by": CreatedByPropertyValue,
-        "last_edited_time": LastEditedTimePropertyValue,
-        "created_time": CreatedTimePropertyValue,
-        "rollup": RollupPropertyValue,
-        "formula": FormulaPropertyValue,
-        "unique_id": UniqueIDPropertyValue,
-    }
-    return _class_map.get(property_type, None)
+    return _value_class_map.get(property_type, None)
 
 
 def generate_value(property_type, value):
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
 import json
-from math import floor
-from typing import Any, Generator, Literal, Optional, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import unquote, urlencode
 
 from loguru import logger
 from pydantic.v1 import BaseModel
@@ -10,12 +25,20 @@ from requests.packages.urllib3 import PoolManager
 from requests.packages.urllib3.exceptions import MaxRetryError
 from requests.packages.urllib3.util.retry import Retry
 
+from python_notion_api.models.blocks import BlockTree, SEPARATE_BLOCK_TYPES
+from python_notion_api.models.columns import Columns
 from python_notion_api.models.common import FileObject, ParentObject
 from python_notion_api.models.configurations import (
     NotionPropertyConfiguration,
     RelationPropertyConfiguration,
 )
-from python_notion_api.models.filters import FilterItem
+from python_notion_api.models.extractors import (
+    KEY_TYPES,
+    RowDecoder,
+    extract_value,
+    is_unchanged,
+)
+from python_notion_api.models.filters import FilterItem, equals_filter
 from python_notion_api.models.iterators import (
     BlockIterator,
     PropertyItemIterator,
@@ -30,8 +53,26 @@ from python_notion_api.models.objects import (
     User,
 )
 from python_notion_api.models.properties import NotionObject, PropertyItem
+from python_notion_api.models.rows import CompactRow, RowSchema
 from python_notion_api.models.sorts import Sort
 from python_notion_api.models.values import PropertyValue, generate_value
+from python_notion_api.sync_api.rate_limiter import RateLimiter
+from python_notion_api.sync_api.utils import prefetch_pages
+from python_notion_api.utils import (
+    BlockPath,
+    PageSizeController,
+    StringInterner,
+    TTLCache,
+    index_property_names,
+    split_blocks,
+)
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class NotionPage:
@@ -40,6 +81,11 @@ class NotionPage:
     Args:
         api: Instance of the NotionAPI.
         page_id: Id of the page.
+        obj: Page object. If `None`, the page is fetched from Notion.
+        database: Database of the page. If `None`, the parent database of
+            the page is fetched.
+        properties: Properties to retrieve when fetching the page. If
+            `None`, retrieves all properties.
     """
 
     class PatchRequest(BaseModel):
@@ -58,14 +104,17 @@ class NotionPage:
         page_id: str,
         obj: Optional[Page] = None,
         database: Optional[NotionDatabase] = None,
+        properties: Optional[list[str]] = None,
     ):
         self._api = api
         self._page_id = page_id
         self._object = obj
         self.database = database
+        self._prop_names: Optional[dict[str, str]] = None
+        self._pending: Optional[dict[str, PropertyValue]] = None
 
         if self._object is None:
-            self.reload()
+            self.reload(properties=properties)
 
         self._alive: Optional[bool] = None
 
@@ -123,23 +172,23 @@ class NotionPage:
         Returns:
             Property name or `None` if key is invalid.
         """
-        _properties = self.object.properties
-        prop_name = next(
-            (
-                key
-                for key in _properties
-                if key == prop_key or _properties[key]["id"] == prop_key
-            ),
-            None,
-        )
+        if self._prop_names is None:
+            self._prop_names = index_property_names(self.object.properties)
 
-        return prop_name
+        return self._prop_names.get(prop_key)
 
-    def add_blocks(self, blocks: list[Block]) -> BlockIterator:
+    def add_blocks(
+        self, blocks: list[Block], concurrency: Optional[int] = None
+    ) -> BlockIterator:
         """Adds new blocks to an existing page.
 
+        Any number of blocks can be added: they are sent in as few requests
+        as Notion accepts, and children nested too deep for a request are
+        added to their parent once it is created.
+
         Args:
             blocks: list of Blocks to add
+            concurrency: Maximum number of threads adding nested children.
 
         Returns:
             Iterator of blocks is returned.
@@ -150,36 +199,93 @@ class NotionPage:
             by_alias=True, exclude_unset=True, exclude_none=True
         )
 
-        new_blocks = self._api._patch(
-            endpoint=f"blocks/{self.page_id}/children", data=data
+        new_blocks = self._api._append_blocks(
+            self.page_id, json.loads(data)["children"], concurrency
         )
 
-        assert new_blocks is not None
+        return BlockIterator(iter(new_blocks))
 
-        return BlockIterator(iter(new_blocks.results))
-
-    def get_blocks(self, page_limit: Optional[int] = None) -> BlockIterator:
+    def get_blocks(
+        self, page_limit: Optional[int] = None, prefetch: int = 0
+    ) -> BlockIterator:
         """Gets all blocks in the page.
 
         Args:
             page_limit: Limit the number of blocks to return. If `None`, will
                 return all blocks.
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
 
         Returns:
             Iterator of the page blocks.
         """
 
         generator = self._api._get_iterate(
-            endpoint=f"blocks/{self._page_id}/children", page_limit=page_limit
+            endpoint=f"blocks/{self._page_id}/children",
+            page_limit=page_limit,
+            prefetch=prefetch,
         )
         return BlockIterator(generator)
 
+    def get_block_tree(
+        self, max_depth: Optional[int] = None, concurrency: int = 10
+    ) -> list[BlockTree]:
+        """Gets all blocks in the page with their children.
+
+        Blocks are retrieved level by level: the children of all blocks of
+        a level that have children are retrieved concurrently. Child pages
+        and databases are not expanded.
+
+        Args:
+            max_depth: Number of levels to retrieve, e.g. 1 for the blocks
+                of the page only. If `None`, retrieves all levels.
+            concurrency: Maximum number of blocks whose children are
+                retrieved at the same time.
+
+        Returns:
+            Trees of the page blocks.
+        """
+
+        def get_children(block_id: str) -> list[BlockTree]:
+            return [
+                BlockTree(block)
+                for block, _ in self._api._get_iterate(
+                    endpoint=f"blocks/{block_id}/children"
+                )
+            ]
+
+        trees = get_children(self._page_id)
+        level = trees
+        depth = 1
+        while max_depth is None or depth < max_depth:
+            expandable = [
+                tree
+                for tree in level
+                if tree.block.has_children
+                and tree.block.block_type not in SEPARATE_BLOCK_TYPES
+            ]
+            if not expandable:
+                break
+            children = self._api.map(
+                lambda tree: get_children(tree.block.id),
+                expandable,
+                concurrency=concurrency,
+            )
+            level = []
+            for tree, tree_children in zip(expandable, children):
+                tree.children = tree_children
+                level.extend(tree_children)
+            depth += 1
+
+        return trees
+
     def get(
         self,
         prop_key: str,
         cache: bool = True,
         safety_off: bool = False,
         page_limit: Optional[int] = None,
+        prefetch: int = 0,
     ) -> Union[PropertyValue, PropertyItemIterator, None]:
         """Gets a single page property.
 
@@ -193,6 +299,10 @@ class NotionPage:
                 Use `False` to force a new API call.
             safety_off: If `True` will use cached values of rollups and
                 formulas.
+            page_limit: Number of results per request when iterating over
+                a paginated property.
+            prefetch: Number of result pages to fetch ahead when iterating
+                over a paginated property.
         """
         if prop_key in self.special_properties:
             # For subclasses of NotionPage
@@ -209,6 +319,7 @@ class NotionPage:
                 cache=cache,
                 safety_off=safety_off,
                 page_limit=page_limit,
+                prefetch=prefetch,
             )
 
     def _direct_get(
@@ -217,6 +328,7 @@ class NotionPage:
         cache: bool = True,
         safety_off: bool = False,
         page_limit: Optional[int] = None,
+        prefetch: int = 0,
     ) -> Union[PropertyValue, PropertyItemIterator, None]:
         """Wrapper for 'Retrieve a page property item' action.
 
@@ -228,6 +340,10 @@ class NotionPage:
                 Use `False` to force a new API call.
             safety_off: If `True` will use cached values of rollups and
                 formulas
+            page_limit: Number of results per request when iterating over
+                a paginated property.
+            prefetch: Number of result pages to fetch ahead when iterating
+                over a paginated property.
         """
         prop_name = self._get_prop_name(prop_key)
 
@@ -255,9 +371,12 @@ class NotionPage:
         )
 
         if isinstance(ret, Pagination):
+            # Continue from the first page instead of fetching it again
             generator = self._api._get_iterate(
                 endpoint=f"pages/{self._page_id}/properties/{prop_id}",
                 page_limit=page_limit,
+                prefetch=prefetch,
+                first=ret,
             )
             return create_property_iterator(generator, obj)
 
@@ -279,56 +398,127 @@ class NotionPage:
             data=json.dumps({"archived": archive_status}),
         )
 
-    def set(self, prop_key: str, value: Any) -> None:
-        """Wrapper for 'Update page' action.
-
-        Args:
-            prop_key: Name or id of the property to update
-            value: A new value of the property
-        """
-
-        prop_name = self._get_prop_name(prop_key=prop_key)
-
-        if prop_name is None:
-            raise ValueError(f"Unknown property '{prop_name}'")
-
-        prop_type = self.object.properties[prop_name]["type"]
-
-        value = generate_value(prop_type, value)
-        request = NotionPage.PatchRequest(properties={prop_name: value})
-
-        data = request.json(by_alias=True, exclude_unset=True)
-
-        self._api._patch(endpoint=f"pages/{self._page_id}", data=data)
-
-    def update(self, properties: dict[str, Any]) -> None:
-        """Update page with a dictionary of new values.
+    def _generate_values(
+        self, properties: dict[str, Any], only_changed: bool = False
+    ) -> dict[str, PropertyValue]:
+        """Validates new values of page properties.
 
         Args:
             properties: A dictionary mapping property keys to new
                 values.
+            only_changed: If `True`, leaves out values that are the same
+                as the current ones in the page object.
+
+        Returns:
+            A dictionary mapping property names to property values.
         """
         values = {}
         for prop_key, value in properties.items():
             prop_name = self._get_prop_name(prop_key=prop_key)
 
             if prop_name is None:
-                raise ValueError(f"Unknown property '{prop_name}'")
+                raise ValueError(f"Unknown property '{prop_key}'")
 
-            prop_type = self.object.properties[prop_name]["type"]
+            prop = self.object.properties[prop_name]
 
-            value = generate_value(prop_type, value)
+            value = generate_value(prop["type"], value)
+            if only_changed and is_unchanged(prop, value):
+                continue
             values[prop_name] = value
+        return values
+
+    def _patch_properties(self, values: dict[str, PropertyValue]) -> None:
+        """Sends new property values, or adds them to the pending batch.
+
+        Args:
+            values: A dictionary mapping property names to property values.
+        """
+        if self._pending is not None:
+            self._pending.update(values)
+            return
 
         request = NotionPage.PatchRequest(properties=values)
 
         data = request.json(by_alias=True, exclude_unset=True)
 
-        self._api._patch(endpoint=f"pages/{self._page_id}", data=data)
+        new_page = self._api._patch(
+            endpoint=f"pages/{self._page_id}", data=data
+        )
+        if isinstance(new_page, Page):
+            # Keep the page object up to date for later comparisons
+            self._object = new_page
+            self._prop_names = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Merges all `set` and `update` calls into one request.
+
+        Values set inside the block are sent in a single update when the
+        block exits, later values of a property replacing earlier ones.
+        Nothing is sent if the block raises. Nested blocks are part of the
+        outermost one.
+
+            with page.batch():
+                page.set("Status", "Done")
+                page.set("Number", 1)
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = {}
+        try:
+            yield
+            pending = self._pending
+        finally:
+            self._pending = None
+
+        if pending:
+            self._patch_properties(pending)
+
+    def set(self, prop_key: str, value: Any) -> None:
+        """Wrapper for 'Update page' action.
+
+        Args:
+            prop_key: Name or id of the property to update
+            value: A new value of the property
+        """
+        self._patch_properties(self._generate_values({prop_key: value}))
+
+    def update(
+        self, properties: dict[str, Any], only_changed: bool = False
+    ) -> None:
+        """Update page with a dictionary of new values.
 
-    def reload(self):
-        """Reloads page from Notion."""
-        self._object = self._api._get(endpoint=f"pages/{self._page_id}")
+        Args:
+            properties: A dictionary mapping property keys to new
+                values.
+            only_changed: If `True`, only sends the values that differ from
+                the current values in the page object, and doesn't send a
+                request if none do.
+        """
+        values = self._generate_values(properties, only_changed=only_changed)
+        if values or not only_changed:
+            self._patch_properties(values)
+
+    def reload(self, properties: Optional[list[str]] = None):
+        """Reloads page from Notion.
+
+        Args:
+            properties: Properties to retrieve. If `None`, retrieves all
+                properties. Names can be used if the database of the page is
+                known, otherwise use property ids.
+        """
+        params = {}
+        if properties is not None:
+            if self.database is not None:
+                properties = self.database._get_property_ids(properties)
+            params["filter_properties"] = properties
+
+        self._object = self._api._get(
+            endpoint=f"pages/{self._page_id}", params=params
+        )
+        self._prop_names = None
 
     @property
     def properties(self) -> dict[str, PropertyValue]:
@@ -354,17 +544,37 @@ class NotionPage:
         """
         if properties is None:
             properties = self.object.properties
+
+        decoded = {}
+        # Subclasses overriding `get` get all values through it
+        if self.database is not None and type(self).get is NotionPage.get:
+            decoded = self.database.row_decoder.decode(
+                self.object.properties,
+                names=[
+                    prop_name
+                    for prop_name in properties
+                    if prop_name not in self.special_properties
+                ],
+            )
+
         vals = {}
         for prop_name in properties:
-            prop = self.get(prop_name)
-            if prop is None:
-                continue
-            if prop.property_type == "relation":
+            if prop_name in decoded:
+                prop_type = self.object.properties[prop_name]["type"]
+                value = decoded[prop_name]
+            else:
+                prop = self.get(prop_name)
+                if prop is None:
+                    continue
+                prop_type = prop.property_type
+                value = prop.value
+
+            if prop_type == "relation":
                 if include_rels:
-                    vals[prop_name] = prop.value
+                    vals[prop_name] = value
             else:
                 if not rels_only:
-                    vals[prop_name] = prop.value
+                    vals[prop_name] = value
         return vals
 
 
@@ -390,40 +600,50 @@ class NotionBlock:
         return self._block_id.replace("-", "")
 
     def get_child_blocks(
-        self, page_limit: Optional[int] = None
+        self, page_limit: Optional[int] = None, prefetch: int = 0
     ) -> BlockIterator:
         """Gets all child blocks in the block.
 
+        Args:
+            page_limit: Number of blocks per request.
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
+
         Returns:
             An iterater of all blocks in the block
         """
         generator = self._api._get_iterate(
-            endpoint=f"blocks/{self._block_id}/children", page_limit=page_limit
+            endpoint=f"blocks/{self._block_id}/children",
+            page_limit=page_limit,
+            prefetch=prefetch,
         )
         return BlockIterator(generator)
 
-    def add_child_block(self, content: list[Block]) -> BlockIterator:
+    def add_child_block(
+        self, content: list[Block], concurrency: Optional[int] = None
+    ) -> BlockIterator:
         """Adds new blocks as children.
 
+        Any number of blocks can be added: they are sent in as few requests
+        as Notion accepts, and children nested too deep for a request are
+        added to their parent once it is created.
+
         Args:
             content: Content of the new block.
+            concurrency: Maximum number of threads adding nested children.
 
         Returns:
             An iterator of the newly created blocks.
         """
-        data = {
-            "children": [
-                block.dict(by_alias=True, exclude_unset=True)
-                for block in content
-            ]
-        }
-        new_blocks = self._api._patch(
-            endpoint=f"blocks/{self.block_id}/children", data=json.dumps(data)
+        children = [
+            json.loads(block.json(by_alias=True, exclude_unset=True))
+            for block in content
+        ]
+        new_blocks = self._api._append_blocks(
+            self.block_id, children, concurrency
         )
 
-        assert new_blocks is not None
-
-        return BlockIterator(iter(new_blocks.results))
+        return BlockIterator(iter(new_blocks))
 
     def set(self, block: Block) -> Block:
         """Updates the content of a Block.
@@ -475,6 +695,8 @@ class NotionDatabase:
             for key, val in self._object.properties.items()
         }
         self._title = "".join(rt.plain_text for rt in self._object.title)
+        self._row_decoder: Optional[RowDecoder] = None
+        self._row_schema: Optional[RowSchema] = None
 
     @property
     def database_id(self) -> str:
@@ -506,13 +728,70 @@ class NotionDatabase:
             if isinstance(val, RelationPropertyConfiguration)
         }
 
+    @property
+    def row_decoder(self) -> RowDecoder:
+        """Gets the decoder of page properties compiled from the property
+        configurations of the database.
+        """
+        if self._row_decoder is None:
+            self._row_decoder = RowDecoder(self._properties)
+        return self._row_decoder
+
+    @property
+    def row_schema(self) -> RowSchema:
+        """Gets the schema shared by compact rows of all properties of the
+        database.
+        """
+        if self._row_schema is None:
+            self._row_schema = RowSchema(self._properties)
+        return self._row_schema
+
+    def _get_property_name(self, prop_key: str) -> str:
+        """Gets name of a property.
+
+        Args:
+            prop_key: Name or id of the property.
+        """
+        if prop_key in self.properties:
+            return prop_key
+
+        prop_name = next(
+            (
+                name
+                for name, prop in self.properties.items()
+                if prop.config_id == prop_key
+            ),
+            None,
+        )
+        if prop_name is None:
+            raise ValueError(f"Unknown property: {prop_key}")
+        return prop_name
+
+    def _get_property_ids(self, properties: list[str]) -> list[str]:
+        """Gets ids of properties, as they are passed in request params.
+
+        Args:
+            properties: Names or ids of the properties.
+        """
+        property_ids = []
+        for prop_key in properties:
+            prop = self.properties[self._get_property_name(prop_key)]
+            # Ids come url-encoded, and are encoded again in the params.
+            property_ids.append(unquote(prop.config_id))
+        return property_ids
+
     def query(
         self,
         filters: Optional[FilterItem] = None,
         sorts: Optional[list[Sort]] = None,
         cast_cls=NotionPage,
         page_limit: Optional[int] = None,
-    ) -> Generator[NotionPage, None, None]:
+        prefetch: int = 0,
+        properties: Optional[list[str]] = None,
+        raw: bool = False,
+        compact: bool = False,
+        intern: bool = False,
+    ) -> Generator[Union[NotionPage, dict[str, Any], CompactRow], None, None]:
         """Queries the database.
 
         Retrieves all pages belonging to the database that satisfy the given filters
@@ -523,11 +802,42 @@ class NotionDatabase:
             sorts: Sorts to apply to the query.
             cast_cls: A subclass of a NotionPage. Allows custom
             property retrieval.
+            page_limit: Number of pages per request.
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
+            properties: Names or ids of the properties to retrieve. If
+                `None`, retrieves all properties.
+            raw: If `True`, yields the page objects as decoded from the
+                response JSON, without validating them or wrapping them in
+                `cast_cls`. Use `extract_values` to get plain property
+                values from them.
+            compact: If `True`, yields read-only `CompactRow` objects
+                that only keep the property values, sharing one schema for
+                all rows. Use it to keep large result sets in memory.
+            intern: If `True`, equal names, ids and option values of the
+                results share one string instance, to reduce the memory of
+                large result sets kept in memory.
 
         Returns:
-            Generator of NotionPage objects.
+            Generator of NotionPage objects, of page dictionaries if
+            `raw` is `True`, or of compact rows if `compact` is `True`.
         """
         data: dict[str, Any] = {}
+        params: dict[str, Any] = {}
+
+        if properties is not None:
+            params["filter_properties"] = self._get_property_ids(properties)
+
+        schema = None
+        if compact and properties is not None:
+            schema = RowSchema(
+                self.properties,
+                names=[self._get_property_name(key) for key in properties],
+            )
+        elif compact:
+            schema = self.row_schema
+
+        interner = StringInterner() if intern else None
 
         if filters is not None:
             filters = filters.dict(by_alias=True, exclude_unset=True)
@@ -543,30 +853,105 @@ class NotionDatabase:
             data=data,
             retry_strategy=self._api.post_retry_strategy,
             page_limit=page_limit,
+            prefetch=prefetch,
+            params=params,
+            raw=raw or compact or intern,
         ):
+            if interner is not None:
+                item = interner.intern_page(item)
+
+            if schema is not None:
+                yield CompactRow.from_page(schema, item)
+                continue
+
+            if raw:
+                yield item
+                continue
+
+            if interner is not None:
+                item = Page.from_obj(item)
+
             yield cast_cls(
                 api=self._api, database=self, page_id=item.page_id, obj=item
             )
 
-    def create_page(
+    def query_columns(
         self,
-        properties: dict[str, Any] = {},
-        cover_url: Optional[str] = None,
-    ) -> NotionPage:
-        """Creates a new page in the Database and updates the new page with
-        the properties.
+        filters: Optional[FilterItem] = None,
+        sorts: Optional[list[Sort]] = None,
+        page_limit: Optional[int] = None,
+        prefetch: int = 0,
+        properties: Optional[list[str]] = None,
+    ) -> Columns:
+        """Queries the database and stores the property values by column.
+
+        Pages are appended to typed columns as they are retrieved, without
+        building a page object or a dictionary for each of them.
 
         Args:
-            properties: Dictionary of property names and values. Value types
-            will depend on the property type. Can be the raw value
-            (e.g. string, float) or an object (e.g. SelectValue,
-            NumberPropertyItem)
-            cover: URL of an image for the page cover.
+            filters: Filters to apply to the query.
+            sorts: Sorts to apply to the query.
+            page_limit: Number of pages per request.
+            prefetch: Number of result pages to fetch ahead while the
+                current page is being consumed.
+            properties: Names or ids of the properties to retrieve. If
+                `None`, retrieves all properties.
 
         Returns:
-            A new page.
+            Property values of the pages by column.
         """
+        columns = Columns(
+            self.properties,
+            names=(
+                [self._get_property_name(key) for key in properties]
+                if properties is not None
+                else None
+            ),
+        )
+        for page in self.query(
+            filters=filters,
+            sorts=sorts,
+            page_limit=page_limit,
+            prefetch=prefetch,
+            properties=properties,
+            raw=True,
+        ):
+            columns.append(page)
+        return columns
+
+    def to_arrow(self, **kwargs) -> pyarrow.Table:
+        """Queries the database into an Arrow table.
+
+        Requires `pyarrow`.
+
+        Args:
+            **kwargs: Arguments of `query_columns`.
+        """
+        return self.query_columns(**kwargs).to_arrow()
+
+    def to_pandas(self, **kwargs) -> pandas.DataFrame:
+        """Queries the database into a DataFrame indexed by page ids.
+
+        Requires `pandas`.
+
+        Args:
+            **kwargs: Arguments of `query_columns`.
+        """
+        return self.query_columns(**kwargs).to_pandas()
+
+    def _create_page_data(
+        self, properties: dict[str, Any], cover_url: Optional[str] = None
+    ) -> str:
+        """Validates the properties of a new page and serialises the
+        request.
 
+        Args:
+            properties: Dictionary of property names and values.
+            cover_url: URL of an image for the page cover.
+
+        Returns:
+            Data of the create page request.
+        """
         validated_properties = {}
         for prop_name, prop_value in properties.items():
             prop = self.properties.get(prop_name, None)
@@ -587,13 +972,25 @@ class NotionDatabase:
             ),
         )
 
-        data = request.json(by_alias=True, exclude_unset=True)
+        return request.json(by_alias=True, exclude_unset=True)
+
+    def _post_page(self, data: str) -> NotionPage:
+        """Sends a create page request.
+
+        Args:
+            data: Data of the request, from `_create_page_data`.
 
+        Returns:
+            A new page.
+        """
         new_page = self._api._post(
             "pages", data=data, retry_strategy=self._api.post_retry_strategy
         )
 
-        assert new_page is not None
+        if new_page is None:
+            raise Exception(
+                f"Error creating page in database {self._database_id}"
+            )
 
         return NotionPage(
             api=self._api,
@@ -602,6 +999,275 @@ class NotionDatabase:
             database=self,
         )
 
+    def create_page(
+        self,
+        properties: dict[str, Any] = {},
+        cover_url: Optional[str] = None,
+    ) -> NotionPage:
+        """Creates a new page in the Database and updates the new page with
+        the properties.
+
+        Args:
+            properties: Dictionary of property names and values. Value types
+            will depend on the property type. Can be the raw value
+            (e.g. string, float) or an object (e.g. SelectValue,
+            NumberPropertyItem)
+            cover: URL of an image for the page cover.
+
+        Returns:
+            A new page.
+        """
+        return self._post_page(self._create_page_data(properties, cover_url))
+
+    def create_pages(
+        self, rows: Iterable[dict[str, Any]], concurrency: int = 10
+    ) -> list[Union[NotionPage, Exception]]:
+        """Creates a new page in the Database for every row.
+
+        All rows are validated before any page is created. Pages are then
+        created from a pool of threads, sharing the rate limiter of the
+        client.
+
+        Args:
+            rows: Dictionaries of property names and values, as passed to
+                `create_page`.
+            concurrency: Maximum number of pages created at the same time.
+
+        Returns:
+            For every row, in the same order, either the new page or the
+            exception raised while validating the row or creating the
+            page. Rows that fail validation are not sent.
+        """
+        requests: list[Union[str, Exception]] = []
+        for properties in rows:
+            try:
+                requests.append(self._create_page_data(properties))
+            except Exception as e:
+                requests.append(e)
+
+        def create(data: Union[str, Exception]):
+            if isinstance(data, Exception):
+                return data
+            try:
+                return self._post_page(data)
+            except Exception as e:
+                return e
+
+        return self._api.map(create, requests, concurrency=concurrency)
+
+    def upsert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        key: str,
+        concurrency: int = 10,
+    ) -> list[Union[NotionPage, Exception]]:
+        """Updates or creates a page for every row.
+
+        The page of a row is found by querying the page whose `key`
+        property equals the value of `key` in the row. Existing pages are
+        updated with `only_changed=True`, so rows that match their page
+        don't send any update. Pages are created for the other rows, and
+        rows with the same key are applied in order to the same page.
+
+        Args:
+            rows: Dictionaries of property names and values, as passed to
+                `create_page`. All rows must include the key property.
+            key: Name or id of the property identifying the pages, e.g. the
+                title. Must be a title, text, email, phone number, url,
+                number, unique id, checkbox, select or status property.
+            concurrency: Maximum number of rows processed at the same time.
+
+        Returns:
+            For every row, in the same order, either the updated or created
+            page or the exception raised for the row, e.g. if several pages
+            match it.
+
+        Raises:
+            ValueError: If the key property can't identify pages.
+        """
+        rows = list(rows)
+        key_name = self._get_key_name(key)
+        key_type = self.properties[key_name].config_type
+
+        results: list[Union[NotionPage, Exception, None]] = [None] * len(rows)
+        groups = self._group_upsert_rows(rows, key, key_name, results)
+
+        def upsert_group(group: tuple[Any, list[int]]):
+            # Rows with the same key are applied in order to the same page
+            key_value, indices = group
+            page = None
+            for i in indices:
+                row = rows[i]
+                try:
+                    if page is None:
+                        filters = equals_filter(key_name, key_type, key_value)
+                        pages = list(
+                            islice(
+                                self.query(filters=filters, page_limit=2), 2
+                            )
+                        )
+                        if len(pages) > 1:
+                            raise ValueError(
+                                f"Several pages with {key_name} = "
+                                f"{key_value!r}"
+                            )
+                        if not pages:
+                            page = self.create_page(row)
+                            results[i] = page
+                            continue
+                        page = pages[0]
+                    page.update(row, only_changed=True)
+                    results[i] = page
+                except Exception as e:
+                    results[i] = e
+
+        self._api.map(
+            upsert_group, list(groups.items()), concurrency=concurrency
+        )
+        return results
+
+    def _get_key_name(self, key: str) -> str:
+        """Gets the name of the key property of an upsert.
+
+        Args:
+            key: Name or id of the key property.
+
+        Raises:
+            ValueError: If the property can't identify pages.
+        """
+        key_name = self._get_property_name(key)
+        if self.properties[key_name].config_type not in KEY_TYPES:
+            raise ValueError(
+                f"Property {key_name} can't be used as a key, only "
+                f"{', '.join(sorted(KEY_TYPES))} properties can"
+            )
+        return key_name
+
+    def _group_upsert_rows(
+        self,
+        rows: list[dict[str, Any]],
+        key: str,
+        key_name: str,
+        results: list[Union[NotionPage, Exception, None]],
+    ) -> dict[Any, list[int]]:
+        """Groups the indices of the rows by key value.
+
+        Rows without a valid key value get their exception in `results`.
+        """
+        groups: dict[Any, list[int]] = {}
+        for i, row in enumerate(rows):
+            try:
+                key_value = row[key] if key in row else row[key_name]
+                groups.setdefault(key_value, []).append(i)
+            except Exception as e:
+                results[i] = e
+        return groups
+
+    def _get_upsert_properties(
+        self, key_name: str, rows: list[dict[str, Any]]
+    ) -> list[str]:
+        """Gets the names of the key property and of the known properties
+        of the rows.
+        """
+        properties = {key_name}
+        for row in rows:
+            for prop_key in row:
+                try:
+                    properties.add(self._get_property_name(prop_key))
+                except ValueError:
+                    # Reported when the row is created or updated
+                    pass
+        return list(properties)
+
+    def upsert_many(
+        self,
+        rows: Iterable[dict[str, Any]],
+        key_property: str,
+        concurrency: int = 10,
+    ) -> list[Union[NotionPage, Exception]]:
+        """Updates or creates a page for every row, using a local index.
+
+        Unlike `upsert`, which queries the page of each key, the pages are
+        found in an index built from a single scan of the database. The
+        scan only retrieves the key property and the properties in the
+        rows, whose current values are used to only send the values that
+        changed. Pages are created for rows without a page, and rows
+        with the same key are applied in order to the same page.
+
+        Args:
+            rows: Dictionaries of property names and values, as passed to
+                `create_page`. All rows must include the key property.
+            key_property: Name or id of the property identifying the pages,
+                e.g. a title or unique id. Must be a title, text, email,
+                phone number, url, number, unique id, checkbox, select or
+                status property. Keys are compared to the plain values
+                returned by `extract_value`, e.g. the number of a unique id.
+            concurrency: Maximum number of rows processed at the same time.
+
+        Returns:
+            For every row, in the same order, either the updated or created
+            page or the exception raised for the row, e.g. if several pages
+            match it. Updated pages that didn't change only include the
+            retrieved properties.
+
+        Raises:
+            ValueError: If the key property can't identify pages.
+        """
+        rows = list(rows)
+        key_name = self._get_key_name(key_property)
+
+        pages: dict[Any, list[dict]] = {}
+        for page in self.query(
+            properties=self._get_upsert_properties(key_name, rows), raw=True
+        ):
+            key_prop = page["properties"].get(key_name)
+            if key_prop is not None:
+                pages.setdefault(extract_value(key_prop), []).append(page)
+
+        results: list[Union[NotionPage, Exception, None]] = [None] * len(rows)
+        groups = self._group_upsert_rows(rows, key_property, key_name, results)
+
+        def upsert_group(group: tuple[Any, list[int]]):
+            # Rows with the same key are applied in order to the same page
+            key_value, indices = group
+            page = None
+            for i in indices:
+                row = rows[i]
+                try:
+                    if page is None:
+                        matches = pages.get(key_value, [])
+                        if len(matches) > 1:
+                            raise ValueError(
+                                f"Several pages with {key_name} = "
+                                f"{key_value!r}"
+                            )
+                        if not matches:
+                            page = self.create_page(row)
+                            results[i] = page
+                            continue
+                        page = NotionPage(
+                            api=self._api,
+                            page_id=matches[0]["id"],
+                            obj=Page.from_obj(matches[0]),
+                            database=self,
+                        )
+                    page.update(
+                        {
+                            prop_key: value
+                            for prop_key, value in row.items()
+                            if prop_key not in (key_property, key_name)
+                        },
+                        only_changed=True,
+                    )
+                    results[i] = page
+                except Exception as e:
+                    results[i] = e
+
+        self._api.map(
+            upsert_group, list(groups.items()), concurrency=concurrency
+        )
+        return results
+
 
 class NotionAPI:
     """Main class for Notion API wrapper.
@@ -610,18 +1276,33 @@ class NotionAPI:
         access_token: Notion access token
         api_version: Version of the notion API
         page_limit: Maximum number of results per request.
+        rate_limit: (number_of_requests, number of seconds). Default
+            is set at the rate limit of Notion (3 per second), with a longer
+            interval to allow bursts. The limit is shared by all threads
+            using the same client.
+        pool_size: Maximum number of connections kept open for reuse.
+        database_cache_ttl: Number of seconds databases fetched with
+            `get_database`, including the parent databases of pages, are
+            cached for. `None` caches them until invalidated, `0` disables
+            the cache.
     """
 
     def __init__(
         self,
         access_token: str,
         api_version: str = "2022-06-28",
-        page_limit: int = 20,
+        page_limit: int = 100,
+        rate_limit: tuple[int, int] = (500, 200),
+        pool_size: int = 10,
+        database_cache_ttl: Optional[float] = 300,
     ):
         self._access_token = access_token
         self._base_url = "https://api.notion.com/v1/"
         self._api_version = api_version
         self._page_limit = page_limit
+        self._pool_size = pool_size
+        self.limiter = RateLimiter(*rate_limit)
+        self._database_cache = TTLCache(ttl=database_cache_ttl)
 
         self.default_retry_strategy = Retry(
             total=5,
@@ -636,7 +1317,35 @@ class NotionAPI:
             allowed_methods=["POST"],
         )
 
-        self._http = PoolManager(retries=self.default_retry_strategy)
+        self._http = PoolManager(
+            retries=self.default_retry_strategy, maxsize=pool_size
+        )
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        concurrency: Optional[int] = None,
+    ) -> list[R]:
+        """Applies a function to every item using a pool of threads.
+
+        All threads share the connection pool and the rate limiter of this
+        client, so `fn` can freely make requests through it.
+
+        Args:
+            fn: Function to call for every item.
+            items: Items to pass to the function.
+            concurrency: Maximum number of threads. Defaults to the size of
+                the connection pool.
+
+        Returns:
+            Results of the function, in the same order as `items`. If any
+            call raises, the exception is re-raised.
+        """
+        with ThreadPoolExecutor(
+            max_workers=concurrency or self._pool_size
+        ) as executor:
+            return list(executor.map(fn, items))
 
     def _request(
         self,
@@ -644,7 +1353,7 @@ class NotionAPI:
         endpoint: str = "",
         params: dict[str, Any] = {},
         data: Optional[str] = None,
-        cast_cls: Type[NotionObjectBase] = NotionObject,
+        cast_cls: Optional[Type[NotionObjectBase]] = NotionObject,
         retry_strategy: Retry = None,
     ) -> Optional[NotionObject]:
         """Main request handler.
@@ -655,16 +1364,21 @@ class NotionAPI:
             request_type: Type of the http request to make.
             endpoint: Endpoint of the request. Will be prepened with the
                 notion API base url.
-            params: Params to pass to the request.
+            params: Params to pass to the request. List values are sent as
+                repeated params.
             data: Data to pass to the request.
             cast_cls: A NotionObjectBase class to auto-cast the response of the
-                request to.
+                request to. If `None`, the decoded JSON is returned as is.
 
         Returns:
             Retrieved NotionObject or `None` if the request failed.
         """
         url = self._base_url + endpoint
 
+        if params:
+            # List values are sent as repeated params.
+            url = f"{url}?{urlencode(params, doseq=True)}"
+
         headers = {
             "Authorization": f"Bearer {self._access_token}",
             "Notion-Version": f"{self._api_version}",
@@ -672,17 +1386,19 @@ class NotionAPI:
             "Accept": "application/json",
         }
 
-        response = self._http.request(
-            request_type,
-            url,
-            fields=params,
-            body=data,
-            headers=headers,
-            retries=retry_strategy,
-        )
+        with self.limiter:
+            response = self._http.request(
+                request_type,
+                url,
+                body=data,
+                headers=headers,
+                retries=retry_strategy,
+            )
 
         decoded_data = response.data.decode("utf-8")
         if response.status == 200:
+            if cast_cls is None:
+                return json.loads(decoded_data)
             return cast_cls.from_obj(json.loads(decoded_data))
         else:
             logger.error(
@@ -695,8 +1411,9 @@ class NotionAPI:
         self,
         endpoint: str,
         data: Optional[str] = None,
-        cast_cls: Type[NotionObjectBase] = NotionObject,
+        cast_cls: Optional[Type[NotionObjectBase]] = NotionObject,
         retry_strategy: Retry = None,
+        params: dict[str, Any] = {},
     ) -> Optional[NotionObject]:
         """Wrapper for post requests.
 
@@ -707,7 +1424,8 @@ class NotionAPI:
                 notion API base url.
             data: Data to pass to the request.
             cast_cls: A NotionObjectBase class to auto-cast the response of the
-                request to.
+                request to. If `None`, the decoded JSON is returned as is.
+            params: Params to pass to the request.
 
         Returns:
             Retrieved NotionObject or `None` if the request failed.
@@ -715,6 +1433,7 @@ class NotionAPI:
         return self._request(
             request_type="post",
             endpoint=endpoint,
+            params=params,
             data=data,
             cast_cls=cast_cls,
             retry_strategy=retry_strategy,
@@ -777,12 +1496,152 @@ class NotionAPI:
             cast_cls=cast_cls,
         )
 
+    def _append_blocks(
+        self,
+        block_id: str,
+        blocks: list[dict],
+        concurrency: Optional[int] = None,
+    ) -> list[Block]:
+        """Appends blocks to a page or a block.
+
+        Should not be called directly, for internal use only.
+
+        Blocks are split into requests accepted by Notion with
+        `split_blocks`. Children that can't be sent with their parent are
+        appended once the parent is created, one level of nesting at a
+        time, concurrently for the parents of each level.
+
+        Args:
+            block_id: Id of the page or block to append the blocks to.
+            blocks: Blocks to append, as dictionaries accepted by Notion.
+            concurrency: Maximum number of threads appending children.
+
+        Returns:
+            The appended blocks.
+        """
+        results, deferred = self._append_children(block_id, blocks)
+        while deferred:
+            appended = self.map(
+                lambda item: self._append_children(*item),
+                deferred,
+                concurrency=concurrency,
+            )
+            deferred = [item for _, more in appended for item in more]
+        return results
+
+    def _append_children(
+        self, block_id: str, blocks: list[dict]
+    ) -> tuple[list[Block], list[tuple[str, list[dict]]]]:
+        """Appends blocks to a page or a block, without the children that
+        can't be sent with them.
+
+        Should not be called directly, for internal use only.
+
+        Args:
+            block_id: Id of the page or block to append the blocks to.
+            blocks: Blocks to append, as dictionaries accepted by Notion.
+
+        Returns:
+            The appended blocks, and the ids of the created parents with
+            the children left to append to them.
+        """
+        results = []
+        deferred = []
+        for children, chunk_deferred in split_blocks(blocks):
+            response = self._patch(
+                endpoint=f"blocks/{block_id}/children",
+                data=json.dumps({"children": children}),
+            )
+            assert response is not None
+            results.extend(response.results)
+
+            # Nested blocks are not returned, so the parents of removed
+            # children below the first level are found by listing them
+            listed: dict[BlockPath, list[Block]] = {}
+            for path, more in chunk_deferred:
+                parent = response.results[path[0]]
+                for depth in range(1, len(path)):
+                    if path[:depth] not in listed:
+                        listed[path[:depth]] = [
+                            block
+                            for block, _ in self._get_iterate(
+                                endpoint=f"blocks/{parent.id}/children"
+                            )
+                        ]
+                    parent = listed[path[:depth]][path[depth]]
+                deferred.append((parent.id, more))
+        return results, deferred
+
+    def _paginate(
+        self,
+        fetch: Callable[[Optional[str], int], Optional[Pagination]],
+        page_limit: Optional[int] = None,
+        first: Optional[Pagination] = None,
+    ) -> Generator[Pagination, None, None]:
+        """Fetches pages of a paginated response one after another.
+
+        Should not be called directly, for internal use only.
+
+        Args:
+            fetch: Function fetching a page given the start cursor and page
+                size.
+            page_limit: Maximum number of results per page. Requests start
+                at this size, which is reduced after failed requests and
+                increased back after successful ones.
+            first: Already fetched first page. If given, it is yielded
+                first and the following pages are fetched from its cursor.
+
+        Returns:
+            Generator yielding Pagination objects.
+        """
+        has_more = True
+        cursor = None
+        page_sizes = PageSizeController(page_limit or self._page_limit)
+
+        if first is not None:
+            yield first
+            has_more = first.has_more
+            cursor = first.next_cursor
+
+        while has_more:
+            while True:
+                try:
+                    response = fetch(cursor, page_sizes.size)
+                    break
+                except MaxRetryError as e:
+                    try:
+                        page_sizes.failure()
+                    except ValueError:
+                        raise e
+                    logger.warning(
+                        "Retrying request with smaller page size"
+                        f"({page_sizes.size})"
+                    )
+
+            assert response is not None
+
+            page_sizes.success()
+
+            yield response
+
+            if isinstance(response, dict):
+                has_more = response["has_more"]
+                cursor = response["next_cursor"]
+            else:
+                has_more = response.has_more
+                cursor = response.next_cursor
+
+        logger.debug("Page sizes used: {}", page_sizes.sizes)
+
     def _post_iterate(
         self,
         endpoint: str,
         data: dict[str, str] = {},
         retry_strategy: Retry = None,
         page_limit: Optional[int] = None,
+        prefetch: int = 0,
+        params: dict[str, Any] = {},
+        raw: bool = False,
     ) -> Generator[PropertyItem, None, None]:
         """Wrapper for post requests where expected return type is Pagination.
 
@@ -792,48 +1651,44 @@ class NotionAPI:
             endpoint: Endpoint of the request. Will be prefixed with the
                 Notion API base url.
             data: Data to pass to the request.
+            page_limit: Number of results per page.
+            prefetch: Number of pages to fetch ahead of the consumer. If
+                greater than 0, the request for the next page is sent from
+                a background thread as soon as the previous page arrives.
+            params: Params to pass to the request.
+            raw: If `True`, yields the decoded JSON of the results instead
+                of NotionObjects.
 
         Returns:
             Generator yielding PropertyItem objects.
         """
-        has_more = True
-        cursor = None
-        page_size = page_limit or self._page_limit
-
-        while has_more:
-            data.update({"start_cursor": cursor, "page_size": page_size})
-
-            if cursor is None:
-                data.pop("start_cursor")
 
-            while page_size > 0:
-                try:
-                    response = self._post(
-                        endpoint=endpoint,
-                        data=json.dumps(data),
-                        retry_strategy=retry_strategy,
-                    )
-
-                    assert response is not None
-
-                    for item in response.results:
-                        yield item
+        def fetch(cursor, page_size):
+            request_data = {**data, "page_size": page_size}
+            if cursor is not None:
+                request_data["start_cursor"] = cursor
+            return self._post(
+                endpoint=endpoint,
+                data=json.dumps(request_data),
+                retry_strategy=retry_strategy,
+                params=params,
+                cast_cls=None if raw else NotionObject,
+            )
 
-                    has_more = response.has_more
-                    cursor = response.next_cursor
+        pages = self._paginate(fetch, page_limit=page_limit)
+        if prefetch > 0:
+            pages = prefetch_pages(pages, depth=prefetch)
 
-                    break
-                except MaxRetryError as e:
-                    page_size = floor(page_size / 2)
-                    if page_size == 0:
-                        raise e
-                    data.update({"page_size": page_size})
+        for response in pages:
+            yield from response["results"] if raw else response.results
 
     def _get_iterate(
         self,
         endpoint: str,
         params: dict[str, str] = {},
         page_limit: Optional[int] = None,
+        prefetch: int = 0,
+        first: Optional[Pagination] = None,
     ) -> Generator[tuple[Any, Any], None, None]:
         """Wrapper for get requests where expected return type is Pagination.
 
@@ -843,59 +1698,79 @@ class NotionAPI:
             endpoint: Endpoint of the request. Will be prefixed with the
                 notion API base url.
             params: Params to pass to the request.
+            page_limit: Number of results per page.
+            prefetch: Number of pages to fetch ahead of the consumer. If
+                greater than 0, the request for the next page is sent from
+                a background thread as soon as the previous page arrives.
+            first: Already fetched first page of the results. If given,
+                iteration continues from its cursor.
 
         Returns:
             Generator yielding PropertyItem objects.
         """
-        has_more = True
-        cursor = None
-        page_size = page_limit or self._page_limit
 
-        while has_more:
-            params.update({"start_cursor": cursor, "page_size": page_size})
-
-            if cursor is None:
-                params.pop("start_cursor")
-
-            while page_size > 0:
-                try:
-                    response = self._get(endpoint=endpoint, params=params)
-
-                    assert response is not None
+        def fetch(cursor, page_size):
+            request_params = {**params, "page_size": page_size}
+            if cursor is not None:
+                request_params["start_cursor"] = cursor
+            return self._get(endpoint=endpoint, params=request_params)
 
-                    if hasattr(response, "property_item"):
-                        # Required for rollups
-                        property_item = response.property_item
-                    else:
-                        # property doesn't exist for Blocks
-                        property_item = None
+        pages = self._paginate(fetch, page_limit=page_limit, first=first)
+        if prefetch > 0:
+            pages = prefetch_pages(pages, depth=prefetch)
 
-                    for item in response.results:
-                        yield item, property_item
-
-                    has_more = response.has_more
-                    cursor = response.next_cursor
+        for response in pages:
+            if hasattr(response, "property_item"):
+                # Required for rollups
+                property_item = response.property_item
+            else:
+                # property doesn't exist for Blocks
+                property_item = None
 
-                    break
-                except MaxRetryError as e:
-                    page_size = floor(page_size / 2)
-                    if page_size == 0:
-                        raise e
-                    params.update({"page_size": page_size})
+            for item in response.results:
+                yield item, property_item
 
-    def get_database(self, database_id: str) -> NotionDatabase:
+    def get_database(
+        self, database_id: str, cache: bool = True
+    ) -> NotionDatabase:
         """Gets Notion database.
 
         Args:
             database_id: Id of the database to fetch.
+            cache: If `True`, returns the cached database if it has been
+                fetched before. Use `False` to force a new API call.
 
         Returns:
             A Notion database with the given id.
         """
-        return NotionDatabase(self, database_id)
+        cache_key = database_id.replace("-", "")
+
+        if cache:
+            database = self._database_cache.get(cache_key)
+            if database is not None:
+                return database
+
+        database = NotionDatabase(self, database_id)
+        self._database_cache.set(cache_key, database)
+
+        return database
+
+    def invalidate_database(self, database_id: Optional[str] = None):
+        """Removes a database from the cache.
+
+        Args:
+            database_id: Id of the database to remove. If `None`, removes
+                all databases.
+        """
+        self._database_cache.invalidate(
+            database_id.replace("-", "") if database_id is not None else None
+        )
 
     def get_page(
-        self, page_id: str, page_cast: Type[NotionPage] = NotionPage
+        self,
+        page_id: str,
+        page_cast: Type[NotionPage] = NotionPage,
+        properties: Optional[list[str]] = None,
     ) -> NotionPage:
         """Gets Notion page.
 
@@ -903,11 +1778,13 @@ class NotionAPI:
             page_id: Id of the database to fetch.
             page_cast: A subclass of a NotionPage. Allows custom
                 property retrieval.
+            properties: Ids of the properties to retrieve. If `None`,
+                retrieves all properties.
 
         Returns:
             A Notion page with the given id casted to the provided class.
         """
-        return page_cast(self, page_id)
+        return page_cast(self, page_id, properties=properties)
 
     def get_block(self, block_id) -> NotionBlock:
         """Gets Notion block.
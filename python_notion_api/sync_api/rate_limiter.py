@@ -0,0 +1,57 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to `max_rate` requests and refills at a rate of
+    `max_rate` requests per `time_period` seconds. Can be shared by any
+    number of threads, which block in `acquire` until a token is available.
+
+    Args:
+        max_rate: Maximum number of requests in a burst.
+        time_period: Number of seconds it takes to refill `max_rate`
+            requests.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_check = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_check
+        self._tokens = min(
+            self.max_rate, self._tokens + elapsed * self._rate_per_sec
+        )
+        self._last_check = now
+
+    def acquire(self, amount: float = 1):
+        """Blocks until `amount` requests can be sent.
+
+        Args:
+            amount: Number of tokens to take from the bucket.
+        """
+        if amount > self.max_rate:
+            raise ValueError("Can't acquire more than the maximum capacity")
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                delay = (amount - self._tokens) / self._rate_per_sec
+            time.sleep(delay)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
@@ -0,0 +1,83 @@
+PAGE_ID = "page"
+
+
+def block(block_type: str, text: str = "", children=None) -> dict:
+    value = {
+        "rich_text": [
+            {"type": "text", "plain_text": text, "text": {"content": text}}
+        ]
+    }
+    if children is not None:
+        value["children"] = children
+    return {"object": "block", "type": block_type, block_type: value}
+
+
+def paragraphs(count: int, prefix: str = "") -> list[dict]:
+    return [block("paragraph", f"{prefix}{i}") for i in range(count)]
+
+
+def nested(levels: int) -> dict:
+    children = None
+    for i in reversed(range(levels)):
+        children = [block("paragraph", f"level {i + 1}", children)]
+    return block("paragraph", "level 0", children)
+
+
+def tree(blocks: list[dict]) -> list[tuple]:
+    return [
+        (
+            child["type"],
+            child[child["type"]]["rich_text"][0]["text"]["content"],
+            tree(child[child["type"]].get("children") or []),
+        )
+        for child in blocks
+    ]
+
+
+BLOCKS = [
+    *paragraphs(120),
+    nested(6),
+    block("toggle", "big", children=paragraphs(150, "big ")),
+    block(
+        "column_list",
+        children=[
+            block("column", children=[nested(2)]),
+            block("column", children=paragraphs(120, "column ")),
+        ],
+    ),
+    *[
+        block("toggle", f"toggle {i}", children=paragraphs(99))
+        for i in range(12)
+    ],
+]
+
+
+def test_append_blocks(fake_api, fake_notion):
+    results = fake_api._append_blocks(PAGE_ID, BLOCKS, concurrency=4)
+
+    assert len(results) == len(BLOCKS)
+    assert fake_notion.tree(PAGE_ID) == tree(BLOCKS)
+
+
+def test_append_blocks_levels(fake_api, fake_notion, monkeypatch):
+    # Children of every level are appended by a single, non-nested map
+    running = []
+    calls = []
+    api_map = fake_api.map
+
+    def fake_map(fn, items, concurrency=None):
+        assert not running
+        items = list(items)
+        calls.append((len(items), concurrency))
+        running.append(True)
+        try:
+            return api_map(fn, items, concurrency=concurrency)
+        finally:
+            running.pop()
+
+    monkeypatch.setattr(fake_api, "map", fake_map)
+    fake_api._append_blocks(PAGE_ID, BLOCKS, concurrency=4)
+
+    # The deep paragraph is the only parent below the first level
+    assert calls == [(4, 4), (1, 4), (1, 4), (1, 4)]
+    assert fake_notion.tree(PAGE_ID) == tree(BLOCKS)
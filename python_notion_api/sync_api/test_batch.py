@@ -0,0 +1,94 @@
+from pytest import raises
+
+
+def patches(fake_notion, page_id):
+    return fake_notion.count("patch", f"pages/{page_id}")
+
+
+def stored_values(fake_notion, page_id):
+    properties = fake_notion.pages[page_id]["properties"]
+    return (
+        "".join(
+            item["text"]["content"] for item in properties["Name"]["title"]
+        ),
+        properties["Number"]["number"],
+    )
+
+
+def test_batch_flushes_once(fake_api, fake_notion):
+    page_id = fake_notion.add_page({})["id"]
+    page = fake_api.get_page(page_id)
+
+    with page.batch():
+        page.set("Name", "Page")
+        page.set("Number", 1)
+        page.update({"Number": 2})
+        assert patches(fake_notion, page_id) == 0
+
+    assert patches(fake_notion, page_id) == 1
+    assert stored_values(fake_notion, page_id) == ("Page", 2)
+    assert page.get("Number").value == 2
+
+
+def test_empty_batch_sends_nothing(fake_api, fake_notion):
+    page_id = fake_notion.add_page({})["id"]
+    page = fake_api.get_page(page_id)
+
+    with page.batch():
+        pass
+
+    assert patches(fake_notion, page_id) == 0
+
+
+def test_batch_discarded_on_error(fake_api, fake_notion):
+    page_id = fake_notion.add_page({})["id"]
+    page = fake_api.get_page(page_id)
+
+    with raises(RuntimeError):
+        with page.batch():
+            page.set("Number", 1)
+            raise RuntimeError("Failed")
+
+    assert patches(fake_notion, page_id) == 0
+    assert stored_values(fake_notion, page_id) == ("", None)
+
+    # Values are sent immediately again after the batch
+    page.set("Number", 3)
+    assert patches(fake_notion, page_id) == 1
+    assert stored_values(fake_notion, page_id) == ("", 3)
+
+
+def test_nested_batches(fake_api, fake_notion):
+    page_id = fake_notion.add_page({})["id"]
+    page = fake_api.get_page(page_id)
+
+    with page.batch():
+        page.set("Name", "Page")
+        with page.batch():
+            page.set("Number", 1)
+        assert patches(fake_notion, page_id) == 0
+
+        # An error in a nested block handled by the outer one keeps its
+        # values, as they are part of the outer block
+        with raises(RuntimeError):
+            with page.batch():
+                page.set("Number", 2)
+                raise RuntimeError("Failed")
+
+    assert patches(fake_notion, page_id) == 1
+    assert stored_values(fake_notion, page_id) == ("Page", 2)
+
+
+def test_nested_batch_error_discards_outer(fake_api, fake_notion):
+    page_id = fake_notion.add_page({})["id"]
+    page = fake_api.get_page(page_id)
+
+    with raises(RuntimeError):
+        with page.batch():
+            page.set("Name", "Page")
+            with page.batch():
+                page.set("Number", 1)
+                raise RuntimeError("Failed")
+
+    assert patches(fake_notion, page_id) == 0
+    assert page._pending is None
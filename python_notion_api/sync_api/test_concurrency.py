@@ -0,0 +1,90 @@
+import threading
+import time
+
+from pytest import fixture, raises
+
+from python_notion_api import NotionAPI
+from python_notion_api.sync_api import rate_limiter
+from python_notion_api.sync_api.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_acquire_takes_tokens(clock):
+    limiter = RateLimiter(10, time_period=10)
+    for _ in range(10):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    limiter.acquire()
+    assert clock.sleeps == [1]
+
+
+def test_acquire_more_than_capacity(clock):
+    limiter = RateLimiter(10)
+    with raises(ValueError):
+        limiter.acquire(11)
+
+
+def test_acquire_is_thread_safe(clock):
+    limiter = RateLimiter(200, time_period=60)
+    barrier = threading.Barrier(20)
+
+    def worker():
+        barrier.wait()
+        for _ in range(10):
+            limiter.acquire()
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The clock doesn't move, so every token is taken exactly once
+    assert clock.sleeps == []
+    assert limiter._tokens == 0
+
+
+def test_map_keeps_order():
+    api = NotionAPI(access_token="")
+
+    def slow_double(item):
+        # Later items finish first
+        time.sleep((10 - item) / 1000)
+        return item * 2
+
+    assert api.map(slow_double, range(10), concurrency=5) == [
+        item * 2 for item in range(10)
+    ]
+
+
+def test_map_raises():
+    api = NotionAPI(access_token="")
+
+    def fail_on_three(item):
+        if item == 3:
+            raise ValueError(item)
+        return item
+
+    with raises(ValueError):
+        api.map(fail_on_three, range(10), concurrency=5)
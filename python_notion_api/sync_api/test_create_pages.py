@@ -0,0 +1,80 @@
+import json
+import time
+
+from pydantic.v1 import ValidationError
+from pytest import fixture
+
+from python_notion_api.conftest import FAKE_DATABASE_ID
+from python_notion_api.sync_api.api import NotionPage
+
+
+@fixture
+def database(fake_api):
+    return fake_api.get_database(FAKE_DATABASE_ID)
+
+
+@fixture
+def slow_first_rows(fake_notion, monkeypatch):
+    """Creates the pages of the first rows last, and fails for `Fail`.
+
+    Returns the numbers of the rows sent.
+    """
+    handle = fake_notion.handle
+    sent = []
+
+    def slow_handle(request_type, endpoint, params, data):
+        if request_type == "post" and endpoint == "pages":
+            properties = json.loads(data)["properties"]
+            number = properties.get("Number", {}).get("number") or 0
+            sent.append(number)
+            time.sleep(0.01 * max(5 - number, 0))
+            if "Fail" in data:
+                raise RuntimeError("Request failed")
+        return handle(request_type, endpoint, params, data)
+
+    monkeypatch.setattr(fake_notion, "handle", slow_handle)
+    return sent
+
+
+def test_results_in_order(database, fake_notion, slow_first_rows):
+    rows = [{"Name": f"Page {i}", "Number": i} for i in range(6)]
+
+    pages = database.create_pages(rows, concurrency=6)
+
+    assert all(isinstance(page, NotionPage) for page in pages)
+    assert [page.get("Number").value for page in pages] == list(range(6))
+    assert len(fake_notion.pages) == 6
+    assert fake_notion.max_active > 1
+
+
+def test_errors_returned_per_row(database, fake_notion, slow_first_rows):
+    rows = [
+        {"Name": "Page 0", "Number": 0},
+        {"Nope": 1},
+        {"Name": "Fail", "Number": 2},
+        {"Number": "not a number"},
+        {"Name": "Page 4", "Number": 4},
+    ]
+
+    results = database.create_pages(rows)
+
+    assert results[0].get("Number").value == 0
+    assert isinstance(results[1], ValueError)
+    assert "Unknown property: Nope" in str(results[1])
+    assert isinstance(results[2], RuntimeError)
+    assert isinstance(results[3], ValidationError)
+    assert results[4].get("Number").value == 4
+    # Rows failing validation are not sent
+    assert sorted(slow_first_rows) == [0, 2, 4]
+    assert len(fake_notion.pages) == 2
+
+
+def test_concurrency_bound(database, fake_notion):
+    fake_notion.delay = 0.01
+
+    pages = database.create_pages(
+        [{"Number": i} for i in range(8)], concurrency=3
+    )
+
+    assert len(pages) == 8
+    assert fake_notion.max_active == 3
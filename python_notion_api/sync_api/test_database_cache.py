@@ -0,0 +1,78 @@
+from pytest import fixture
+
+from python_notion_api import utils
+from python_notion_api.conftest import FAKE_DATABASE_ID
+
+ENDPOINT = f"databases/{FAKE_DATABASE_ID}"
+DASHED_ID = "401076f6-c7c0-4ae7-96bf-3e4c847361e1"
+
+
+@fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_cache_hit(fake_api, fake_notion):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+    assert fake_api.get_database(FAKE_DATABASE_ID) is database
+    assert fake_api.get_database(DASHED_ID) is database
+    assert fake_notion.count("get", ENDPOINT) == 1
+
+
+def test_cache_disabled_per_call(fake_api, fake_notion):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+    reloaded = fake_api.get_database(FAKE_DATABASE_ID, cache=False)
+
+    assert reloaded is not database
+    assert fake_notion.count("get", ENDPOINT) == 2
+    # The cache is refreshed with the new database
+    assert fake_api.get_database(FAKE_DATABASE_ID) is reloaded
+
+
+def test_ttl_expiry(fake_api, fake_notion, clock):
+    fake_api._database_cache.ttl = 10
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    clock[0] = 9.9
+    assert fake_api.get_database(FAKE_DATABASE_ID) is database
+    clock[0] = 10
+    assert fake_api.get_database(FAKE_DATABASE_ID) is not database
+    assert fake_notion.count("get", ENDPOINT) == 2
+
+
+def test_ttl_zero(fake_api, fake_notion):
+    fake_api._database_cache.ttl = 0
+    fake_api.get_database(FAKE_DATABASE_ID)
+    fake_api.get_database(FAKE_DATABASE_ID)
+    assert fake_notion.count("get", ENDPOINT) == 2
+
+
+def test_invalidate(fake_api, fake_notion):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    fake_api.invalidate_database(DASHED_ID)
+    reloaded = fake_api.get_database(FAKE_DATABASE_ID)
+    assert reloaded is not database
+
+    fake_api.invalidate_database()
+    assert fake_api.get_database(FAKE_DATABASE_ID) is not reloaded
+    assert fake_notion.count("get", ENDPOINT) == 3
+
+
+def test_page_load_single_request(fake_api, fake_notion):
+    page_ids = [fake_notion.add_page({})["id"] for _ in range(2)]
+
+    pages = [fake_api.get_page(page_id) for page_id in page_ids]
+    fake_api.get_page(page_ids[0])
+
+    # The parent database is only fetched for the first page
+    assert fake_notion.count("get", ENDPOINT) == 1
+    assert pages[0].database is pages[1].database
+    assert [request[:2] for request in fake_notion.requests] == [
+        ("get", f"pages/{page_ids[0]}"),
+        ("get", ENDPOINT),
+        ("get", f"pages/{page_ids[1]}"),
+        ("get", f"pages/{page_ids[0]}"),
+    ]
@@ -0,0 +1,48 @@
+from pytest import mark
+
+RELATION = [{"id": f"{i:032x}"} for i in range(60)]
+
+
+def property_requests(fake_notion, page_id, prop_id):
+    endpoint = f"pages/{page_id}/properties/{prop_id}"
+    return [
+        params
+        for _, sent_endpoint, params in fake_notion.requests
+        if sent_endpoint == endpoint
+    ]
+
+
+@mark.parametrize(
+    "page_limit,cursors",
+    [(25, [None, "25", "50"]), (30, [None, "30"]), (None, [None])],
+)
+def test_first_page_reused(fake_api, fake_notion, page_limit, cursors):
+    page_id = fake_notion.add_page({"Rel": {"relation": RELATION}})["id"]
+    page = fake_api.get_page(page_id)
+
+    value = page.get("Rel", page_limit=page_limit).value
+
+    assert value == [relation["id"] for relation in RELATION]
+    requests = property_requests(fake_notion, page_id, "r1")
+    assert [params.get("start_cursor") for params in requests] == cursors
+    assert all(
+        params["page_size"] == (page_limit or 100) for params in requests
+    )
+
+
+def test_property_item_single_request(fake_api, fake_notion):
+    page_id = fake_notion.add_page({"Number": {"number": 2}})["id"]
+    page = fake_api.get_page(page_id)
+
+    assert page.get("Formula").value == 4
+    assert len(property_requests(fake_notion, page_id, "f1")) == 1
+
+
+def test_cached_value_without_request(fake_api, fake_notion):
+    page_id = fake_notion.add_page({"Rel": {"relation": RELATION[:3]}})["id"]
+    page = fake_api.get_page(page_id)
+
+    assert page.get("Rel").value == [
+        relation["id"] for relation in RELATION[:3]
+    ]
+    assert property_requests(fake_notion, page_id, "r1") == []
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+from python_notion_api.conftest import FAKE_DATABASE_ID, FAKE_SCHEMA
+from python_notion_api.sync_api.api import NotionAPI
+
+QUERY_ENDPOINT = f"databases/{FAKE_DATABASE_ID}/query"
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        return SimpleNamespace(status=200, data=b"{}")
+
+
+def test_query_sends_property_ids(fake_api, fake_notion):
+    fake_notion.add_page({"Number": {"number": 1}})
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    pages = list(database.query(properties=["Name", "n1"]))
+
+    ((_, _, params),) = [
+        request
+        for request in fake_notion.requests
+        if request[1] == QUERY_ENDPOINT
+    ]
+    assert params == {"filter_properties": ["title", "n1"]}
+    assert list(pages[0].object.properties) == ["Name", "Number"]
+
+
+def test_query_sends_decoded_property_ids(fake_api, fake_notion, monkeypatch):
+    monkeypatch.setitem(FAKE_SCHEMA["Number"], "id", "n%3B1")
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    list(database.query(properties=["Number"]))
+
+    assert fake_notion.requests[-1][2] == {"filter_properties": ["n;1"]}
+
+
+def test_get_page_sends_property_ids(fake_api, fake_notion):
+    page_id = fake_notion.add_page({})["id"]
+
+    page = fake_api.get_page(page_id, properties=["n1"])
+
+    assert fake_notion.requests[0] == (
+        "get",
+        f"pages/{page_id}",
+        {"filter_properties": ["n1"]},
+    )
+    assert list(page.object.properties) == ["Number"]
+
+
+def test_reload_sends_ids_of_names(fake_api, fake_notion):
+    page_id = fake_notion.add_page({})["id"]
+    page = fake_api.get_page(page_id)
+
+    page.reload(properties=["Number", "Formula"])
+
+    assert fake_notion.requests[-1] == (
+        "get",
+        f"pages/{page_id}",
+        {"filter_properties": ["n1", "f1"]},
+    )
+    assert list(page.object.properties) == ["Number", "Formula"]
+
+
+def test_request_sends_repeated_params():
+    api = NotionAPI(access_token="")
+    api._http = FakeHTTP()
+
+    api._request(
+        "get",
+        "pages/page",
+        params={"filter_properties": ["title", "n;1"]},
+        cast_cls=None,
+    )
+
+    assert api._http.urls == [
+        f"{api._base_url}pages/page"
+        "?filter_properties=title&filter_properties=n%3B1"
+    ]
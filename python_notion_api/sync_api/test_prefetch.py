@@ -0,0 +1,97 @@
+import contextvars
+import threading
+import time
+
+from pytest import raises
+
+from python_notion_api.conftest import FAKE_DATABASE_ID
+from python_notion_api.sync_api.utils import prefetch_pages
+
+
+def counting_pages(produced, limit=None):
+    page = 0
+    while limit is None or page < limit:
+        produced.append(page)
+        yield page
+        page += 1
+
+
+def wait_for_threads(threads, timeout=2):
+    for thread in threads:
+        thread.join(timeout)
+    return [thread for thread in threads if thread.is_alive()]
+
+
+def test_prefetch_keeps_order():
+    produced = []
+    assert list(prefetch_pages(counting_pages(produced, 20), depth=3)) == (
+        list(range(20))
+    )
+
+
+def test_prefetch_runs_ahead_up_to_depth():
+    produced = []
+    pages = prefetch_pages(counting_pages(produced), depth=2)
+    assert next(pages) == 0
+
+    time.sleep(0.2)
+    # One page taken by the consumer, two in the buffer and one waiting
+    assert len(produced) == 4
+    pages.close()
+
+
+def test_prefetch_early_break_stops_thread():
+    before = set(threading.enumerate())
+    produced = []
+    pages = prefetch_pages(counting_pages(produced), depth=1)
+
+    for page in pages:
+        if page == 2:
+            break
+    pages.close()
+
+    threads = [
+        thread for thread in threading.enumerate() if thread not in before
+    ]
+    assert threads
+    assert wait_for_threads(threads) == []
+
+    count = len(produced)
+    time.sleep(0.2)
+    assert len(produced) == count
+
+
+def test_prefetch_reraises_producer_error():
+    def failing_pages():
+        yield 0
+        yield 1
+        raise RuntimeError("Request failed")
+
+    consumed = []
+    with raises(RuntimeError, match="Request failed"):
+        for page in prefetch_pages(failing_pages(), depth=2):
+            consumed.append(page)
+    assert consumed == [0, 1]
+
+
+def test_prefetch_propagates_context():
+    var = contextvars.ContextVar("var", default=None)
+    var.set("value")
+
+    def pages():
+        yield var.get()
+
+    assert list(prefetch_pages(pages())) == ["value"]
+
+
+def test_query_prefetch_order(fake_api, fake_notion):
+    page_ids = [
+        fake_notion.add_page({})["id"].replace("-", "") for _ in range(7)
+    ]
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    pages = database.query(page_limit=2, prefetch=2)
+    assert [page.page_id for page in pages] == page_ids
+    assert (
+        fake_notion.count("post", f"databases/{FAKE_DATABASE_ID}/query") == 4
+    )
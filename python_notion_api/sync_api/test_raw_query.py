@@ -0,0 +1,64 @@
+from python_notion_api.conftest import FAKE_DATABASE_ID
+from python_notion_api.models import NotionObject
+from python_notion_api.models.extractors import extract_values
+from python_notion_api.models.filters import equals_filter
+
+
+def fail_from_obj(cls, obj):
+    raise AssertionError("Results were validated")
+
+
+def test_raw_yields_page_dicts(fake_api, fake_notion, monkeypatch):
+    pages = [
+        fake_notion.add_page(
+            {
+                "Name": {"title": [{"text": {"content": f"Page {i}"}}]},
+                "Number": {"number": i},
+            }
+        )
+        for i in range(5)
+    ]
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+    monkeypatch.setattr(NotionObject, "from_obj", classmethod(fail_from_obj))
+
+    results = list(database.query(raw=True, page_limit=2))
+
+    assert results == [fake_notion._view_page(page) for page in pages]
+    assert (
+        fake_notion.count("post", f"databases/{FAKE_DATABASE_ID}/query") == 3
+    )
+
+
+def test_raw_extract_values(fake_api, fake_notion):
+    fake_notion.add_page(
+        {
+            "Name": {"title": [{"plain_text": "Page"}]},
+            "Number": {"number": 2},
+        }
+    )
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    (result,) = database.query(raw=True)
+
+    assert extract_values(result) == {
+        "Name": "Page",
+        "Number": 2,
+        "Formula": 4,
+        "Rel": [],
+    }
+
+
+def test_raw_with_properties_and_filters(fake_api, fake_notion):
+    for i in range(3):
+        fake_notion.add_page({"Number": {"number": i}})
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    results = list(
+        database.query(
+            filters=equals_filter("Number", "number", 1),
+            properties=["Number"],
+            raw=True,
+        )
+    )
+
+    assert [extract_values(result) for result in results] == [{"Number": 1}]
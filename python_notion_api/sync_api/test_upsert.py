@@ -0,0 +1,91 @@
+from pytest import mark, raises
+
+from python_notion_api.conftest import FAKE_DATABASE_ID
+
+
+def test_upsert_many_repeated_new_key(fake_api, fake_notion):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+    database.create_page({"Name": "x", "Number": 1})
+
+    results = database.upsert_many(
+        [
+            {"Name": "y", "Number": 8},
+            {"Name": "x", "Number": 2},
+            {"Name": "y", "Number": 7},
+        ],
+        key_property="Name",
+    )
+
+    assert results[0].page_id == results[2].page_id
+    assert results[0].page_id != results[1].page_id
+    values = sorted(
+        (
+            page["properties"]["Name"]["title"][0]["plain_text"],
+            page["properties"]["Number"]["number"],
+        )
+        for page in fake_notion.pages.values()
+    )
+    assert values == [("x", 2), ("y", 7)]
+
+
+def test_upsert_many_several_pages(fake_api, fake_notion):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+    database.create_page({"Name": "x"})
+    database.create_page({"Name": "x"})
+
+    results = database.upsert_many(
+        [{"Name": "x", "Number": 1}, {"Name": "x", "Number": 2}],
+        key_property="Name",
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(fake_notion.pages) == 2
+
+
+def test_upsert_repeated_new_key(fake_api, fake_notion):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+    database.create_page({"Name": "x", "Number": 1})
+    fake_notion.delay = 0.01
+
+    results = database.upsert(
+        [
+            {"Name": "y", "Number": 8},
+            {"Name": "x", "Number": 2},
+            {"Name": "y", "Number": 7},
+        ],
+        key="Name",
+    )
+
+    assert results[0].page_id == results[2].page_id
+    assert results[0].page_id != results[1].page_id
+    values = sorted(
+        (
+            page["properties"]["Name"]["title"][0]["plain_text"],
+            page["properties"]["Number"]["number"],
+        )
+        for page in fake_notion.pages.values()
+    )
+    assert values == [("x", 2), ("y", 7)]
+    # The page of a key is only queried once
+    query = f"databases/{FAKE_DATABASE_ID}/query"
+    assert fake_notion.count("post", query) == 2
+
+
+def test_upsert_missing_key(fake_api, fake_notion):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    results = database.upsert([{"Number": 1}, {"Name": "x"}], key="Name")
+
+    assert isinstance(results[0], KeyError)
+    assert results[1].page_id in {
+        page_id.replace("-", "") for page_id in fake_notion.pages
+    }
+
+
+@mark.parametrize("method", ["upsert", "upsert_many"])
+def test_unsupported_key_type(fake_api, fake_notion, method):
+    database = fake_api.get_database(FAKE_DATABASE_ID)
+
+    with raises(ValueError, match="only checkbox, email, number"):
+        getattr(database, method)([{"Rel": []}], "Rel")
+    assert fake_notion.requests[-1][1] == f"databases/{FAKE_DATABASE_ID}"
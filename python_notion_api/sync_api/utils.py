@@ -0,0 +1,56 @@
+import contextvars
+import queue
+import threading
+from typing import Generator, TypeVar
+
+T = TypeVar("T")
+
+
+def prefetch_pages(
+    pages: Generator[T, None, None], depth: int = 1
+) -> Generator[T, None, None]:
+    """Consumes a generator of pages in a background thread.
+
+    The thread runs up to `depth` pages ahead of the consumer, so the next
+    request is in flight while the current page is being processed.
+
+    Args:
+        pages: Generator of pages.
+        depth: Maximum number of fetched pages waiting to be consumed.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        # Gives up if the consumer has stopped iterating.
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+            put((done, None))
+        except Exception as e:
+            put((done, e))
+
+    context = contextvars.copy_context()
+    threading.Thread(target=context.run, args=(produce,), daemon=True).start()
+
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is done:
+                return
+            yield page
+    finally:
+        stopped.set()
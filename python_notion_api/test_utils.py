@@ -0,0 +1,319 @@
+import json
+
+from pytest import raises
+
+from python_notion_api.models.objects import Page
+from python_notion_api.utils import (
+    PageSizeController,
+    StringInterner,
+    _derived_classes,
+    _split_block,
+    get_derived_class,
+    index_property_names,
+    split_blocks,
+)
+
+
+class TestGetDerivedClass:
+    def test_finds_indirect_subclasses(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        class GrandChild(Child):
+            pass
+
+        assert get_derived_class(Base, "Child") is Child
+        assert get_derived_class(Base, "GrandChild") is GrandChild
+
+    def test_memoizes_hits(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        assert get_derived_class(Base, "Child") is Child
+        assert _derived_classes[(Base, "Child")] is Child
+
+    def test_memoizes_misses(self, monkeypatch):
+        class Base:
+            pass
+
+        assert get_derived_class(Base, "Child") is None
+        assert _derived_classes[(Base, "Child")] is None
+
+        def fail():
+            raise AssertionError("Subclasses searched again")
+
+        monkeypatch.setattr(Base, "__subclasses__", fail)
+        assert get_derived_class(Base, "Child") is None
+
+
+class TestIndexPropertyNames:
+    def test_names_and_ids(self):
+        properties = {
+            "Name": {"id": "title", "type": "title"},
+            "Number": {"id": "n1", "type": "number"},
+        }
+        assert index_property_names(properties) == {
+            "Name": "Name",
+            "title": "Name",
+            "Number": "Number",
+            "n1": "Number",
+        }
+
+    def test_first_property_wins(self):
+        properties = {
+            "a": {"id": "b", "type": "number"},
+            "b": {"id": "c", "type": "number"},
+        }
+        prop_names = index_property_names(properties)
+        assert prop_names["b"] == "a"
+        assert prop_names["c"] == "b"
+
+
+class TestPageSizeController:
+    def test_halves_on_failure(self):
+        page_sizes = PageSizeController(100)
+        page_sizes.failure()
+        assert page_sizes.size == 50
+        page_sizes.failure()
+        assert page_sizes.size == 25
+
+    def test_grows_after_successes(self):
+        page_sizes = PageSizeController(100, grow_after=3)
+        page_sizes.failure()
+        page_sizes.failure()
+
+        page_sizes.success()
+        page_sizes.success()
+        assert page_sizes.size == 25
+        page_sizes.success()
+        assert page_sizes.size == 50
+        assert page_sizes.sizes == [25, 25, 25]
+
+    def test_failure_resets_successes(self):
+        page_sizes = PageSizeController(100, grow_after=3)
+        page_sizes.failure()
+        page_sizes.success()
+        page_sizes.success()
+        page_sizes.failure()
+        page_sizes.success()
+        page_sizes.success()
+        assert page_sizes.size == 25
+
+    def test_capped_at_max_size(self):
+        page_sizes = PageSizeController(100, grow_after=1)
+        page_sizes.failure()
+        page_sizes.failure()
+        page_sizes.failure()
+        assert page_sizes.size == 12
+
+        for _ in range(5):
+            page_sizes.success()
+        assert page_sizes.size == 100
+        assert page_sizes.sizes == [12, 24, 48, 96, 100]
+
+    def test_failure_at_size_one(self):
+        page_sizes = PageSizeController(1)
+        with raises(ValueError):
+            page_sizes.failure()
+
+
+def raw_page(page_id: str) -> dict:
+    # Separate decoding, so that equal strings are different objects
+    return json.loads(
+        json.dumps(
+            {
+                "object": "page",
+                "id": page_id,
+                "created_time": "2024-01-01T00:00:00.000Z",
+                "last_edited_time": "2024-01-01T00:00:00.000Z",
+                "created_by": {"object": "user", "id": "u1"},
+                "last_edited_by": {"object": "user", "id": "u1"},
+                "archived": False,
+                "url": "https://notion.so/x",
+                "parent": {"type": "database_id", "database_id": "db"},
+                "properties": {
+                    "Select": {
+                        "id": "s1",
+                        "type": "select",
+                        "select": {"id": "o1", "name": "Foo", "color": "red"},
+                    },
+                    "Text": {
+                        "id": "t1",
+                        "type": "rich_text",
+                        "rich_text": [
+                            {
+                                "type": "text",
+                                "plain_text": "text",
+                                "text": {"content": "text"},
+                            }
+                        ],
+                    },
+                },
+            }
+        )
+    )
+
+
+class TestStringInterner:
+    def test_intern(self):
+        interner = StringInterner()
+        first = "".join(["fo", "o"])
+        second = "".join(["f", "oo"])
+        assert first is not second
+
+        assert interner.intern(first) is first
+        assert interner.intern(second) is first
+        assert len(interner) == 1
+
+    def test_intern_page(self):
+        interner = StringInterner()
+        pages = [interner.intern_page(raw_page(f"page{i}")) for i in range(2)]
+        first, second = (page["properties"] for page in pages)
+
+        assert [*first][0] is [*second][0]
+        assert (
+            first["Select"]["select"]["name"]
+            is second["Select"]["select"]["name"]
+        )
+        assert first["Select"]["id"] is second["Select"]["id"]
+        assert (
+            pages[0]["parent"]["database_id"]
+            is pages[1]["parent"]["database_id"]
+        )
+        # Values other than names, ids and types are left as is
+        assert first["Text"]["rich_text"][0]["plain_text"] == "text"
+        assert (
+            first["Text"]["rich_text"][0]["plain_text"]
+            is not second["Text"]["rich_text"][0]["plain_text"]
+        )
+
+    def test_page_id_not_interned(self):
+        interner = StringInterner()
+        page = interner.intern_page(raw_page("page0"))
+        assert page["id"] == "page0"
+        assert "page0" not in interner._strings
+
+    def test_survives_validation(self):
+        interner = StringInterner()
+        pages = [
+            Page.from_obj(interner.intern_page(raw_page(f"page{i}")))
+            for i in range(2)
+        ]
+        first, second = (page.properties for page in pages)
+
+        assert [*first][0] is [*second][0]
+        assert (
+            first["Select"]["select"]["name"]
+            is second["Select"]["select"]["name"]
+        )
+
+
+def block(block_type: str, text: str = "", children=None) -> dict:
+    value = {"rich_text": [{"type": "text", "text": {"content": text}}]}
+    if children is not None:
+        value["children"] = children
+    return {"object": "block", "type": block_type, block_type: value}
+
+
+def paragraphs(count: int) -> list[dict]:
+    return [block("paragraph", str(i)) for i in range(count)]
+
+
+def nested(levels: int) -> dict:
+    """Gets a paragraph with `levels` levels of paragraphs below it."""
+    children = None
+    for i in reversed(range(levels)):
+        children = [block("paragraph", f"level {i + 1}", children)]
+    return block("paragraph", "level 0", children)
+
+
+def get_children(block: dict) -> list[dict]:
+    return block[block["type"]].get("children")
+
+
+class TestSplitBlocks:
+    def test_chunks(self):
+        requests = split_blocks(paragraphs(250))
+        assert [len(chunk) for chunk, _ in requests] == [100, 100, 50]
+        assert all(not deferred for _, deferred in requests)
+        assert [chunk[0]["paragraph"] for chunk, _ in requests] == [
+            paragraph["paragraph"] for paragraph in paragraphs(250)[::100]
+        ]
+
+    def test_nesting_within_limit(self):
+        [(chunk, deferred)] = split_blocks([nested(2)])
+        assert chunk == [nested(2)]
+        assert deferred == []
+
+    def test_nesting_over_limit(self):
+        deep = nested(3)
+        [(chunk, deferred)] = split_blocks([block("paragraph"), deep])
+
+        assert get_children(chunk[1]) is None
+        assert (
+            chunk[1]["paragraph"]["rich_text"]
+            == (deep["paragraph"]["rich_text"])
+        )
+        assert deferred == [((1,), get_children(deep))]
+
+    def test_required_children_kept(self):
+        table = block("table", children=[block("table_row") for _ in range(3)])
+        column_list = block(
+            "column_list",
+            children=[
+                block("column", children=[nested(1)]),
+                block("column", children=paragraphs(2)),
+            ],
+        )
+        [(chunk, deferred)] = split_blocks([table, column_list])
+
+        assert chunk[0] == table
+        assert [child["type"] for child in get_children(chunk[1])] == [
+            "column",
+            "column",
+        ]
+        # Only the paragraph below the columns has too many levels
+        first_column = get_children(get_children(chunk[1])[0])
+        assert get_children(first_column[0]) is None
+        assert deferred == [((1, 0, 0), get_children(nested(1)))]
+
+    def test_too_many_children(self):
+        toggle = block("toggle", children=paragraphs(150))
+        column_list = block(
+            "column_list",
+            children=[block("column", children=paragraphs(150))],
+        )
+        [(chunk, deferred)] = split_blocks(
+            [block("paragraph"), toggle, column_list]
+        )
+
+        assert get_children(chunk[1]) is None
+        assert len(get_children(get_children(chunk[2])[0])) == 100
+        assert deferred == [
+            ((1,), paragraphs(150)),
+            ((2, 0), paragraphs(150)[100:]),
+        ]
+
+    def test_too_many_blocks(self):
+        big = [
+            block("toggle", str(i), children=paragraphs(99)) for i in range(12)
+        ]
+        requests = split_blocks(big)
+
+        assert [len(chunk) for chunk, _ in requests] == [10, 2]
+        assert all(not deferred for _, deferred in requests)
+
+    def test_split_block_path(self):
+        sent, deferred = _split_block(nested(3), 2, (4, 2))
+        assert get_children(sent) is None
+        assert deferred == [((4, 2), get_children(nested(3)))]
+
+        sent, deferred = _split_block(nested(1), 0, (1,))
+        assert get_children(sent) is None
+        assert deferred == [((1,), get_children(nested(1)))]
@@ -1,16 +1,341 @@
+import time
+from collections import deque
+from typing import Any, Hashable, Optional
+
 from slugify import slugify as sslugify
 
+# Results of `get_derived_class`, keyed by the base class and the name of
+# the derived class. `None` for names without a derived class.
+_derived_classes: dict[tuple[type, str], Optional[type]] = {}
+
 
 def get_derived_class(base_class, derived_cass_name):
-    return next(
-        (
-            cls
-            for cls in base_class.__subclasses__()
-            if cls.__name__ == derived_cass_name
-        ),
-        None,
-    )
+    """Finds a class derived from `base_class` by its name.
+
+    All descendants are searched, direct subclasses first. Results are
+    memoized, misses included, so classes defined after the first lookup of
+    their name are not found.
+
+    Args:
+        base_class: Class to search the descendants of.
+        derived_cass_name: Name of the derived class.
+
+    Returns:
+        The derived class or `None` if there is none with the given name.
+    """
+    key = (base_class, derived_cass_name)
+    if key in _derived_classes:
+        return _derived_classes[key]
+
+    derived_cls = None
+    subclasses = deque(base_class.__subclasses__())
+    while subclasses:
+        cls = subclasses.popleft()
+        if cls.__name__ == derived_cass_name:
+            derived_cls = cls
+            break
+        subclasses.extend(cls.__subclasses__())
+
+    _derived_classes[key] = derived_cls
+    return derived_cls
+
+
+def index_property_names(properties: dict[str, dict]) -> dict[str, str]:
+    """Maps names and ids of page properties to property names.
+
+    When a key is both a name and an id, the first property in the page
+    wins, as it would in a scan of the properties.
+
+    Args:
+        properties: Properties of a page object.
+
+    Returns:
+        Dictionary of property names and ids to property names.
+    """
+    prop_names: dict[str, str] = {}
+    for prop_name, prop in properties.items():
+        prop_names.setdefault(prop_name, prop_name)
+        prop_names.setdefault(prop["id"], prop_name)
+    return prop_names
 
 
 def slugify(string: str):
     return sslugify(string, replacements=[["*", "star"]], separator="_")
+
+
+class TTLCache:
+    """Cache whose entries expire a fixed time after they are set.
+
+    Args:
+        ttl: Number of seconds entries are kept for. `None` keeps them
+            until invalidated, `0` disables the cache.
+    """
+
+    def __init__(self, ttl: Optional[float]):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Gets a value, or `None` if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Sets a value."""
+        if self.ttl == 0:
+            return
+
+        expires_at = (
+            float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        )
+        self._entries[key] = (expires_at, value)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Removes a value, or all values if `key` is `None`."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+class PageSizeController:
+    """Chooses the page size of paginated requests.
+
+    Starts at the maximum page size, halves it whenever a request fails and
+    doubles it again, up to the maximum, after `grow_after` consecutive
+    successful requests. Page sizes of all successful requests are recorded
+    in `sizes`.
+
+    Args:
+        max_size: Maximum number of results per page.
+        grow_after: Number of consecutive successful requests before the
+            page size is increased.
+    """
+
+    def __init__(self, max_size: int, grow_after: int = 3):
+        self.max_size = max_size
+        self.size = max_size
+        self.grow_after = grow_after
+        self.sizes: list[int] = []
+        self._successes = 0
+
+    def success(self):
+        """Records a successful request."""
+        self.sizes.append(self.size)
+        self._successes += 1
+
+        if self._successes >= self.grow_after and self.size < self.max_size:
+            self.size = min(self.max_size, self.size * 2)
+            self._successes = 0
+
+    def failure(self):
+        """Records a failed request.
+
+        Raises:
+            ValueError: If the page size can't be reduced any further.
+        """
+        self._successes = 0
+        if self.size <= 1:
+            raise ValueError("Page size can't be reduced any further")
+        self.size = self.size // 2
+
+
+# Keys whose string values repeat across pages, e.g. property and option
+# names, colors, ids of users and related pages, and object types.
+_interned_keys = frozenset(
+    {"id", "name", "color", "type", "object", "database_id", "page_id"}
+)
+
+
+class StringInterner:
+    """Shares equal strings between decoded objects.
+
+    Keeps one instance of each string it has seen, so that repeated names,
+    ids and option values of many pages point to the same object. This
+    reduces the memory of large result sets kept in memory and makes
+    comparing their values faster. Strings are only shared between objects
+    interned by the same interner.
+    """
+
+    def __init__(self):
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, string: str) -> str:
+        """Gets the shared instance of a string."""
+        return self._strings.setdefault(string, string)
+
+    def intern_page(self, page: dict) -> dict:
+        """Interns a raw page object in place.
+
+        Interns all keys, and the values of `_interned_keys` in the
+        properties, parent and users of the page. The page id is not
+        interned, as it is unique in a result set.
+
+        Args:
+            page: Page object as returned by Notion.
+
+        Returns:
+            The same page object.
+        """
+        for key in list(page):
+            value = page.pop(key)
+            if key == "object":
+                value = self.intern(value)
+            elif key != "id":
+                value = self._intern_value(value)
+            page[self.intern(key)] = value
+        return page
+
+    def _intern_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            interned = {}
+            for key, item in value.items():
+                if key in _interned_keys and isinstance(item, str):
+                    item = self.intern(item)
+                else:
+                    item = self._intern_value(item)
+                interned[self.intern(key)] = item
+            return interned
+        if isinstance(value, list):
+            return [self._intern_value(item) for item in value]
+        return value
+
+
+# Limits of Notion for appending block children in a single request
+MAX_BLOCK_CHILDREN = 100
+MAX_REQUEST_BLOCKS = 1000
+MAX_BLOCK_NESTING = 2
+
+# Block types that can't be created without their children
+_required_children = frozenset({"column_list", "column", "table"})
+
+BlockPath = tuple[int, ...]
+
+
+def _get_children(block: dict) -> Optional[list[dict]]:
+    value = block.get(block.get("type"))
+    return value.get("children") if isinstance(value, dict) else None
+
+
+def _with_children(block: dict, children: Optional[list[dict]]) -> dict:
+    block_type = block["type"]
+    value = {
+        key: item
+        for key, item in block[block_type].items()
+        if key != "children"
+    }
+    if children is not None:
+        value["children"] = children
+    return {**block, block_type: value}
+
+
+def _count_blocks(blocks: list[dict]) -> int:
+    return sum(
+        1 + _count_blocks(_get_children(block) or []) for block in blocks
+    )
+
+
+def _fits_inline(blocks: list[dict], depth: int) -> bool:
+    """Checks if blocks can be sent as children with `depth` more levels
+    of nesting allowed below them.
+    """
+    if len(blocks) > MAX_BLOCK_CHILDREN:
+        return False
+    for block in blocks:
+        children = _get_children(block)
+        if children and (depth == 0 or not _fits_inline(children, depth - 1)):
+            return False
+    return True
+
+
+def _split_block(
+    block: dict, depth: int, path: BlockPath
+) -> tuple[dict, list[tuple[BlockPath, list[dict]]]]:
+    """Removes the children that can't be sent with a block.
+
+    Children that don't fit inline with `depth` levels of nesting below the
+    block are all removed, so that they can be appended to the block once
+    it is created. Blocks that can't be created without children keep as
+    many as possible.
+
+    Returns:
+        The block to send, and the removed children with the path of
+        their parent.
+    """
+    children = _get_children(block)
+    if not children:
+        return block, []
+
+    if block["type"] in _required_children:
+        kept = []
+        deferred = []
+        for i, child in enumerate(children[:MAX_BLOCK_CHILDREN]):
+            child, child_deferred = _split_block(child, depth - 1, path + (i,))
+            kept.append(child)
+            deferred.extend(child_deferred)
+        if len(children) > MAX_BLOCK_CHILDREN:
+            deferred.append((path, children[MAX_BLOCK_CHILDREN:]))
+        return _with_children(block, kept), deferred
+
+    if (
+        depth > 0
+        and _fits_inline(children, depth - 1)
+        and _count_blocks(children) < MAX_REQUEST_BLOCKS
+    ):
+        return block, []
+    return _with_children(block, None), [(path, children)]
+
+
+def split_blocks(
+    blocks: list[dict],
+) -> list[tuple[list[dict], list[tuple[BlockPath, list[dict]]]]]:
+    """Splits blocks to append into requests accepted by Notion.
+
+    Notion accepts at most `MAX_BLOCK_CHILDREN` children per block and
+    `MAX_REQUEST_BLOCKS` blocks in a request, nested at most
+    `MAX_BLOCK_NESTING` levels deep. Blocks are grouped into as few
+    requests as possible, and children that can't be sent with their
+    parent are removed, to be appended to their parent once it's created.
+
+    Args:
+        blocks: Blocks to append, as dictionaries accepted by Notion.
+
+    Returns:
+        For every request, the blocks to send and the removed children,
+        with the path of their parent in the sent blocks. The first index
+        of a path is the position of a sent block, the following ones the
+        positions in the children of the previous block.
+    """
+    requests = []
+    chunk: list[dict] = []
+    chunk_deferred: list[tuple[BlockPath, list[dict]]] = []
+    chunk_size = 0
+    for block in blocks:
+        if len(chunk) == MAX_BLOCK_CHILDREN:
+            requests.append((chunk, chunk_deferred))
+            chunk, chunk_deferred, chunk_size = [], [], 0
+
+        sent, deferred = _split_block(block, MAX_BLOCK_NESTING, (len(chunk),))
+        size = _count_blocks([sent])
+        if chunk and chunk_size + size > MAX_REQUEST_BLOCKS:
+            requests.append((chunk, chunk_deferred))
+            chunk, chunk_deferred, chunk_size = [], [], 0
+            sent, deferred = _split_block(block, MAX_BLOCK_NESTING, (0,))
+        chunk.append(sent)
+        chunk_deferred.extend(deferred)
+        chunk_size += size
+
+    if chunk:
+        requests.append((chunk, chunk_deferred))
+    return requests